@@ -1,13 +1,24 @@
+from .cache import AnalysisCache, CacheStats, get_analysis_cache
+from .enrollment import EnrollmentResult, enroll_files, merge_profiles
 from .formant import FormantAnalyzer
 from .matcher import VoiceMatcher
 from .pitch import PitchAnalyzer
 from .profile import VoiceAnalysisEngine
 from .spectral import SpectralAnalyzer
+from .streaming import QuantileSketch, StreamingProfileBuilder
 
 __all__ = [
+    "AnalysisCache",
+    "CacheStats",
+    "EnrollmentResult",
     "FormantAnalyzer",
     "PitchAnalyzer",
+    "QuantileSketch",
     "SpectralAnalyzer",
-    "VoiceMatcher",
+    "StreamingProfileBuilder",
     "VoiceAnalysisEngine",
+    "VoiceMatcher",
+    "enroll_files",
+    "get_analysis_cache",
+    "merge_profiles",
 ]
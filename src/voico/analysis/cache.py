@@ -0,0 +1,221 @@
+import dataclasses
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from ..utils.telemetry import MetricFamily, Sample, get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+_OBJECT_OVERHEAD_BYTES = 64
+
+CacheKey = Tuple[str, str, Tuple[Hashable, ...]]
+T = TypeVar("T")
+
+
+def audio_digest(audio: np.ndarray) -> str:
+    buffer = np.ascontiguousarray(audio)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{buffer.dtype.str}{buffer.shape}".encode())
+    hasher.update(memoryview(buffer).cast("B"))
+    return hasher.hexdigest()
+
+
+def _value_nbytes(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _OBJECT_OVERHEAD_BYTES + sum(
+            _value_nbytes(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+        )
+    if isinstance(value, (tuple, list)):
+        return _OBJECT_OVERHEAD_BYTES + sum(_value_nbytes(v) for v in value)
+    return _OBJECT_OVERHEAD_BYTES
+
+
+def _share(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+        return value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.replace(
+            value,
+            **{
+                f.name: _share(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+                if f.init
+            },
+        )
+    if isinstance(value, tuple):
+        return tuple(_share(v) for v in value)
+    return value
+
+
+@dataclass
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+    by_kind: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class AnalysisCache:
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, Tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        kind = key[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses[kind] = self._misses.get(kind, 0) + 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits[kind] = self._hits.get(kind, 0) + 1
+        return _share(entry[0])
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        nbytes = _value_nbytes(value)
+        if nbytes > self._max_bytes:
+            logger.debug(
+                f"Not caching {key[0]} entry of {nbytes} bytes "
+                f"(budget {self._max_bytes})"
+            )
+            return
+        stored = _share(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[1]
+            self._entries[key] = (stored, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+
+    def get_or_compute(self, key: CacheKey, compute: Callable[[], T]) -> T:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        value = compute()
+        self.put(key, value)
+        return _share(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            kinds = set(self._hits) | set(self._misses)
+            return CacheStats(
+                hits=sum(self._hits.values()),
+                misses=sum(self._misses.values()),
+                evictions=self._evictions,
+                entries=len(self._entries),
+                nbytes=self._nbytes,
+                max_bytes=self._max_bytes,
+                by_kind={
+                    kind: {
+                        "hits": self._hits.get(kind, 0),
+                        "misses": self._misses.get(kind, 0),
+                    }
+                    for kind in sorted(kinds)
+                },
+            )
+
+    def _evict(self) -> None:
+        while self._entries and self._nbytes > self._max_bytes:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= nbytes
+            self._evictions += 1
+
+
+_default_cache = AnalysisCache()
+
+
+def get_analysis_cache() -> AnalysisCache:
+    return _default_cache
+
+
+def _collect_cache_metrics() -> List[MetricFamily]:
+    stats = _default_cache.stats()
+    lookups = []
+    for kind, counts in stats.by_kind.items():
+        lookups.append(
+            Sample("_total", {"kind": kind, "result": "hit"}, counts["hits"])
+        )
+        lookups.append(
+            Sample("_total", {"kind": kind, "result": "miss"}, counts["misses"])
+        )
+    return [
+        MetricFamily(
+            "voico_analysis_cache_lookups",
+            "counter",
+            "Analysis cache lookups by feature kind and result.",
+            lookups,
+        ),
+        MetricFamily(
+            "voico_analysis_cache_hit_ratio",
+            "gauge",
+            "Fraction of analysis cache lookups served from cache.",
+            [Sample("", {}, stats.hit_rate)],
+        ),
+        MetricFamily(
+            "voico_analysis_cache_evictions",
+            "counter",
+            "Analysis cache entries evicted to stay within budget.",
+            [Sample("_total", {}, stats.evictions)],
+        ),
+        MetricFamily(
+            "voico_analysis_cache_entries",
+            "gauge",
+            "Entries held by the analysis cache.",
+            [Sample("", {}, stats.entries)],
+        ),
+        MetricFamily(
+            "voico_analysis_cache_bytes",
+            "gauge",
+            "Bytes held by the analysis cache.",
+            [Sample("", {}, stats.nbytes)],
+        ),
+    ]
+
+
+get_metrics_registry().register_collector(_collect_cache_metrics)
@@ -0,0 +1,300 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.config import FormantGating, ResampleQuality, ScreeningThresholds
+from ..core.constants import AudioConstants
+from ..core.errors import ProfileQualityError
+from ..core.types import (
+    FormantTrack,
+    PitchContour,
+    SpectralFeatures,
+    VoiceProfile,
+)
+from ..quality.quality_score import QualityScorer
+from ..quality.screening import screen_audio
+from ..store.profile_store import ProfileStore
+from ..utils.audio_io import load_audio, normalize_audio
+from ..utils.tracing import get_tracer, run_traced, traced
+from .profile import VoiceAnalysisEngine
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_SCREENING = ScreeningThresholds()
+
+
+@dataclass
+class EnrollmentFileReport:
+    path: str
+    duration_seconds: float = 0.0
+    voiced_seconds: float = 0.0
+    quality_score: float = 0.0
+    is_viable: bool = False
+    issues: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class EnrollmentResult:
+    name: str
+    profile: VoiceProfile
+    files: List[EnrollmentFileReport]
+
+    @property
+    def accepted(self) -> List[EnrollmentFileReport]:
+        return [report for report in self.files if report.is_viable]
+
+    @property
+    def voiced_seconds(self) -> float:
+        return sum(report.voiced_seconds for report in self.accepted)
+
+
+FileCallback = Callable[[EnrollmentFileReport], None]
+
+_AnalysisResult = Tuple[Optional[VoiceProfile], EnrollmentFileReport]
+
+
+@traced("enroll_file", "enrollment")
+def _analyze_file(
+    path: str,
+    sample_rate: int,
+    n_fft: int,
+    hop_length: int,
+    resample_quality: ResampleQuality,
+    formant_gating: FormantGating,
+    screening: Optional[ScreeningThresholds],
+) -> _AnalysisResult:
+    report = EnrollmentFileReport(path)
+    try:
+        audio, _ = load_audio(
+            path, target_sr=sample_rate, resample_quality=resample_quality
+        )
+        report.duration_seconds = len(audio) / sample_rate
+        if screening is not None:
+            screened = screen_audio(audio, sample_rate, screening)
+            if not screened.passed:
+                report.issues = list(screened.issues)
+                report.recommendations = list(screened.recommendations)
+                return None, report
+        audio = normalize_audio(audio)
+        engine = VoiceAnalysisEngine(
+            sample_rate,
+            n_fft,
+            hop_length,
+            resample_quality=resample_quality,
+            formant_gating=formant_gating,
+            parallel=False,
+        )
+        profile = engine.build(audio, os.path.basename(path))
+    except Exception as e:
+        report.error = str(e)
+        return None, report
+
+    quality = QualityScorer().score_profile(profile)
+    report.voiced_seconds = (
+        float(np.sum(profile.pitch.voiced_mask)) * hop_length / sample_rate
+    )
+    report.quality_score = float(quality.overall_score)
+    report.is_viable = quality.is_viable
+    report.issues = list(quality.critical_issues) + list(quality.warnings)
+    report.recommendations = list(quality.recommendations)
+    return profile, report
+
+
+def _weighted_mean(values: Sequence[float], weights: np.ndarray) -> float:
+    if np.sum(weights) <= 0:
+        return float(np.mean(values))
+    return float(np.average(values, weights=weights))
+
+
+def merge_profiles(profiles: Sequence[VoiceProfile]) -> VoiceProfile:
+    if not profiles:
+        raise ValueError("Cannot merge an empty list of profiles")
+    sample_rate = profiles[0].sample_rate
+    n_bins = profiles[0].spectral.envelope.shape[0]
+    for profile in profiles[1:]:
+        if (
+            profile.sample_rate != sample_rate
+            or profile.spectral.envelope.shape[0] != n_bins
+        ):
+            raise ValueError(
+                "Profiles must share sample rate and FFT size to be merged"
+            )
+    if len(profiles) == 1:
+        return profiles[0]
+
+    voiced_frames = np.array(
+        [np.sum(p.pitch.voiced_mask) for p in profiles], dtype=np.float64
+    )
+
+    f0 = np.concatenate([p.pitch.f0 for p in profiles])
+    voiced_mask = np.concatenate([p.pitch.voiced_mask for p in profiles])
+    hnr_contour = None
+    if all(p.pitch.hnr_contour is not None for p in profiles):
+        hnr_contour = np.concatenate([p.pitch.hnr_contour for p in profiles])
+    valid_f0 = f0[np.isfinite(f0)]
+    if len(valid_f0) > 0:
+        f0_mean = float(np.median(valid_f0))
+        f0_std = float(np.std(valid_f0))
+    else:
+        f0_mean = 150.0
+        f0_std = 0.0
+    pitch = PitchContour(
+        f0,
+        voiced_mask,
+        f0_mean,
+        f0_std,
+        _weighted_mean(
+            [p.pitch.harmonic_to_noise_ratio for p in profiles],
+            voiced_frames,
+        ),
+        hnr_contour,
+    )
+
+    n_formants = min(p.formants.frequencies.shape[0] for p in profiles)
+    frequencies = np.concatenate(
+        [p.formants.frequencies[:n_formants] for p in profiles], axis=1
+    )
+    bandwidths = np.concatenate(
+        [p.formants.bandwidths[:n_formants] for p in profiles], axis=1
+    )
+    mean_frequencies = np.zeros(n_formants)
+    mean_bandwidths = np.zeros(n_formants)
+    for i in range(n_formants):
+        found = frequencies[i] > 0
+        if np.any(found):
+            mean_frequencies[i] = np.median(frequencies[i, found])
+            mean_bandwidths[i] = np.median(bandwidths[i, found])
+        else:
+            mean_frequencies[i] = _weighted_mean(
+                [p.formants.mean_frequencies[i] for p in profiles],
+                voiced_frames,
+            )
+            mean_bandwidths[i] = _weighted_mean(
+                [p.formants.mean_bandwidths[i] for p in profiles],
+                voiced_frames,
+            )
+
+    spectral = SpectralFeatures(
+        envelope=np.concatenate(
+            [p.spectral.envelope for p in profiles], axis=1
+        ),
+        spectral_tilt=_weighted_mean(
+            [p.spectral.spectral_tilt for p in profiles], voiced_frames
+        ),
+    )
+
+    return VoiceProfile(
+        pitch=pitch,
+        formants=FormantTrack(
+            frequencies, bandwidths, mean_frequencies, mean_bandwidths
+        ),
+        spectral=spectral,
+        harmonic_ratios=np.concatenate([p.harmonic_ratios for p in profiles]),
+        harmonic_energy=np.concatenate([p.harmonic_energy for p in profiles]),
+        sample_rate=sample_rate,
+    )
+
+
+def enroll_files(
+    paths: Sequence[str],
+    name: str,
+    sample_rate: int = 44100,
+    n_fft: int = AudioConstants.DEFAULT_N_FFT,
+    hop_length: int = 512,
+    resample_quality: ResampleQuality = ResampleQuality.STANDARD,
+    formant_gating: FormantGating = FormantGating.NONE,
+    screening: Optional[ScreeningThresholds] = _DEFAULT_SCREENING,
+    n_workers: Optional[int] = None,
+    store: Optional[ProfileStore] = None,
+    on_file: Optional[FileCallback] = None,
+) -> EnrollmentResult:
+    if not paths:
+        raise ValueError("At least one file is required for enrollment")
+    if n_workers is None:
+        n_workers = min(len(paths), os.cpu_count() or 1)
+
+    args = (
+        sample_rate,
+        n_fft,
+        hop_length,
+        resample_quality,
+        formant_gating,
+        screening,
+    )
+    logger.info(
+        f"Enrolling '{name}' from {len(paths)} files on {n_workers} workers"
+    )
+
+    results: List[Optional[_AnalysisResult]] = [None] * len(paths)
+
+    def _record(index: int, result: _AnalysisResult) -> None:
+        results[index] = result
+        report = result[1]
+        if report.error is not None:
+            logger.warning(
+                f"Enrollment failed for {report.path}: {report.error}"
+            )
+        else:
+            logger.info(
+                f"Enrollment file {report.path}: "
+                f"quality {report.quality_score:.1f}/100, "
+                f"{report.voiced_seconds:.1f}s voiced"
+            )
+        if on_file is not None:
+            on_file(report)
+
+    if n_workers <= 1 or len(paths) == 1:
+        for index, path in enumerate(paths):
+            _record(index, _analyze_file(path, *args))
+    else:
+        tracer = get_tracer()
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            if tracer is None:
+                futures = {
+                    executor.submit(_analyze_file, path, *args): index
+                    for index, path in enumerate(paths)
+                }
+            else:
+                futures = {
+                    executor.submit(
+                        run_traced, _analyze_file, path, *args
+                    ): index
+                    for index, path in enumerate(paths)
+                }
+            for future in as_completed(futures):
+                result = future.result()
+                if tracer is not None:
+                    result, events = result
+                    tracer.merge(events)
+                _record(futures[future], result)
+
+    reports = [result[1] for result in results]
+    accepted = [
+        profile
+        for profile, report in results
+        if profile is not None and report.is_viable
+    ]
+    if not accepted:
+        suggestions = sorted(
+            {text for report in reports for text in report.recommendations}
+        )
+        raise ProfileQualityError(
+            f"No usable enrollment files for '{name}' "
+            f"(0/{len(paths)} passed quality checks)",
+            suggestions,
+        )
+
+    profile = merge_profiles(accepted)
+    logger.info(
+        f"Enrolled '{name}' from {len(accepted)}/{len(paths)} files. "
+        f"Mean F0: {profile.pitch.f0_mean:.1f}Hz"
+    )
+    if store is not None:
+        store.save(name, profile)
+    return EnrollmentResult(name=name, profile=profile, files=reports)
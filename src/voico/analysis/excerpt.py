@@ -0,0 +1,110 @@
+import logging
+from typing import List, Tuple
+
+import numpy as np
+
+from ..core.constants import AudioConstants
+
+logger = logging.getLogger(__name__)
+
+_ACTIVITY_RANGE_DB = 30.0
+_ACTIVITY_FLOOR_DB = -60.0
+_VOICED_MAX_ZCR = 0.25
+_MIN_ACTIVE_FRACTION = 0.5
+_JOIN_FADE_SECONDS = 0.01
+
+Excerpt = Tuple[int, int]
+
+
+def _frame_activity(
+    audio: np.ndarray, frame_length: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_frames = len(audio) // frame_length
+    frames = np.asarray(
+        audio[: n_frames * frame_length], dtype=np.float64
+    ).reshape(n_frames, frame_length)
+    energy_db = 10.0 * np.log10(
+        np.mean(np.square(frames), axis=1) + AudioConstants.EPSILON
+    )
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+    if n_frames == 0:
+        return energy_db, np.zeros(0, dtype=bool)
+    threshold = max(np.max(energy_db) - _ACTIVITY_RANGE_DB, _ACTIVITY_FLOOR_DB)
+    active = (energy_db > threshold) & (zcr < _VOICED_MAX_ZCR)
+    return energy_db, active
+
+
+def select_voiced_excerpts(
+    audio: np.ndarray,
+    sample_rate: int,
+    max_seconds: float,
+    excerpt_seconds: float = 1.0,
+    frame_length: int = 512,
+) -> List[Excerpt]:
+    if len(audio) <= max_seconds * sample_rate:
+        return [(0, len(audio))]
+
+    window_frames = max(
+        1, round(excerpt_seconds * sample_rate / frame_length)
+    )
+    energy_db, active = _frame_activity(audio, frame_length)
+    n_windows = len(active) // window_frames
+    if n_windows == 0:
+        return [(0, len(audio))]
+
+    shape = (n_windows, window_frames)
+    window_active = active[: n_windows * window_frames].reshape(shape)
+    window_energy = energy_db[: n_windows * window_frames].reshape(shape)
+    active_fraction = np.mean(window_active, axis=1)
+    loudness = np.sum(
+        np.where(window_active, window_energy, 0.0), axis=1
+    ) / np.maximum(np.sum(window_active, axis=1), 1)
+
+    candidates = np.where(active_fraction >= _MIN_ACTIVE_FRACTION)[0]
+    if len(candidates) == 0:
+        logger.warning(
+            "No voiced excerpts found; falling back to loudest windows"
+        )
+        candidates = np.arange(n_windows)
+        loudness = np.mean(window_energy, axis=1)
+
+    budget = max(1, int(max_seconds // excerpt_seconds))
+    ranked = candidates[np.argsort(-loudness[candidates], kind="stable")]
+    chosen = np.sort(ranked[:budget])
+
+    window_samples = window_frames * frame_length
+    excerpts: List[Excerpt] = []
+    for window in chosen:
+        start = int(window) * window_samples
+        end = start + window_samples
+        if excerpts and excerpts[-1][1] == start:
+            excerpts[-1] = (excerpts[-1][0], end)
+        else:
+            excerpts.append((start, end))
+
+    logger.debug(
+        f"Selected {len(chosen)}/{n_windows} windows "
+        f"in {len(excerpts)} excerpts"
+    )
+    return excerpts
+
+
+def join_excerpts(
+    audio: np.ndarray, excerpts: List[Excerpt], sample_rate: int
+) -> np.ndarray:
+    if len(excerpts) == 1:
+        start, end = excerpts[0]
+        return audio[start:end]
+
+    fade_length = max(1, int(_JOIN_FADE_SECONDS * sample_rate))
+    ramp = np.sin(0.5 * np.pi * np.linspace(0.0, 1.0, fade_length)) ** 2
+    pieces = []
+    for start, end in excerpts:
+        piece = np.array(audio[start:end])
+        n = min(fade_length, len(piece) // 2)
+        piece[:n] *= ramp[:n].astype(piece.dtype)
+        piece[len(piece) - n :] *= ramp[:n][::-1].astype(piece.dtype)
+        pieces.append(piece)
+    return np.concatenate(pieces)
@@ -1,18 +1,19 @@
 import logging
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Tuple
 
 import numpy as np
-from scipy.signal import butter, get_window, medfilt, sosfiltfilt
+from scipy.signal import get_window, medfilt
 
-from ..backends import LIBROSA_AVAILABLE
+from ..core.config import FormantGating, ResampleQuality
 from ..core.constants import AudioConstants
 from ..core.types import FormantTrack
-
-if LIBROSA_AVAILABLE:
-    import librosa
+from ..dsp.resampler import resample
 
 logger = logging.getLogger(__name__)
 
+_ROOT_BLOCK_FRAMES = 8192
+
 
 class FormantAnalyzer:
     def __init__(
@@ -21,86 +22,73 @@ class FormantAnalyzer:
         hop_length: int,
         n_formants: int = 5,
         lpc_order: int = 14,
+        resample_quality: ResampleQuality = ResampleQuality.STANDARD,
+        gating: FormantGating = FormantGating.NONE,
+        gate_threshold_db: float = AudioConstants.FORMANT_GATE_THRESHOLD_DB,
     ):
         self.sample_rate = sample_rate
         self.hop_length = hop_length
         self.n_formants = n_formants
         self.analysis_sample_rate = AudioConstants.FORMANT_ANALYSIS_SR
         self.lpc_order = lpc_order
+        self.resample_quality = resample_quality
+        self.gating = gating
+        self.gate_threshold_db = gate_threshold_db
+
+    @property
+    def cache_params(self) -> Tuple[object, ...]:
+        return (
+            self.sample_rate,
+            self.hop_length,
+            self.n_formants,
+            self.lpc_order,
+            self.resample_quality.value,
+            self.gating.value,
+            self.gate_threshold_db,
+        )
 
     def analyze(
         self, audio: np.ndarray, f0_contour: np.ndarray
     ) -> FormantTrack:
         logger.info("Starting formant analysis")
 
-        if LIBROSA_AVAILABLE:
-            resampled_audio = librosa.resample(
-                audio,
-                orig_sr=self.sample_rate,
-                target_sr=self.analysis_sample_rate,
-            )
-        else:
-            ratio = max(1, int(self.sample_rate / self.analysis_sample_rate))
-            if ratio > 1:
-                nyquist = 0.5 * self.sample_rate
-                cutoff = 0.5 * self.analysis_sample_rate / nyquist
-                if cutoff < 1.0:
-                    anti_alias_filter = butter(
-                        4, cutoff, btype="low", output="sos"
-                    )
-                    filtered_audio = sosfiltfilt(anti_alias_filter, audio)
-                else:
-                    filtered_audio = audio
-                resampled_audio = filtered_audio[::ratio]
-            else:
-                resampled_audio = audio.copy()
+        resampled_audio = self._resample(audio)
 
         n_frames = len(f0_contour)
         frequencies = np.zeros((self.n_formants, n_frames))
         bandwidths = np.zeros((self.n_formants, n_frames))
 
-        frame_length = int(0.025 * self.analysis_sample_rate)
-        analysis_hop = max(1, len(resampled_audio) // n_frames)
+        frames = self._frame_signal(resampled_audio, n_frames)
+        frame_length = frames.shape[1]
 
         skipped_frames = 0
-        for t in range(n_frames):
-            start = t * analysis_hop
-            end = start + frame_length
-            if end > len(resampled_audio):
-                end = len(resampled_audio)
-                start = max(0, end - frame_length)
-
-            frame = resampled_audio[start:end].astype(np.float64)
-            if len(frame) < self.lpc_order + 2:
-                continue
-
-            frame = np.append(frame[0], frame[1:] - 0.97 * frame[:-1])
-
-            window = get_window("hamming", len(frame))
-            frame = frame * window
-
-            f0_value = f0_contour[t] if t < len(f0_contour) else 0.0
-            if (
-                np.isfinite(f0_value)
-                and f0_value < AudioConstants.PITCH_THRESHOLD_LOW
-            ):
-                order = AudioConstants.LPC_ORDER_LOW_PITCH
-            else:
-                order = self.lpc_order
-            order = min(order, len(frame) - 2)
-
-            lpc_coefficients = self._levinson_durbin(frame, order)
-            if lpc_coefficients is None:
-                skipped_frames += 1
-                continue
-
-            frame_frequencies, frame_bandwidths = self._lpc_to_formants(
-                lpc_coefficients, self.analysis_sample_rate
+        analyzed = np.arange(n_frames)
+        if frame_length >= self.lpc_order + 2:
+            analyzed = self._gate_frames(frames, f0_contour)
+            frames = frames[analyzed]
+            frames[:, 1:] -= 0.97 * frames[:, :-1]
+            frames *= _analysis_window(frame_length)
+
+            orders = np.minimum(
+                self._frame_orders(f0_contour[analyzed]), frame_length - 2
             )
+            for order in np.unique(orders):
+                group = np.where(orders == order)[0]
+                coefficients, converged = _levinson_durbin_batch(
+                    _autocorrelation(frames[group], int(order)), int(order)
+                )
+                skipped_frames += int(np.sum(~converged))
 
-            n_found = min(len(frame_frequencies), self.n_formants)
-            frequencies[:n_found, t] = frame_frequencies[:n_found]
-            bandwidths[:n_found, t] = frame_bandwidths[:n_found]
+                group_frequencies, group_bandwidths = (
+                    _lpc_to_formants_batch(
+                        coefficients[converged],
+                        self.analysis_sample_rate,
+                        self.n_formants,
+                    )
+                )
+                columns = analyzed[group[converged]]
+                frequencies[:, columns] = group_frequencies.T
+                bandwidths[:, columns] = group_bandwidths.T
 
         if skipped_frames > 0:
             logger.warning(
@@ -134,6 +122,9 @@ class FormantAnalyzer:
                 mean_frequencies[i] = 500.0 * (i + 1)
                 mean_bandwidths[i] = 100.0
 
+        if self.gating is FormantGating.INTERPOLATE:
+            self._fill_gated_frames(frequencies, bandwidths, analyzed)
+
         logger.info(
             f"Formant analysis complete: "
             f"F1={mean_frequencies[0]:.0f}Hz, "
@@ -144,65 +135,181 @@ class FormantAnalyzer:
             frequencies, bandwidths, mean_frequencies, mean_bandwidths
         )
 
-    def _levinson_durbin(
-        self, frame: np.ndarray, order: int
-    ) -> Optional[np.ndarray]:
-        autocorrelation = np.correlate(frame, frame, mode="full")
-        autocorrelation = autocorrelation[len(frame) - 1 :]
-        autocorrelation = autocorrelation[: order + 1]
-
-        if autocorrelation[0] < AudioConstants.EPSILON:
-            return None
-
-        try:
-            coefficients = np.zeros(order + 1)
-            coefficients[0] = 1.0
-            prediction_error = autocorrelation[0]
-
-            for i in range(1, order + 1):
-                reflection_coeff = (
-                    -np.sum(coefficients[1:i] * autocorrelation[i - 1 : 0 : -1])
-                    - autocorrelation[i]
-                )
-                reflection_coeff /= prediction_error
+    def _resample(self, audio: np.ndarray) -> np.ndarray:
+        return resample(
+            audio,
+            self.sample_rate,
+            self.analysis_sample_rate,
+            self.resample_quality,
+        )
 
-                updated = coefficients.copy()
-                updated[1:i] = (
-                    coefficients[1:i]
-                    + reflection_coeff * coefficients[i - 1 : 0 : -1]
-                )
-                updated[i] = reflection_coeff
-                coefficients = updated
-
-                prediction_error *= 1.0 - reflection_coeff * reflection_coeff
-                if prediction_error <= 0:
-                    return None
-            return coefficients
-        except (np.linalg.LinAlgError, FloatingPointError):
-            return None
-
-    def _lpc_to_formants(
-        self, lpc_coefficients: np.ndarray, sample_rate: int
-    ) -> Tuple[np.ndarray, np.ndarray]:
-        roots = np.roots(lpc_coefficients)
-        roots = roots[np.imag(roots) >= 0]
-
-        angles = np.angle(roots)
-        frequencies = angles * sample_rate / (2.0 * np.pi)
-        bandwidths = (
+    def _frame_signal(
+        self, resampled_audio: np.ndarray, n_frames: int
+    ) -> np.ndarray:
+        n_samples = len(resampled_audio)
+        frame_length = min(
+            int(0.025 * self.analysis_sample_rate), n_samples
+        )
+        if n_frames == 0 or frame_length == 0:
+            return np.zeros((n_frames, 0))
+
+        analysis_hop = max(1, n_samples // n_frames)
+        starts = np.minimum(
+            np.arange(n_frames) * analysis_hop, n_samples - frame_length
+        )
+        indices = starts[:, np.newaxis] + np.arange(frame_length)
+        return resampled_audio.astype(np.float64)[indices]
+
+    def _gate_frames(
+        self, frames: np.ndarray, f0_contour: np.ndarray
+    ) -> np.ndarray:
+        n_frames = frames.shape[0]
+        if self.gating is FormantGating.NONE or n_frames == 0:
+            return np.arange(n_frames)
+
+        energy = np.einsum("ij,ij->i", frames, frames)
+        reference = np.max(energy)
+        loud = energy > reference * 10.0 ** (self.gate_threshold_db / 10.0)
+        if reference < AudioConstants.EPSILON:
+            loud[:] = False
+        voiced = np.isfinite(f0_contour) & (f0_contour > 0)
+
+        analyzed = np.where(voiced | loud)[0]
+        logger.debug(
+            f"Formant gating kept {len(analyzed)}/{n_frames} frames"
+        )
+        return analyzed
+
+    def _fill_gated_frames(
+        self,
+        frequencies: np.ndarray,
+        bandwidths: np.ndarray,
+        analyzed: np.ndarray,
+    ) -> None:
+        n_frames = frequencies.shape[1]
+        gated = np.ones(n_frames, dtype=bool)
+        gated[analyzed] = False
+        if not np.any(gated):
+            return
+
+        positions = np.arange(n_frames)
+        for i in range(self.n_formants):
+            known = ~gated & (frequencies[i] > 0)
+            if not np.any(known):
+                continue
+            frequencies[i, gated] = np.interp(
+                positions[gated], positions[known], frequencies[i, known]
+            )
+            bandwidths[i, gated] = np.interp(
+                positions[gated], positions[known], bandwidths[i, known]
+            )
+
+    def _frame_orders(self, f0_contour: np.ndarray) -> np.ndarray:
+        low_pitch = np.isfinite(f0_contour) & (
+            f0_contour < AudioConstants.PITCH_THRESHOLD_LOW
+        )
+        return np.where(
+            low_pitch, AudioConstants.LPC_ORDER_LOW_PITCH, self.lpc_order
+        )
+
+
+@lru_cache(maxsize=8)
+def _analysis_window(length: int) -> np.ndarray:
+    window = get_window("hamming", length)
+    window.setflags(write=False)
+    return window
+
+
+def _autocorrelation(frames: np.ndarray, order: int) -> np.ndarray:
+    n_samples = frames.shape[1]
+    autocorrelation = np.empty((frames.shape[0], order + 1))
+    for lag in range(order + 1):
+        autocorrelation[:, lag] = np.einsum(
+            "ij,ij->i", frames[:, : n_samples - lag], frames[:, lag:]
+        )
+    return autocorrelation
+
+
+def _levinson_durbin_batch(
+    autocorrelation: np.ndarray, order: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_frames = autocorrelation.shape[0]
+    coefficients = np.zeros((n_frames, order + 1))
+    coefficients[:, 0] = 1.0
+
+    converged = autocorrelation[:, 0] >= AudioConstants.EPSILON
+    prediction_error = np.where(converged, autocorrelation[:, 0], 1.0)
+
+    for i in range(1, order + 1):
+        reflection_coeff = (
+            -np.einsum(
+                "ij,ij->i",
+                coefficients[:, 1:i],
+                autocorrelation[:, i - 1 : 0 : -1],
+            )
+            - autocorrelation[:, i]
+        ) / prediction_error
+
+        coefficients[:, 1:i] += (
+            reflection_coeff[:, np.newaxis] * coefficients[:, i - 1 : 0 : -1]
+        )
+        coefficients[:, i] = reflection_coeff
+
+        prediction_error *= 1.0 - reflection_coeff * reflection_coeff
+        converged &= prediction_error > 0
+        prediction_error[~converged] = 1.0
+
+    converged &= np.all(np.isfinite(coefficients), axis=1)
+    return coefficients, converged
+
+
+def _lpc_to_formants_batch(
+    coefficients: np.ndarray, sample_rate: int, n_formants: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_frames, n_coefficients = coefficients.shape
+    frequencies = np.zeros((n_frames, n_formants))
+    bandwidths = np.zeros((n_frames, n_formants))
+    order = n_coefficients - 1
+    if n_frames == 0 or order < 1:
+        return frequencies, bandwidths
+
+    for start in range(0, n_frames, _ROOT_BLOCK_FRAMES):
+        block = slice(start, start + _ROOT_BLOCK_FRAMES)
+        block_coefficients = coefficients[block]
+
+        companion = np.zeros((len(block_coefficients), order, order))
+        companion[:, 0, :] = -block_coefficients[:, 1:]
+        companion[:, np.arange(1, order), np.arange(order - 1)] = 1.0
+        roots = np.linalg.eigvals(companion)
+
+        root_frequencies = np.angle(roots) * sample_rate / (2.0 * np.pi)
+        root_bandwidths = (
             -sample_rate
             / (2.0 * np.pi)
             * np.log(np.abs(roots) + AudioConstants.EPSILON)
         )
-
         valid = (
-            (frequencies > 90)
-            & (frequencies < sample_rate / 2 - 50)
-            & (bandwidths > 0)
-            & (bandwidths < AudioConstants.MAX_FORMANT_BANDWIDTH)
+            (np.imag(roots) >= 0)
+            & (root_frequencies > 90)
+            & (root_frequencies < sample_rate / 2 - 50)
+            & (root_bandwidths > 0)
+            & (root_bandwidths < AudioConstants.MAX_FORMANT_BANDWIDTH)
+        )
+
+        sort_keys = np.where(valid, root_frequencies, np.inf)
+        sort_order = np.argsort(sort_keys, axis=1)[:, :n_formants]
+        selected = np.take_along_axis(valid, sort_order, axis=1)
+
+        n_selected = sort_order.shape[1]
+        frequencies[block, :n_selected] = np.where(
+            selected,
+            np.take_along_axis(root_frequencies, sort_order, axis=1),
+            0.0,
+        )
+        bandwidths[block, :n_selected] = np.where(
+            selected,
+            np.take_along_axis(root_bandwidths, sort_order, axis=1),
+            0.0,
         )
-        frequencies = frequencies[valid]
-        bandwidths = bandwidths[valid]
 
-        sort_order = np.argsort(frequencies)
-        return frequencies[sort_order], bandwidths[sort_order]
+    return frequencies, bandwidths
@@ -1,7 +1,9 @@
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from ..backends import LIBROSA_AVAILABLE
 from ..core.constants import AudioConstants
@@ -12,28 +14,49 @@ if LIBROSA_AVAILABLE:
 
 logger = logging.getLogger(__name__)
 
+_HNR_CEILING_DB = 40.0
+_HNR_BLOCK_FRAMES = 512
+_SEAM_TOLERANCE_SEMITONES = 1.0
+
+_TrackResult = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
 
 class PitchAnalyzer:
-    def __init__(self, sample_rate: int, hop_length: int, n_fft: int):
+    def __init__(
+        self,
+        sample_rate: int,
+        hop_length: int,
+        n_fft: int,
+        segment_seconds: float = 30.0,
+        segment_overlap_seconds: float = 1.0,
+    ):
         self.sample_rate = sample_rate
         self.hop_length = hop_length
         self.n_fft = n_fft
         self.fmin = AudioConstants.MIN_F0_HZ
         self.fmax = AudioConstants.MAX_F0_HZ
+        self.segment_seconds = segment_seconds
+        self.segment_overlap_seconds = segment_overlap_seconds
 
-    def detect(self, audio: np.ndarray) -> PitchContour:
-        if LIBROSA_AVAILABLE:
-            f0, voiced_flag, voiced_prob = librosa.pyin(
-                audio,
-                fmin=self.fmin,
-                fmax=self.fmax,
-                sr=self.sample_rate,
-                hop_length=self.hop_length,
-                fill_na=np.nan,
+    @property
+    def cache_params(self) -> Tuple[float, ...]:
+        return (
+            self.sample_rate,
+            self.hop_length,
+            self.n_fft,
+            self.fmin,
+            self.fmax,
+            LIBROSA_AVAILABLE,
+        )
+
+    def detect(self, audio: np.ndarray, n_workers: int = 1) -> PitchContour:
+        segment_samples = int(self.segment_seconds * self.sample_rate)
+        if n_workers > 1 and len(audio) > 2 * segment_samples:
+            f0, voiced_flag, hnr_contour = self._track_segmented(
+                audio, n_workers
             )
         else:
-            f0, voiced_prob = self._autocorrelation_detect(audio)
-            voiced_flag = voiced_prob > 0.3
+            f0, voiced_flag, hnr_contour = self._track(audio)
 
         f0_clean = f0.copy()
         valid_mask = ~np.isnan(f0_clean)
@@ -45,48 +68,172 @@ class PitchAnalyzer:
             f0_mean = 150.0
             f0_std = 0.0
 
-        hnr = self._compute_hnr(audio, f0_mean)
+        hnr = _aggregate_hnr(hnr_contour, voiced_flag)
 
         return PitchContour(
-            f0_clean, voiced_flag, f0_mean, f0_std, hnr
+            f0_clean, voiced_flag, f0_mean, f0_std, hnr, hnr_contour
         )
 
-    def _compute_hnr(
-        self, audio: np.ndarray, f0_mean: float
-    ) -> float:
-        if f0_mean <= 0 or np.isnan(f0_mean):
-            return 0.0
+    def _track(self, audio: np.ndarray) -> _TrackResult:
+        if LIBROSA_AVAILABLE:
+            f0, voiced_flag, voiced_prob = librosa.pyin(
+                audio,
+                fmin=self.fmin,
+                fmax=self.fmax,
+                sr=self.sample_rate,
+                hop_length=self.hop_length,
+                fill_na=np.nan,
+            )
+            hnr_contour = self._compute_hnr_contour(audio, f0)
+        else:
+            f0, voiced_prob, periodicity = self._autocorrelation_detect(
+                audio
+            )
+            voiced_flag = voiced_prob > 0.3
+            hnr_contour = _periodicity_to_hnr(periodicity)
+        return f0, np.asarray(voiced_flag, dtype=bool), hnr_contour
+
+    def _frame_count(self, n_samples: int) -> int:
+        if LIBROSA_AVAILABLE:
+            return 1 + n_samples // self.hop_length
+        return n_samples // self.hop_length
+
+    def _track_segmented(
+        self, audio: np.ndarray, n_workers: int
+    ) -> _TrackResult:
+        hop = self.hop_length
+        total_frames = self._frame_count(len(audio))
+        segment_frames = max(
+            1, round(self.segment_seconds * self.sample_rate / hop)
+        )
+        overlap_frames = max(
+            1, round(self.segment_overlap_seconds * self.sample_rate / hop)
+        )
 
-        period = int(self.sample_rate / f0_mean)
-        if period < 2 or period >= len(audio) // 2:
-            return 0.0
+        seams = list(range(segment_frames, total_frames, segment_frames))
+        bounds = [0, *seams, total_frames]
+        starts = [max(0, b - overlap_frames) for b in bounds[:-1]]
+        ends = [
+            min(len(audio), (b + overlap_frames) * hop) for b in bounds[1:]
+        ]
+        ends[-1] = len(audio)
 
-        n_samples = min(len(audio), self.sample_rate)
-        frame = audio[:n_samples].astype(np.float64)
+        logger.info(
+            f"Tracking pitch in {len(starts)} segments "
+            f"on {n_workers} workers"
+        )
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(
+                executor.map(
+                    self._track,
+                    [audio[s * hop : e] for s, e in zip(starts, ends)],
+                )
+            )
 
-        autocorr = np.correlate(frame, frame, mode="full")
-        center = len(frame) - 1
-        r0 = autocorr[center]
-        if r0 < AudioConstants.EPSILON:
-            return 0.0
+        f0 = np.full(total_frames, np.nan)
+        voiced_flag = np.zeros(total_frames, dtype=bool)
+        hnr_contour = np.full(total_frames, np.nan)
+        merged = (f0, voiced_flag, hnr_contour)
 
-        r_period = autocorr[center + period]
-        noise_power = r0 - r_period
+        for i, result in enumerate(results):
+            _splice(merged, result, starts[i], bounds[i], bounds[i + 1])
 
-        if noise_power < AudioConstants.EPSILON:
-            return 40.0
+        for i, seam in enumerate(seams):
+            self._reconcile_seam(
+                audio,
+                merged,
+                seam,
+                overlap_frames,
+                (starts[i], results[i]),
+                (starts[i + 1], results[i + 1]),
+            )
 
-        hnr = 10.0 * np.log10(
-            max(r_period, AudioConstants.EPSILON) / noise_power
+        return merged
+
+    def _reconcile_seam(
+        self,
+        audio: np.ndarray,
+        merged: _TrackResult,
+        seam: int,
+        overlap_frames: int,
+        left: Tuple[int, _TrackResult],
+        right: Tuple[int, _TrackResult],
+    ) -> None:
+        total_frames = len(merged[0])
+        lo = max(0, seam - overlap_frames // 2)
+        hi = min(total_frames, seam + max(1, overlap_frames // 2))
+
+        left_start, left_result = left
+        right_start, right_result = right
+        hi = min(
+            hi,
+            left_start + len(left_result[0]),
+            right_start + len(right_result[0]),
         )
-        return float(np.clip(hnr, 0.0, 40.0))
+        if hi <= lo:
+            return
+
+        left_f0, left_voiced, _ = _frames(left_result, left_start, lo, hi)
+        right_f0, right_voiced, _ = _frames(right_result, right_start, lo, hi)
+        disagreement = _contour_disagreement(
+            left_f0, left_voiced, right_f0, right_voiced
+        )
+        if not np.any(disagreement):
+            return
+
+        logger.debug(
+            f"Re-tracking seam at frame {seam}: "
+            f"{int(np.sum(disagreement))} frames disagree"
+        )
+        hop = self.hop_length
+        window_start = max(0, seam - 2 * overlap_frames)
+        window_end = min(len(audio), (seam + 2 * overlap_frames) * hop)
+        window_result = self._track(audio[window_start * hop : window_end])
+        _splice(merged, window_result, window_start, lo, hi)
+
+    def _compute_hnr_contour(
+        self, audio: np.ndarray, f0: np.ndarray
+    ) -> np.ndarray:
+        n_frames = len(f0)
+        periodicity = np.full(n_frames, np.nan)
+
+        max_lag = int(self.sample_rate / self.fmin)
+        window_size = max_lag * 2
+
+        lags = np.zeros(n_frames, dtype=np.int64)
+        voiced = np.isfinite(f0) & (f0 > 0)
+        lags[voiced] = np.round(self.sample_rate / f0[voiced])
+        frame_indices = np.where(voiced & (lags >= 1) & (lags <= max_lag))[0]
+        if len(frame_indices) == 0 or len(audio) == 0:
+            return _periodicity_to_hnr(periodicity)
+
+        padded = np.pad(
+            audio.astype(np.float64), (window_size // 2, window_size)
+        )
+        frames = sliding_window_view(padded, window_size)[
+            :: self.hop_length
+        ]
+        frame_indices = frame_indices[frame_indices < len(frames)]
+
+        fft_size = 1
+        while fft_size < 2 * window_size:
+            fft_size *= 2
+
+        for start in range(0, len(frame_indices), _HNR_BLOCK_FRAMES):
+            block = frame_indices[start : start + _HNR_BLOCK_FRAMES]
+            periodicity[block] = _normalized_periodicity(
+                frames[block], lags[block], fft_size
+            )
+
+        return _periodicity_to_hnr(periodicity)
 
     def _autocorrelation_detect(
         self, audio: np.ndarray
-    ) -> Tuple[np.ndarray, np.ndarray]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         n_frames = len(audio) // self.hop_length
         f0 = np.full(n_frames, np.nan)
         confidence = np.zeros(n_frames)
+        periodicity = np.full(n_frames, np.nan)
 
         min_lag = int(self.sample_rate / self.fmax)
         max_lag = int(self.sample_rate / self.fmin)
@@ -175,4 +322,82 @@ class PitchAnalyzer:
                 else:
                     confidence[t] = 0.0
 
-        return f0, confidence
+                if 0 < tau_idx <= frame_max_lag:
+                    energy = np.sqrt(
+                        energy_left[tau_idx - 1] * energy_right[tau_idx - 1]
+                    )
+                    if energy > AudioConstants.EPSILON:
+                        periodicity[t] = acf[tau_idx] / energy
+
+        return f0, confidence, periodicity
+
+
+def _frames(
+    result: _TrackResult, offset: int, lo: int, hi: int
+) -> _TrackResult:
+    return tuple(values[lo - offset : hi - offset] for values in result)
+
+
+def _splice(
+    merged: _TrackResult, result: _TrackResult, offset: int, lo: int, hi: int
+) -> None:
+    hi = min(hi, offset + len(result[0]))
+    if hi <= lo:
+        return
+    for target, values in zip(merged, _frames(result, offset, lo, hi)):
+        target[lo:hi] = values
+
+
+def _contour_disagreement(
+    f0_a: np.ndarray,
+    voiced_a: np.ndarray,
+    f0_b: np.ndarray,
+    voiced_b: np.ndarray,
+) -> np.ndarray:
+    disagreement = voiced_a != voiced_b
+    both = np.isfinite(f0_a) & np.isfinite(f0_b) & (f0_a > 0) & (f0_b > 0)
+    interval = np.abs(12.0 * np.log2(f0_a[both] / f0_b[both]))
+    disagreement[both] |= interval > _SEAM_TOLERANCE_SEMITONES
+    return disagreement
+
+
+def _normalized_periodicity(
+    frames: np.ndarray, lags: np.ndarray, fft_size: int
+) -> np.ndarray:
+    n = frames.shape[1]
+    spectrum = np.fft.rfft(frames, n=fft_size, axis=1)
+    acf = np.fft.irfft(
+        spectrum.real**2 + spectrum.imag**2, n=fft_size, axis=1
+    )
+    energy_cumsum = np.cumsum(frames**2, axis=1)
+
+    rows = np.arange(len(lags))
+    energy_left = energy_cumsum[rows, n - lags - 1]
+    energy_right = energy_cumsum[rows, n - 1] - energy_cumsum[rows, lags - 1]
+    energy = np.sqrt(energy_left * energy_right)
+
+    periodicity = np.full(len(lags), np.nan)
+    valid = energy > AudioConstants.EPSILON
+    periodicity[valid] = acf[rows[valid], lags[valid]] / energy[valid]
+    return periodicity
+
+
+def _periodicity_to_hnr(periodicity: np.ndarray) -> np.ndarray:
+    hnr = np.full(len(periodicity), np.nan)
+    valid = np.isfinite(periodicity)
+    r = np.clip(periodicity[valid], 0.0, 1.0)
+    hnr[valid] = 10.0 * np.log10(
+        np.maximum(r, AudioConstants.EPSILON)
+        / np.maximum(1.0 - r, AudioConstants.EPSILON)
+    )
+    return np.clip(hnr, 0.0, _HNR_CEILING_DB)
+
+
+def _aggregate_hnr(
+    hnr_contour: np.ndarray, voiced_mask: np.ndarray
+) -> float:
+    n = min(len(hnr_contour), len(voiced_mask))
+    selected = hnr_contour[:n][voiced_mask[:n] & np.isfinite(hnr_contour[:n])]
+    if len(selected) == 0:
+        return 0.0
+    return float(np.mean(selected))
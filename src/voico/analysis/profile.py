@@ -1,16 +1,117 @@
 import logging
+import os
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-import scipy.signal
 
-from ..core.types import VoiceProfile
+from ..core.config import FormantGating, ResampleQuality
+from ..core.types import LiteProfile, VoiceProfile
 from ..utils.decorators import timer
+from ..utils.tracing import span, traced
+from .cache import AnalysisCache, audio_digest, get_analysis_cache
+from .excerpt import Excerpt, join_excerpts, select_voiced_excerpts
 from .formant import FormantAnalyzer
 from .pitch import PitchAnalyzer
 from .spectral import SpectralAnalyzer
 
 logger = logging.getLogger(__name__)
 
+_MAX_ANALYSIS_WORKERS = 4
+_LITE_CONFIDENT_VOICED_SECONDS = 10.0
+
+_AnalysisTask = Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], Any]]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_analysis_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=min(_MAX_ANALYSIS_WORKERS, os.cpu_count() or 1),
+                thread_name_prefix="voico-analysis",
+            )
+        return _executor
+
+
+def _lite_confidence(
+    profile: VoiceProfile,
+    excerpts: List[Excerpt],
+    hop_length: int,
+    window_samples: int,
+    source_samples: int,
+) -> float:
+    f0 = profile.pitch.f0
+    voiced = profile.pitch.voiced_mask & np.isfinite(f0) & (f0 > 0)
+    voiced_seconds = np.sum(voiced) * hop_length / profile.sample_rate
+    coverage = min(1.0, voiced_seconds / _LITE_CONFIDENT_VOICED_SECONDS)
+    if sum(end - start for start, end in excerpts) >= source_samples:
+        return float(coverage)
+
+    medians = []
+    offset = 0
+    for start, end in excerpts:
+        excerpt_end = offset + end - start
+        for window_start in range(offset, excerpt_end, window_samples):
+            window_end = min(window_start + window_samples, excerpt_end)
+            frames = slice(window_start // hop_length, window_end // hop_length)
+            window_f0 = f0[frames][voiced[frames]]
+            if len(window_f0) > 0:
+                medians.append(12.0 * np.log2(np.median(window_f0)))
+        offset = excerpt_end
+
+    if len(medians) < 2:
+        return 0.5 * coverage
+    standard_error = np.std(medians) / np.sqrt(len(medians))
+    return float(coverage / (1.0 + standard_error))
+
+
+def _run_task(name: str, task: _AnalysisTask, results: Dict[str, Any]) -> Any:
+    with timer(name), span(name, "analysis"):
+        return task[1](results)
+
+
+def _run_task_graph(
+    tasks: Dict[str, _AnalysisTask],
+    executor: Optional[ThreadPoolExecutor],
+) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    if executor is None:
+        for name, task in tasks.items():
+            results[name] = _run_task(name, task, results)
+        return results
+
+    pending = dict(tasks)
+    running: Dict[Future, str] = {}
+    try:
+        while pending or running:
+            ready = [
+                name
+                for name, (deps, _) in pending.items()
+                if all(dep in results for dep in deps)
+            ]
+            for name in ready:
+                task = pending.pop(name)
+                running[
+                    executor.submit(_run_task, name, task, dict(results))
+                ] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+    finally:
+        for future in running:
+            future.cancel()
+    return results
+
 
 class VoiceAnalysisEngine:
     def __init__(
@@ -18,10 +119,20 @@ class VoiceAnalysisEngine:
         sample_rate: int,
         n_fft: int = 2048,
         hop_length: int = 512,
+        resample_quality: ResampleQuality = ResampleQuality.STANDARD,
+        formant_gating: FormantGating = FormantGating.NONE,
+        cache: Optional[AnalysisCache] = None,
+        parallel: bool = True,
+        pitch_workers: int = 1,
     ):
         self._sample_rate = sample_rate
         self.n_fft = n_fft
         self.hop_length = hop_length
+        self.resample_quality = resample_quality
+        self.formant_gating = formant_gating
+        self._cache = cache if cache is not None else get_analysis_cache()
+        self.parallel = parallel
+        self.pitch_workers = pitch_workers
         self._build_analyzers()
 
     @property
@@ -39,38 +150,79 @@ class VoiceAnalysisEngine:
             self._sample_rate, self.hop_length, self.n_fft
         )
         self.formant_analyzer = FormantAnalyzer(
-            self._sample_rate, self.hop_length
+            self._sample_rate,
+            self.hop_length,
+            resample_quality=self.resample_quality,
+            gating=self.formant_gating,
         )
         self.spectral_analyzer = SpectralAnalyzer(
-            self._sample_rate, self.n_fft, self.hop_length
+            self._sample_rate, self.n_fft, self.hop_length, cache=self._cache
         )
 
+    @traced("VoiceAnalysisEngine.build", "analysis")
     def build(self, audio: np.ndarray, name: str = "Unknown") -> VoiceProfile:
         logger.info(f"Building voice profile for: {name}")
 
-        _, _, stft_matrix = scipy.signal.stft(
-            audio,
-            fs=self._sample_rate,
-            nperseg=self.n_fft,
-            noverlap=self.n_fft - self.hop_length,
+        digest = audio_digest(audio)
+        pitch_params = self.pitch_analyzer.cache_params
+        profile_key = (
+            "profile",
+            digest,
+            (
+                pitch_params,
+                self.formant_analyzer.cache_params,
+                self.spectral_analyzer.cache_params,
+            ),
         )
-        shared_magnitude = np.abs(stft_matrix)
+        cached_profile = self._cache.get(profile_key)
+        if cached_profile is not None:
+            logger.info(f"Using cached voice profile for: {name}")
+            return cached_profile
 
-        with timer("Pitch Detection"):
-            pitch_contour = self.pitch_analyzer.detect(audio)
+        formant_params = (pitch_params, self.formant_analyzer.cache_params)
+        tasks: Dict[str, _AnalysisTask] = {
+            "stft": (
+                (),
+                lambda r: self.spectral_analyzer.stft_magnitude(audio, digest),
+            ),
+            "pitch": (
+                (),
+                lambda r: self._cache.get_or_compute(
+                    ("pitch", digest, pitch_params),
+                    lambda: self.pitch_analyzer.detect(
+                        audio, self.pitch_workers
+                    ),
+                ),
+            ),
+            "formant": (
+                ("pitch",),
+                lambda r: self._cache.get_or_compute(
+                    ("formant", digest, formant_params),
+                    lambda: self.formant_analyzer.analyze(audio, r["pitch"].f0),
+                ),
+            ),
+            "spectral": (
+                ("stft",),
+                lambda r: self.spectral_analyzer.analyze_with_magnitude(
+                    r["stft"]
+                ),
+            ),
+            "harmonics": (
+                ("stft", "pitch"),
+                lambda r: (
+                    self.spectral_analyzer.compute_harmonic_stats_with_magnitude(
+                        r["stft"], r["pitch"].f0
+                    )
+                ),
+            ),
+        }
+        executor = get_analysis_executor() if self.parallel else None
+        results = _run_task_graph(tasks, executor)
 
-        with timer("Formant Analysis"):
-            formant_track = self.formant_analyzer.analyze(
-                audio, pitch_contour.f0
-            )
-
-        with timer("Spectral Analysis"):
-            spectral_features = self.spectral_analyzer.analyze_with_magnitude(shared_magnitude)
-            harmonic_energy, harmonic_ratios = (
-                self.spectral_analyzer.compute_harmonic_stats_with_magnitude(
-                    shared_magnitude, pitch_contour.f0
-                )
-            )
+        pitch_contour = results["pitch"]
+        formant_track = results["formant"]
+        spectral_features = results["spectral"]
+        harmonic_energy, harmonic_ratios = results["harmonics"]
 
         min_length = min(
             len(pitch_contour.f0),
@@ -81,6 +233,8 @@ class VoiceAnalysisEngine:
 
         pitch_contour.f0 = pitch_contour.f0[:min_length]
         pitch_contour.voiced_mask = pitch_contour.voiced_mask[:min_length]
+        if pitch_contour.hnr_contour is not None:
+            pitch_contour.hnr_contour = pitch_contour.hnr_contour[:min_length]
         formant_track.frequencies = formant_track.frequencies[:, :min_length]
         formant_track.bandwidths = formant_track.bandwidths[:, :min_length]
         spectral_features.envelope = spectral_features.envelope[:, :min_length]
@@ -89,7 +243,7 @@ class VoiceAnalysisEngine:
 
         logger.info(f"Profile built. Mean F0: {pitch_contour.f0_mean:.1f}Hz")
 
-        return VoiceProfile(
+        profile = VoiceProfile(
             pitch=pitch_contour,
             formants=formant_track,
             spectral=spectral_features,
@@ -97,3 +251,42 @@ class VoiceAnalysisEngine:
             harmonic_energy=harmonic_energy,
             sample_rate=self._sample_rate,
         )
+        self._cache.put(profile_key, profile)
+        return profile
+
+    @traced("VoiceAnalysisEngine.build_lite", "analysis")
+    def build_lite(
+        self,
+        audio: np.ndarray,
+        name: str = "Unknown",
+        max_seconds: float = 30.0,
+        excerpt_seconds: float = 1.0,
+    ) -> LiteProfile:
+        excerpts = select_voiced_excerpts(
+            audio,
+            self._sample_rate,
+            max_seconds,
+            excerpt_seconds=excerpt_seconds,
+            frame_length=self.hop_length,
+        )
+        excerpt_audio = join_excerpts(audio, excerpts, self._sample_rate)
+        logger.info(
+            f"Building lite profile for {name} from {len(excerpts)} "
+            f"excerpts ({len(excerpt_audio) / self._sample_rate:.1f}s of "
+            f"{len(audio) / self._sample_rate:.1f}s)"
+        )
+
+        profile = self.build(excerpt_audio, name)
+        window_samples = self.hop_length * max(
+            1, round(excerpt_seconds * self._sample_rate / self.hop_length)
+        )
+        confidence = _lite_confidence(
+            profile, excerpts, self.hop_length, window_samples, len(audio)
+        )
+        return LiteProfile(
+            profile=profile,
+            confidence=confidence,
+            analyzed_seconds=len(excerpt_audio) / self._sample_rate,
+            source_seconds=len(audio) / self._sample_rate,
+            excerpt_count=len(excerpts),
+        )
@@ -6,17 +6,30 @@ import scipy.signal as signal
 from ..core.constants import AudioConstants
 from ..core.types import SpectralFeatures
 from ..utils.math_utils import safe_divide
+from .cache import AnalysisCache, audio_digest, get_analysis_cache
+
+_HARMONIC_NUMBERS = np.arange(1, 11)
+_HARMONIC_BAND_FRACTION = 0.05
 
 
 class SpectralAnalyzer:
-    def __init__(self, sample_rate: int, n_fft: int, hop_length: int):
+    def __init__(
+        self,
+        sample_rate: int,
+        n_fft: int,
+        hop_length: int,
+        cache: Optional[AnalysisCache] = None,
+    ):
         self.sample_rate = sample_rate
         self.n_fft = n_fft
         self.hop_length = hop_length
-        self._cached_magnitude: Optional[np.ndarray] = None
-        self._cached_audio_id: Optional[int] = None
+        self._cache = cache if cache is not None else get_analysis_cache()
 
-    def _compute_stft_magnitude(self, audio: np.ndarray) -> np.ndarray:
+    @property
+    def cache_params(self) -> Tuple[int, int, int]:
+        return (self.sample_rate, self.n_fft, self.hop_length)
+
+    def compute_stft_magnitude(self, audio: np.ndarray) -> np.ndarray:
         stft_matrix = signal.stft(
             audio,
             fs=self.sample_rate,
@@ -25,120 +38,89 @@ class SpectralAnalyzer:
         )[2]
         return np.abs(stft_matrix)
 
-    def _get_magnitude(self, audio: np.ndarray) -> np.ndarray:
-        if (
-            self._cached_audio_id == id(audio)
-            and self._cached_magnitude is not None
-        ):
-            return self._cached_magnitude
-        magnitude = self._compute_stft_magnitude(audio)
-        self._cached_magnitude = magnitude
-        self._cached_audio_id = id(audio)
-        return magnitude
+    def stft_magnitude(
+        self, audio: np.ndarray, digest: Optional[str] = None
+    ) -> np.ndarray:
+        if digest is None:
+            digest = audio_digest(audio)
+        return self._cache.get_or_compute(
+            ("stft", digest, self.cache_params),
+            lambda: self.compute_stft_magnitude(audio),
+        )
 
     def analyze(self, audio: np.ndarray) -> SpectralFeatures:
-        magnitude = self._get_magnitude(audio)
-        envelope = self._compute_cepstral_envelope(magnitude)
-        tilt = self._compute_spectral_tilt(magnitude)
+        magnitude = self.stft_magnitude(audio)
+        envelope = self.compute_cepstral_envelope(magnitude)
+        tilt = self.compute_spectral_tilt(magnitude)
         return SpectralFeatures(envelope=envelope, spectral_tilt=tilt)
 
     def compute_harmonic_stats(
         self, audio: np.ndarray, f0: np.ndarray
     ) -> Tuple[np.ndarray, np.ndarray]:
-        magnitude = self._get_magnitude(audio)
-        frequency_bins = np.fft.rfftfreq(self.n_fft, 1 / self.sample_rate)
-        freq_resolution = (
-            frequency_bins[1] if len(frequency_bins) > 1 else 1.0
-        )
+        magnitude = self.stft_magnitude(audio)
+        return self.compute_harmonic_stats_with_magnitude(magnitude, f0)
+
+    def analyze_with_magnitude(self, magnitude: np.ndarray) -> SpectralFeatures:
+        envelope = self.compute_cepstral_envelope(magnitude)
+        tilt = self.compute_spectral_tilt(magnitude)
+        return SpectralFeatures(envelope=envelope, spectral_tilt=tilt)
 
+    def compute_harmonic_stats_with_magnitude(
+        self, magnitude: np.ndarray, f0: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        n_bins = magnitude.shape[0]
         n_frames = min(magnitude.shape[1], len(f0))
-        total_energy = np.sum(magnitude[:, :n_frames] ** 2, axis=0)
+        power = np.square(magnitude[:, :n_frames], dtype=np.float64)
+        total_energy = np.sum(power, axis=0)
 
         harmonic_energy = np.zeros(n_frames)
         harmonic_ratios = np.zeros(n_frames)
 
-        voiced_mask = f0[:n_frames] > AudioConstants.MIN_F0_HZ
-        voiced_indices = np.where(voiced_mask)[0]
-
-        for t in voiced_indices:
-            fundamental = f0[t]
-            harmonic_mask = np.zeros(len(frequency_bins), dtype=bool)
-
-            for h in range(1, 11):
-                center = h * fundamental
-                if center > frequency_bins[-1]:
-                    break
-                idx = min(
-                    int(round(center / freq_resolution)),
-                    len(frequency_bins) - 1,
-                )
-                width = max(1, int(idx * 0.05))
-                lo = max(0, idx - width)
-                hi = min(len(frequency_bins), idx + width + 1)
-                harmonic_mask[lo:hi] = True
-
-            frame_harmonic_energy = np.sum(
-                magnitude[harmonic_mask, t] ** 2
-            )
-            harmonic_energy[t] = frame_harmonic_energy
-            if total_energy[t] > 0:
-                harmonic_ratios[t] = (
-                    frame_harmonic_energy / total_energy[t]
-                )
+        fundamentals = np.asarray(f0[:n_frames], dtype=np.float64)
+        voiced_indices = np.where(fundamentals > AudioConstants.MIN_F0_HZ)[0]
+        if len(voiced_indices) == 0:
+            return harmonic_energy, harmonic_ratios
 
-        return harmonic_energy, harmonic_ratios
+        lo, hi = self._harmonic_bands(fundamentals[voiced_indices], n_bins)
 
-    def analyze_with_magnitude(self, magnitude: np.ndarray) -> SpectralFeatures:
-        envelope = self._compute_cepstral_envelope(magnitude)
-        tilt = self._compute_spectral_tilt(magnitude)
-        return SpectralFeatures(envelope=envelope, spectral_tilt=tilt)
+        cumulative = np.zeros((n_bins + 1, len(voiced_indices)))
+        np.cumsum(power[:, voiced_indices], axis=0, out=cumulative[1:])
+        columns = np.arange(len(voiced_indices))[:, np.newaxis]
+        harmonic_energy[voiced_indices] = np.sum(
+            cumulative[hi, columns] - cumulative[lo, columns], axis=1
+        )
 
-    def compute_harmonic_stats_with_magnitude(
-        self, magnitude: np.ndarray, f0: np.ndarray
+        harmonic_ratios = safe_divide(harmonic_energy, total_energy)
+        return harmonic_energy, harmonic_ratios
+
+    def _harmonic_bands(
+        self, fundamentals: np.ndarray, n_bins: int
     ) -> Tuple[np.ndarray, np.ndarray]:
         frequency_bins = np.fft.rfftfreq(self.n_fft, 1 / self.sample_rate)
+        n_bins = min(n_bins, len(frequency_bins))
         freq_resolution = (
             frequency_bins[1] if len(frequency_bins) > 1 else 1.0
         )
 
-        n_frames = min(magnitude.shape[1], len(f0))
-        total_energy = np.sum(magnitude[:, :n_frames] ** 2, axis=0)
-
-        harmonic_energy = np.zeros(n_frames)
-        harmonic_ratios = np.zeros(n_frames)
+        centers = fundamentals[:, np.newaxis] * _HARMONIC_NUMBERS
+        in_range = centers <= frequency_bins[n_bins - 1]
+        idx = np.minimum(
+            np.round(centers / freq_resolution).astype(np.int64), n_bins - 1
+        )
+        width = np.maximum(1, (idx * _HARMONIC_BAND_FRACTION).astype(np.int64))
+        lo = np.maximum(0, idx - width)
+        hi = np.minimum(n_bins, idx + width + 1)
 
-        voiced_mask = f0[:n_frames] > AudioConstants.MIN_F0_HZ
-        voiced_indices = np.where(voiced_mask)[0]
-
-        for t in voiced_indices:
-            fundamental = f0[t]
-            harmonic_mask = np.zeros(len(frequency_bins), dtype=bool)
-
-            for h in range(1, 11):
-                center = h * fundamental
-                if center > frequency_bins[-1]:
-                    break
-                idx = min(
-                    int(round(center / freq_resolution)),
-                    len(frequency_bins) - 1,
-                )
-                width = max(1, int(idx * 0.05))
-                lo = max(0, idx - width)
-                hi = min(len(frequency_bins), idx + width + 1)
-                harmonic_mask[lo:hi] = True
-
-            frame_harmonic_energy = np.sum(
-                magnitude[harmonic_mask, t] ** 2
-            )
-            harmonic_energy[t] = frame_harmonic_energy
-            if total_energy[t] > 0:
-                harmonic_ratios[t] = (
-                    frame_harmonic_energy / total_energy[t]
-                )
+        previous_hi = np.zeros_like(hi)
+        previous_hi[:, 1:] = hi[:, :-1]
+        lo = np.maximum(lo, previous_hi)
+        hi = np.maximum(hi, lo)
 
-        return harmonic_energy, harmonic_ratios
+        lo[~in_range] = 0
+        hi[~in_range] = 0
+        return lo, hi
 
-    def _compute_cepstral_envelope(
+    def compute_cepstral_envelope(
         self,
         magnitude_spectrum: np.ndarray,
         cepstral_coefficients: int = 20,
@@ -150,7 +132,7 @@ class SpectralAnalyzer:
         envelope = np.exp(envelope_log[: magnitude_spectrum.shape[0], :])
         return envelope
 
-    def _compute_spectral_tilt(self, magnitude_spectrum: np.ndarray) -> float:
+    def compute_spectral_tilt(self, magnitude_spectrum: np.ndarray) -> float:
         average_spectrum = np.mean(magnitude_spectrum, axis=1)
         frequency_bins = np.fft.rfftfreq(self.n_fft, 1 / self.sample_rate)
 
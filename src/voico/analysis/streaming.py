@@ -0,0 +1,465 @@
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..core.config import FormantGating, ResampleQuality
+from ..core.constants import AudioConstants
+from ..core.types import (
+    FormantTrack,
+    PitchContour,
+    SpectralFeatures,
+    VoiceProfile,
+)
+from .formant import FormantAnalyzer
+from .pitch import PitchAnalyzer
+from .spectral import SpectralAnalyzer
+
+logger = logging.getLogger(__name__)
+
+_F0_SKETCH_BINS = 2400
+_FORMANT_SKETCH_BINS = 2500
+_BANDWIDTH_SKETCH_BINS = 1000
+_MAX_SKETCH_BANDWIDTH_HZ = 2000.0
+
+
+class QuantileSketch:
+    def __init__(
+        self, lo: float, hi: float, n_bins: int, log_scale: bool = False
+    ):
+        if hi <= lo or n_bins < 1 or (log_scale and lo <= 0):
+            raise ValueError(
+                f"Invalid sketch range [{lo}, {hi}] with {n_bins} bins"
+            )
+        self.lo = lo
+        self.hi = hi
+        self.n_bins = n_bins
+        self.log_scale = log_scale
+        self.counts = np.zeros(n_bins)
+
+    @property
+    def count(self) -> float:
+        return float(np.sum(self.counts))
+
+    def _scale(self, values: np.ndarray) -> np.ndarray:
+        if self.log_scale:
+            return (np.log(values) - np.log(self.lo)) / (
+                np.log(self.hi) - np.log(self.lo)
+            )
+        return (values - self.lo) / (self.hi - self.lo)
+
+    def _unscale(self, position: float) -> float:
+        fraction = position / self.n_bins
+        if self.log_scale:
+            return float(self.lo * (self.hi / self.lo) ** fraction)
+        return float(self.lo + fraction * (self.hi - self.lo))
+
+    def add(self, values: np.ndarray, weight: float = 1.0) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if self.log_scale:
+            values = values[values > 0]
+        if len(values) == 0:
+            return
+        bins = np.clip(
+            (self._scale(values) * self.n_bins).astype(np.int64),
+            0,
+            self.n_bins - 1,
+        )
+        self.counts += weight * np.bincount(bins, minlength=self.n_bins)
+
+    def merge(self, other: "QuantileSketch", weight: float = 1.0) -> None:
+        if (other.lo, other.hi, other.n_bins, other.log_scale) != (
+            self.lo,
+            self.hi,
+            self.n_bins,
+            self.log_scale,
+        ):
+            raise ValueError("Cannot merge sketches with different bins")
+        self.counts += weight * other.counts
+
+    def quantile(self, q: float) -> float:
+        total = self.count
+        if total <= 0:
+            return float("nan")
+        cumulative = np.cumsum(self.counts)
+        target = float(np.clip(q, 0.0, 1.0)) * total
+        position = np.searchsorted(
+            cumulative, max(target, AudioConstants.EPSILON)
+        )
+        index = min(int(position), self.n_bins - 1)
+        below = cumulative[index] - self.counts[index]
+        fraction = (target - below) / max(
+            self.counts[index], AudioConstants.EPSILON
+        )
+        return self._unscale(index + float(np.clip(fraction, 0.0, 1.0)))
+
+    def copy(self) -> "QuantileSketch":
+        clone = QuantileSketch(self.lo, self.hi, self.n_bins, self.log_scale)
+        clone.counts = self.counts.copy()
+        return clone
+
+
+@dataclass
+class _FrameHistory:
+    capacity: int
+    n_formants: int
+    stride: int = 1
+    seen: int = 0
+    f0: List[np.ndarray] = field(default_factory=list)
+    voiced: List[np.ndarray] = field(default_factory=list)
+    hnr: List[np.ndarray] = field(default_factory=list)
+    frequencies: List[np.ndarray] = field(default_factory=list)
+    bandwidths: List[np.ndarray] = field(default_factory=list)
+    harmonic_energy: List[np.ndarray] = field(default_factory=list)
+    harmonic_ratios: List[np.ndarray] = field(default_factory=list)
+
+    def _columns(self) -> Tuple[List[np.ndarray], ...]:
+        return (
+            self.f0,
+            self.voiced,
+            self.hnr,
+            self.frequencies,
+            self.bandwidths,
+            self.harmonic_energy,
+            self.harmonic_ratios,
+        )
+
+    def append(self, *values: np.ndarray) -> None:
+        n_frames = len(values[0])
+        offset = (-self.seen) % self.stride
+        self.seen += n_frames
+        for column, value in zip(self._columns(), values):
+            column.append(value[..., offset :: self.stride])
+        while self.size > self.capacity:
+            self._decimate()
+
+    @property
+    def size(self) -> int:
+        return sum(len(chunk) for chunk in self.f0)
+
+    def _decimate(self) -> None:
+        self.stride *= 2
+        merged = self.arrays()
+        for column, value in zip(self._columns(), merged):
+            column[:] = [value[..., ::2]]
+
+    def arrays(self) -> Tuple[np.ndarray, ...]:
+        if not self.f0:
+            return (
+                np.zeros(0),
+                np.zeros(0, dtype=bool),
+                np.zeros(0),
+                np.zeros((self.n_formants, 0)),
+                np.zeros((self.n_formants, 0)),
+                np.zeros(0),
+                np.zeros(0),
+            )
+        return tuple(
+            np.concatenate(column, axis=-1) for column in self._columns()
+        )
+
+    def copy(self) -> "_FrameHistory":
+        clone = _FrameHistory(
+            self.capacity, self.n_formants, self.stride, self.seen
+        )
+        for target, column in zip(clone._columns(), self._columns()):
+            target.extend(column)
+        return clone
+
+
+@dataclass
+class _ProfileAccumulator:
+    history: _FrameHistory
+    f0_sketch: QuantileSketch
+    formant_sketches: List[QuantileSketch]
+    bandwidth_sketches: List[QuantileSketch]
+    envelope_sum: np.ndarray
+    magnitude_sum: np.ndarray
+    frames: int = 0
+    f0_sum: float = 0.0
+    f0_sq_sum: float = 0.0
+    f0_count: int = 0
+    hnr_sum: float = 0.0
+    hnr_count: int = 0
+
+    def copy(self) -> "_ProfileAccumulator":
+        return _ProfileAccumulator(
+            history=self.history.copy(),
+            f0_sketch=self.f0_sketch.copy(),
+            formant_sketches=[s.copy() for s in self.formant_sketches],
+            bandwidth_sketches=[s.copy() for s in self.bandwidth_sketches],
+            envelope_sum=self.envelope_sum.copy(),
+            magnitude_sum=self.magnitude_sum.copy(),
+            frames=self.frames,
+            f0_sum=self.f0_sum,
+            f0_sq_sum=self.f0_sq_sum,
+            f0_count=self.f0_count,
+            hnr_sum=self.hnr_sum,
+            hnr_count=self.hnr_count,
+        )
+
+
+class StreamingProfileBuilder:
+    def __init__(
+        self,
+        sample_rate: int,
+        n_fft: int = 2048,
+        hop_length: int = 512,
+        resample_quality: ResampleQuality = ResampleQuality.STANDARD,
+        formant_gating: FormantGating = FormantGating.NONE,
+        block_seconds: float = 5.0,
+        context_seconds: float = 0.5,
+        max_history_frames: int = 2048,
+    ):
+        self.sample_rate = sample_rate
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.block_frames = max(
+            1, round(block_seconds * sample_rate / hop_length)
+        )
+        self.context_frames = max(
+            -(-n_fft // hop_length),
+            round(context_seconds * sample_rate / hop_length),
+        )
+        self.max_history_frames = max_history_frames
+
+        self.pitch_analyzer = PitchAnalyzer(sample_rate, hop_length, n_fft)
+        self.formant_analyzer = FormantAnalyzer(
+            sample_rate,
+            hop_length,
+            resample_quality=resample_quality,
+            gating=formant_gating,
+        )
+        self.spectral_analyzer = SpectralAnalyzer(
+            sample_rate, n_fft, hop_length
+        )
+        self.reset()
+
+    @property
+    def duration_seconds(self) -> float:
+        return self._samples_seen / self.sample_rate
+
+    @property
+    def frames_analyzed(self) -> int:
+        return self._accumulator.frames
+
+    def reset(self) -> None:
+        n_formants = self.formant_analyzer.n_formants
+        n_bins = self.n_fft // 2 + 1
+        formant_ceiling = self.formant_analyzer.analysis_sample_rate / 2.0
+        self._accumulator = _ProfileAccumulator(
+            history=_FrameHistory(self.max_history_frames, n_formants),
+            f0_sketch=QuantileSketch(
+                AudioConstants.MIN_F0_HZ / 2.0,
+                AudioConstants.MAX_F0_HZ * 2.0,
+                _F0_SKETCH_BINS,
+                log_scale=True,
+            ),
+            formant_sketches=[
+                QuantileSketch(0.0, formant_ceiling, _FORMANT_SKETCH_BINS)
+                for _ in range(n_formants)
+            ],
+            bandwidth_sketches=[
+                QuantileSketch(
+                    0.0, _MAX_SKETCH_BANDWIDTH_HZ, _BANDWIDTH_SKETCH_BINS
+                )
+                for _ in range(n_formants)
+            ],
+            envelope_sum=np.zeros(n_bins),
+            magnitude_sum=np.zeros(n_bins),
+        )
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._lead_frames = 0
+        self._samples_seen = 0
+
+    def push(self, chunk: np.ndarray) -> int:
+        chunk = np.asarray(chunk, dtype=np.float32).ravel()
+        self._buffer = np.concatenate([self._buffer, chunk])
+        self._samples_seen += len(chunk)
+
+        hop = self.hop_length
+        analyzed = 0
+        while len(self._buffer) >= (
+            self._lead_frames + self.block_frames + self.context_frames
+        ) * hop:
+            end = (
+                self._lead_frames + self.block_frames + self.context_frames
+            ) * hop
+            analyzed += self._analyze_block(
+                self._accumulator,
+                self._buffer[:end],
+                self._lead_frames,
+                self.block_frames,
+            )
+            keep_from = (
+                self._lead_frames + self.block_frames - self.context_frames
+            ) * hop
+            self._buffer = self._buffer[keep_from:]
+            self._lead_frames = self.context_frames
+        return analyzed
+
+    def snapshot(self, name: str = "Unknown") -> VoiceProfile:
+        accumulator = self._accumulator.copy()
+        if len(self._buffer) > self._lead_frames * self.hop_length:
+            self._analyze_block(
+                accumulator, self._buffer, self._lead_frames, None
+            )
+        logger.info(
+            f"Snapshot of streaming profile '{name}': "
+            f"{accumulator.frames} frames over "
+            f"{self.duration_seconds:.1f}s"
+        )
+        return self._to_profile(accumulator)
+
+    def build(self, audio: np.ndarray, name: str = "Unknown") -> VoiceProfile:
+        self.reset()
+        self.push(audio)
+        return self.snapshot(name)
+
+    def _analyze_block(
+        self,
+        accumulator: _ProfileAccumulator,
+        block: np.ndarray,
+        lead_frames: int,
+        n_frames: Optional[int],
+    ) -> int:
+        pitch = self.pitch_analyzer.detect(block)
+        formants = self.formant_analyzer.analyze(block, pitch.f0)
+        magnitude = self.spectral_analyzer.compute_stft_magnitude(block)
+        envelope = self.spectral_analyzer.compute_cepstral_envelope(
+            magnitude
+        )
+        harmonic_energy, harmonic_ratios = (
+            self.spectral_analyzer.compute_harmonic_stats_with_magnitude(
+                magnitude, pitch.f0
+            )
+        )
+
+        available = min(
+            len(pitch.f0),
+            formants.frequencies.shape[1],
+            magnitude.shape[1],
+            len(harmonic_energy),
+        )
+        end = (
+            available
+            if n_frames is None
+            else min(available, lead_frames + n_frames)
+        )
+        frames = slice(lead_frames, end)
+        if end <= lead_frames:
+            return 0
+
+        f0 = pitch.f0[frames]
+        voiced = pitch.voiced_mask[frames]
+        hnr = (
+            pitch.hnr_contour[frames]
+            if pitch.hnr_contour is not None
+            else np.full(len(f0), np.nan)
+        )
+        frequencies = formants.frequencies[:, frames]
+        bandwidths = formants.bandwidths[:, frames]
+
+        valid_f0 = f0[np.isfinite(f0)]
+        accumulator.f0_sketch.add(valid_f0)
+        accumulator.f0_sum += float(np.sum(valid_f0))
+        accumulator.f0_sq_sum += float(np.sum(np.square(valid_f0)))
+        accumulator.f0_count += len(valid_f0)
+
+        voiced_hnr = hnr[voiced & np.isfinite(hnr)]
+        accumulator.hnr_sum += float(np.sum(voiced_hnr))
+        accumulator.hnr_count += len(voiced_hnr)
+
+        for i in range(frequencies.shape[0]):
+            found = frequencies[i] > 0
+            accumulator.formant_sketches[i].add(frequencies[i, found])
+            accumulator.bandwidth_sketches[i].add(bandwidths[i, found])
+
+        accumulator.envelope_sum += np.sum(envelope[:, frames], axis=1)
+        accumulator.magnitude_sum += np.sum(magnitude[:, frames], axis=1)
+        accumulator.frames += end - lead_frames
+
+        accumulator.history.append(
+            f0,
+            voiced,
+            hnr,
+            frequencies,
+            bandwidths,
+            harmonic_energy[frames],
+            harmonic_ratios[frames],
+        )
+        return end - lead_frames
+
+    def _to_profile(self, accumulator: _ProfileAccumulator) -> VoiceProfile:
+        (
+            f0,
+            voiced,
+            hnr,
+            frequencies,
+            bandwidths,
+            harmonic_energy,
+            harmonic_ratios,
+        ) = accumulator.history.arrays()
+
+        if accumulator.f0_count > 0:
+            f0_mean = accumulator.f0_sketch.quantile(0.5)
+            f0_variance = (
+                accumulator.f0_sq_sum / accumulator.f0_count
+                - (accumulator.f0_sum / accumulator.f0_count) ** 2
+            )
+            f0_std = float(np.sqrt(max(f0_variance, 0.0)))
+        else:
+            f0_mean = 150.0
+            f0_std = 0.0
+        hnr_mean = (
+            accumulator.hnr_sum / accumulator.hnr_count
+            if accumulator.hnr_count > 0
+            else 0.0
+        )
+
+        n_formants = len(accumulator.formant_sketches)
+        mean_frequencies = np.zeros(n_formants)
+        mean_bandwidths = np.zeros(n_formants)
+        for i in range(n_formants):
+            mean_frequencies[i], mean_bandwidths[i] = _formant_median(
+                accumulator.formant_sketches[i],
+                accumulator.bandwidth_sketches[i],
+                i,
+            )
+
+        n_spectral = max(accumulator.frames, 1)
+        envelope = (accumulator.envelope_sum / n_spectral)[:, np.newaxis]
+        tilt = self.spectral_analyzer.compute_spectral_tilt(
+            (accumulator.magnitude_sum / n_spectral)[:, np.newaxis]
+        )
+
+        return VoiceProfile(
+            pitch=PitchContour(f0, voiced, f0_mean, f0_std, hnr_mean, hnr),
+            formants=FormantTrack(
+                frequencies, bandwidths, mean_frequencies, mean_bandwidths
+            ),
+            spectral=SpectralFeatures(envelope=envelope, spectral_tilt=tilt),
+            harmonic_ratios=harmonic_ratios,
+            harmonic_energy=harmonic_energy,
+            sample_rate=self.sample_rate,
+        )
+
+
+def _formant_median(
+    frequency_sketch: QuantileSketch,
+    bandwidth_sketch: QuantileSketch,
+    index: int,
+) -> Tuple[float, float]:
+    if frequency_sketch.count > 0:
+        return (
+            frequency_sketch.quantile(0.5),
+            bandwidth_sketch.quantile(0.5),
+        )
+    if index < len(AudioConstants.DEFAULT_FORMANT_FREQS):
+        return (
+            float(AudioConstants.DEFAULT_FORMANT_FREQS[index]),
+            float(AudioConstants.DEFAULT_FORMANT_BANDWIDTHS[index]),
+        )
+    return 500.0 * (index + 1), 100.0
@@ -13,11 +13,17 @@ def main() -> None:
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=8000)
     parser.add_argument("--db", default=None)
+    parser.add_argument("--diagnostics", default=None)
+    parser.add_argument("--max-conversions", type=int, default=2)
     parser.add_argument("--reload", action="store_true")
     args = parser.parse_args()
 
     from .app import create_app
-    app = create_app(db_path=args.db)
+    app = create_app(
+        db_path=args.db,
+        diagnostics_path=args.diagnostics,
+        max_concurrent_conversions=args.max_conversions,
+    )
     uvicorn.run(app, host=args.host, port=args.port, reload=args.reload)
 
 
@@ -1,21 +1,165 @@
+import asyncio
+import functools
+import json
 import os
 import tempfile
-from typing import Optional
+import time
+from contextlib import suppress
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..analysis.profile import VoiceProfileBuilder
+from ..analysis.enrollment import enroll_files
+from ..analysis.profile import VoiceAnalysisEngine
 from ..converter import VoiceConverter
-from ..core.config import ConversionQuality
+from ..core.config import (
+    ConversionQuality,
+    LatencyBudget,
+    PcmFormat,
+    QualitySettings,
+)
+from ..core.constants import AudioConstants
+from ..core.errors import ProfileQualityError
+from ..quality.diagnostic import JsonlFileSink, set_diagnostic_sink
 from ..store.profile_store import ProfileStore
+from ..stream.pcm import decode_pcm, encode_pcm
+from ..stream.scheduler import (
+    StreamScheduler,
+    StreamSession,
+    get_stream_scheduler,
+)
+from ..stream.streamer import VoiceStreamProcessor
+from ..utils.telemetry import PROMETHEUS_CONTENT_TYPE, get_metrics_registry
+from ..utils.tracing import get_tracer, start_tracing, stop_tracing
 
 try:
-    from fastapi import FastAPI, File, Form, HTTPException, UploadFile
-    from fastapi.responses import FileResponse
+    from fastapi import (
+        FastAPI,
+        File,
+        Form,
+        HTTPException,
+        Request,
+        UploadFile,
+        WebSocket,
+    )
+    from fastapi.responses import FileResponse, PlainTextResponse
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
 
+DEFAULT_MAX_CONCURRENT_CONVERSIONS = 2
+DEFAULT_MAX_STREAM_BACKLOG = 8
+MIN_STREAM_SAMPLE_RATE = 8000
+MAX_STREAM_SAMPLE_RATE = 192000
 
-def create_app(db_path: Optional[str] = None) -> "FastAPI":
+_HTTP_REQUESTS = get_metrics_registry().counter(
+    "voico_http_requests",
+    "HTTP requests by method, route and status code.",
+    ("method", "path", "status"),
+)
+_HTTP_SECONDS = get_metrics_registry().histogram(
+    "voico_http_request_seconds",
+    "HTTP request latency by method and route.",
+    ("method", "path"),
+)
+_HTTP_IN_FLIGHT = get_metrics_registry().gauge(
+    "voico_http_requests_in_flight",
+    "HTTP requests currently being served.",
+)
+_CONVERSIONS_QUEUED = get_metrics_registry().gauge(
+    "voico_conversion_queue_depth",
+    "Conversions waiting for a free worker slot.",
+)
+_CONVERSIONS_IN_FLIGHT = get_metrics_registry().gauge(
+    "voico_conversions_in_flight",
+    "Conversions currently running.",
+)
+_STREAM_CONNECTIONS = get_metrics_registry().gauge(
+    "voico_stream_connections",
+    "Live conversion WebSocket connections currently open.",
+)
+
+
+def _route_path(request: "Request") -> str:
+    route = request.scope.get("route")
+    return getattr(route, "path", "unmatched")
+
+
+def _formant_shift(value: Any) -> float:
+    formant_shift = float(value)
+    if formant_shift <= 0:
+        raise ValueError(f"formant_shift must be > 0, got {formant_shift}")
+    return formant_shift
+
+
+def _open_stream(
+    scheduler: StreamScheduler, config: Dict[str, Any]
+) -> Tuple[StreamSession, PcmFormat]:
+    sample_rate = int(config.get("sample_rate", 44100))
+    if not MIN_STREAM_SAMPLE_RATE <= sample_rate <= MAX_STREAM_SAMPLE_RATE:
+        raise ValueError(
+            f"sample_rate must be in [{MIN_STREAM_SAMPLE_RATE}, "
+            f"{MAX_STREAM_SAMPLE_RATE}], got {sample_rate}"
+        )
+    pcm_format = PcmFormat(config.get("format", PcmFormat.FLOAT32.value))
+    quality = ConversionQuality(config.get("quality", ConversionQuality.FAST.value))
+    latency_budget = None
+    if config.get("latency_ms") is not None:
+        latency_budget = LatencyBudget(target_ms=float(config["latency_ms"]))
+    session = scheduler.open_session(
+        sample_rate=sample_rate,
+        pitch_shift=float(config.get("pitch_shift", 0.0)),
+        formant_shift=_formant_shift(config.get("formant_shift", 1.0)),
+        quality=quality,
+        latency_budget=latency_budget,
+    )
+    return session, pcm_format
+
+
+def _apply_stream_update(
+    processor: VoiceStreamProcessor, update: Dict[str, Any]
+) -> None:
+    if update.get("formant_shift") is not None:
+        processor.formant_shift = _formant_shift(update["formant_shift"])
+    if update.get("pitch_shift") is not None:
+        processor.pitch_shift = float(update["pitch_shift"])
+
+
+def _stream_settings(
+    processor: VoiceStreamProcessor, pcm_format: PcmFormat
+) -> Dict[str, Any]:
+    return {
+        "sample_rate": processor.sample_rate,
+        "format": pcm_format.value,
+        "pitch_shift": processor.pitch_shift,
+        "formant_shift": processor.formant_shift,
+        "n_fft": processor.n_fft,
+        "hop_length": processor.hop_length,
+        "latency_ms": processor.stats.algorithmic_latency_ms,
+    }
+
+
+async def _read_stream(
+    websocket: "WebSocket", backlog: asyncio.Queue, session: StreamSession
+) -> None:
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            break
+        session.last_active = time.monotonic()
+        if message.get("bytes") is not None:
+            await backlog.put(message["bytes"])
+        elif message.get("text") is not None:
+            await backlog.put(message["text"])
+    await backlog.put(None)
+
+
+def create_app(
+    db_path: Optional[str] = None,
+    diagnostics_path: Optional[str] = None,
+    max_concurrent_conversions: int = DEFAULT_MAX_CONCURRENT_CONVERSIONS,
+    max_stream_backlog: int = DEFAULT_MAX_STREAM_BACKLOG,
+    stream_scheduler: Optional[StreamScheduler] = None,
+) -> "FastAPI":
     if not FASTAPI_AVAILABLE:
         raise ImportError(
             "fastapi is required for the API server. "
@@ -24,11 +168,56 @@ def create_app(db_path: Optional[str] = None) -> "FastAPI":
 
     app = FastAPI(title="Voico API", version="0.1.0")
     store = ProfileStore(db_path) if db_path else ProfileStore()
+    if diagnostics_path:
+        set_diagnostic_sink(JsonlFileSink(diagnostics_path))
+    conversion_slots = asyncio.Semaphore(max_concurrent_conversions)
+    stream_scheduler = stream_scheduler or get_stream_scheduler()
+
+    @app.middleware("http")
+    async def record_request_metrics(request: Request, call_next):
+        t0 = time.perf_counter()
+        status = 500
+        with _HTTP_IN_FLIGHT.track():
+            try:
+                response = await call_next(request)
+                status = response.status_code
+                return response
+            finally:
+                path = _route_path(request)
+                _HTTP_REQUESTS.inc(
+                    method=request.method, path=path, status=str(status)
+                )
+                _HTTP_SECONDS.observe(
+                    time.perf_counter() - t0, method=request.method, path=path
+                )
 
     @app.get("/health")
     def health() -> dict:
         return {"status": "ok"}
 
+    @app.get("/metrics")
+    def metrics() -> PlainTextResponse:
+        return PlainTextResponse(
+            get_metrics_registry().render(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
+
+    @app.get("/trace")
+    def trace_status() -> dict:
+        return {"tracing": get_tracer() is not None}
+
+    @app.post("/trace/start")
+    def start_trace() -> dict:
+        if get_tracer() is None:
+            start_tracing()
+        return {"tracing": True}
+
+    @app.post("/trace/stop")
+    def stop_trace() -> dict:
+        tracer = stop_tracing()
+        if tracer is None:
+            raise HTTPException(status_code=409, detail="Tracing is not active")
+        return tracer.to_dict()
+
     @app.get("/profiles")
     def list_profiles() -> list:
         return store.list_profiles()
@@ -48,6 +237,13 @@ def create_app(db_path: Optional[str] = None) -> "FastAPI":
             "spectral_tilt": profile.spectral.spectral_tilt,
         }
 
+    @app.get("/profiles/{name}/nearest")
+    def nearest_profiles(name: str, k: int = 5) -> list:
+        profile = store.load(name)
+        if profile is None:
+            raise HTTPException(status_code=404, detail=f"Profile '{name}' not found")
+        return [asdict(match) for match in store.nearest(profile, k=k, exclude=[name])]
+
     @app.post("/profiles/{name}/analyze")
     async def analyze_and_save(
         name: str,
@@ -66,13 +262,17 @@ def create_app(db_path: Optional[str] = None) -> "FastAPI":
         try:
             from ..utils.audio_io import load_audio
             audio, sr = load_audio(tmp_path)
-            from ..core.config import QualitySettings
             settings = QualitySettings.from_preset(q)
-            from ..core.constants import AudioConstants
             n_fft = AudioConstants.DEFAULT_N_FFT
             hop_length = n_fft // settings.hop_divisor
-            builder = VoiceProfileBuilder(sr, n_fft=n_fft, hop_length=hop_length)
-            profile = builder.build(audio, name)
+            engine = VoiceAnalysisEngine(
+                sr,
+                n_fft=n_fft,
+                hop_length=hop_length,
+                resample_quality=settings.resample_quality,
+                formant_gating=settings.formant_gating,
+            )
+            profile = engine.build(audio, name)
             store.save(name, profile)
         finally:
             os.unlink(tmp_path)
@@ -84,6 +284,69 @@ def create_app(db_path: Optional[str] = None) -> "FastAPI":
             "saved": True,
         }
 
+    @app.post("/profiles/{name}/enroll")
+    async def enroll_profile(
+        name: str,
+        files: List[UploadFile] = File(...),
+        quality: str = Form(default="balanced"),
+    ) -> dict:
+        try:
+            q = ConversionQuality(quality)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid quality: {quality}")
+
+        tmp_paths = []
+        try:
+            for upload in files:
+                suffix = os.path.splitext(upload.filename or "")[1] or ".wav"
+                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+                    tmp.write(await upload.read())
+                    tmp_paths.append(tmp.name)
+
+            settings = QualitySettings.from_preset(q)
+            n_fft = AudioConstants.DEFAULT_N_FFT
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    functools.partial(
+                        enroll_files,
+                        tmp_paths,
+                        name,
+                        n_fft=n_fft,
+                        hop_length=n_fft // settings.hop_divisor,
+                        resample_quality=settings.resample_quality,
+                        formant_gating=settings.formant_gating,
+                        screening=settings.screening,
+                        store=store,
+                    ),
+                )
+            except ProfileQualityError as e:
+                raise HTTPException(
+                    status_code=422,
+                    detail={
+                        "message": e.message,
+                        "suggestions": e.recovery_suggestions,
+                    },
+                ) from e
+        finally:
+            for path in tmp_paths:
+                os.unlink(path)
+
+        filenames = {path: upload.filename for path, upload in zip(tmp_paths, files)}
+        reports = []
+        for report in result.files:
+            entry = asdict(report)
+            entry["path"] = filenames.get(report.path, report.path)
+            reports.append(entry)
+        return {
+            "name": name,
+            "sample_rate": result.profile.sample_rate,
+            "f0_mean": result.profile.pitch.f0_mean,
+            "voiced_seconds": result.voiced_seconds,
+            "files": reports,
+            "saved": True,
+        }
+
     @app.delete("/profiles/{name}")
     def delete_profile(name: str) -> dict:
         deleted = store.delete(name)
@@ -112,13 +375,23 @@ def create_app(db_path: Optional[str] = None) -> "FastAPI":
 
         try:
             converter = VoiceConverter(q)
-            converter.process(
-                input_path=input_path,
-                output_path=output_path,
-                pitch_shift=pitch_shift,
-                formant_shift=formant_shift,
-                bit_depth=bit_depth,
-            )
+            with _CONVERSIONS_QUEUED.track():
+                await conversion_slots.acquire()
+            try:
+                with _CONVERSIONS_IN_FLIGHT.track():
+                    await asyncio.get_running_loop().run_in_executor(
+                        None,
+                        functools.partial(
+                            converter.process,
+                            input_path=input_path,
+                            output_path=output_path,
+                            pitch_shift=pitch_shift,
+                            formant_shift=formant_shift,
+                            bit_depth=bit_depth,
+                        ),
+                    )
+            finally:
+                conversion_slots.release()
         finally:
             os.unlink(input_path)
 
@@ -129,4 +402,107 @@ def create_app(db_path: Optional[str] = None) -> "FastAPI":
             background=None,
         )
 
+    @app.websocket("/stream")
+    async def live_stream(websocket: WebSocket) -> None:
+        await websocket.accept()
+        try:
+            session, pcm_format = _open_stream(
+                stream_scheduler, await websocket.receive_json()
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            await websocket.send_json({"type": "error", "detail": str(e)})
+            await websocket.close(code=1008)
+            return
+
+        processor = session.processor
+        await websocket.send_json({
+            "type": "ready",
+            "session_id": session.session_id,
+            **_stream_settings(processor, pcm_format),
+        })
+        backlog: asyncio.Queue = asyncio.Queue(max_stream_backlog)
+        reader = asyncio.create_task(
+            _read_stream(websocket, backlog, session)
+        )
+        connected = True
+        expired = False
+        with _STREAM_CONNECTIONS.track():
+            try:
+                while True:
+                    message = await backlog.get()
+                    if message is None:
+                        connected = False
+                        break
+                    if isinstance(message, bytes):
+                        try:
+                            chunk = decode_pcm(message, pcm_format)
+                        except ValueError as e:
+                            await websocket.send_json(
+                                {"type": "error", "detail": str(e)}
+                            )
+                            continue
+                        try:
+                            output = await stream_scheduler.submit(
+                                session.session_id, chunk
+                            )
+                        except KeyError:
+                            expired = True
+                            break
+                        if output.size:
+                            await websocket.send_bytes(
+                                encode_pcm(output, pcm_format)
+                            )
+                        continue
+
+                    try:
+                        command = json.loads(message)
+                        kind = command.get("type")
+                        if kind == "update":
+                            _apply_stream_update(processor, command)
+                    except (AttributeError, TypeError, ValueError) as e:
+                        await websocket.send_json(
+                            {"type": "error", "detail": str(e)}
+                        )
+                        continue
+                    if kind == "update":
+                        await websocket.send_json({
+                            "type": "updated",
+                            **_stream_settings(processor, pcm_format),
+                        })
+                    elif kind == "stats":
+                        await websocket.send_json({
+                            "type": "stats",
+                            "backlog": backlog.qsize(),
+                            **processor.stats.as_dict(),
+                        })
+                    elif kind == "stop":
+                        break
+                    else:
+                        await websocket.send_json({
+                            "type": "error",
+                            "detail": f"Unknown message type: {kind}",
+                        })
+            finally:
+                reader.cancel()
+                final = None
+                with suppress(KeyError):
+                    final = await stream_scheduler.aclose_session(
+                        session.session_id
+                    )
+
+            if not connected:
+                return
+            if expired:
+                await websocket.send_json(
+                    {"type": "error", "detail": "session expired"}
+                )
+                await websocket.close(code=1008)
+                return
+            if final is not None and final.size:
+                await websocket.send_bytes(encode_pcm(final, pcm_format))
+            await websocket.send_json(
+                {"type": "stats", "backlog": 0, **processor.stats.as_dict()}
+            )
+            await websocket.close()
+
     return app
@@ -23,12 +23,38 @@ from .dsp.phase import PhaseProcessor
 from .dsp.shifter import SpectralProcessor
 from .matching.matcher import VoiceMatcher
 from .quality.diagnostic import DiagnosticLogger
+from .quality.metrics import MetricsEngine
 from .quality.quality_score import QualityScorer
+from .quality.screening import screen_audio
 from .stream.streamer import VoiceStreamProcessor
 from .utils.audio_io import load_audio, normalize_audio, save_audio
+from .utils.telemetry import get_metrics_registry
+from .utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
+_CONVERSIONS = get_metrics_registry().counter(
+    "voico_conversions",
+    "Completed file conversions by quality preset and outcome.",
+    ("preset", "outcome"),
+)
+_CONVERSION_SECONDS = get_metrics_registry().histogram(
+    "voico_conversion_seconds",
+    "End-to-end file conversion latency.",
+    ("preset",),
+)
+_STAGE_SECONDS = get_metrics_registry().histogram(
+    "voico_stage_seconds",
+    "Pipeline stage latency.",
+    ("preset", "stage"),
+)
+_REALTIME_FACTOR = get_metrics_registry().histogram(
+    "voico_realtime_factor",
+    "Processing time divided by input audio duration.",
+    ("preset",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 4.0, 8.0),
+)
+
 ProgressCallback = Callable[[str, float], None]
 
 
@@ -45,12 +71,15 @@ class PipelineContext:
     hop_length: int
     settings: QualitySettings
     audio: Optional[np.ndarray] = None
+    source_audio: Optional[np.ndarray] = None
     sample_rate: Optional[int] = None
     output_audio: Optional[np.ndarray] = None
     input_duration: float = 0.0
     output_duration: float = 0.0
     snr_db: float = 0.0
     spectral_centroid_deviation: float = 0.0
+    metrics: Dict[str, float] = field(default_factory=dict)
+    target_magnitude: Optional[np.ndarray] = None
     stages_timing: Dict[str, float] = field(default_factory=dict)
     source_profile: Optional[object] = None
     target_profile: Optional[object] = None
@@ -63,30 +92,6 @@ def _emit(ctx: PipelineContext, step: str, fraction: float) -> None:
         ctx.on_progress(step, fraction)
 
 
-def _compute_snr(original: np.ndarray, processed: np.ndarray) -> float:
-    n = min(len(original), len(processed))
-    if n == 0:
-        return 0.0
-    orig = original[:n].astype(np.float64)
-    proc = processed[:n].astype(np.float64)
-    signal_power = np.mean(orig ** 2)
-    noise_power = np.mean((orig - proc) ** 2)
-    if noise_power < 1e-10:
-        return 60.0
-    return float(10.0 * np.log10(max(signal_power / noise_power, 1e-10)))
-
-
-def _compute_spectral_centroid(audio: np.ndarray, sr: int, n_fft: int) -> float:
-    if len(audio) < n_fft:
-        return 0.0
-    spectrum = np.abs(np.fft.rfft(audio[:n_fft]))
-    freqs = np.fft.rfftfreq(n_fft, 1.0 / sr)
-    total = np.sum(spectrum)
-    if total < 1e-10:
-        return 0.0
-    return float(np.sum(freqs * spectrum) / total)
-
-
 class LoadStage:
     def execute(self, ctx: PipelineContext) -> PipelineContext:
         t0 = time.perf_counter()
@@ -94,6 +99,7 @@ class LoadStage:
         logger.info(f"Loading source: {ctx.input_path}")
         try:
             audio, sample_rate = load_audio(ctx.input_path)
+            ctx.source_audio = audio
             ctx.audio = normalize_audio(audio)
             ctx.sample_rate = sample_rate
             ctx.input_duration = len(ctx.audio) / sample_rate
@@ -117,6 +123,42 @@ class LoadStage:
         return ctx
 
 
+class ScreeningStage:
+    def execute(self, ctx: PipelineContext) -> PipelineContext:
+        thresholds = ctx.settings.screening
+        source_audio = ctx.source_audio if ctx.source_audio is not None else ctx.audio
+        ctx.source_audio = None
+        if thresholds is None:
+            return ctx
+        t0 = time.perf_counter()
+        report = screen_audio(source_audio, ctx.sample_rate, thresholds)
+
+        if ctx.diagnostic_logger:
+            ctx.diagnostic_logger.log_event(
+                "screening",
+                "input_screened",
+                {
+                    "rms_db": report.rms_db,
+                    "crest_factor_db": report.crest_factor_db,
+                    "zero_crossing_rate": report.zero_crossing_rate,
+                    "clipping_ratio": report.clipping_ratio,
+                    "voiced_ratio": report.voiced_ratio,
+                }
+            )
+            ctx.diagnostic_logger.log_validation(
+                "screening", report.passed, report.issues
+            )
+
+        if not report.passed:
+            error_msg = f"Input rejected by screening: {'; '.join(report.issues)}"
+            if ctx.diagnostic_logger:
+                ctx.diagnostic_logger.log_error(error_msg, "screening")
+            raise ProfileQualityError(error_msg, report.recommendations)
+
+        ctx.stages_timing["screening"] = time.perf_counter() - t0
+        return ctx
+
+
 class AnalysisStage:
     def __init__(self, profile_engine: VoiceAnalysisEngine, n_fft: int, hop_length: int):
         self._engine = profile_engine
@@ -179,8 +221,30 @@ class MatchingStage:
         try:
             logger.info(f"Loading target for matching: {ctx.target_path}")
             target_audio, target_sr = load_audio(ctx.target_path)
-            target_engine = VoiceAnalysisEngine(target_sr, self._n_fft, self._hop_length)
-            ctx.target_profile = target_engine.build(target_audio, "Target")
+            target_engine = VoiceAnalysisEngine(
+                target_sr,
+                self._n_fft,
+                self._hop_length,
+                resample_quality=self._engine.resample_quality,
+                formant_gating=self._engine.formant_gating,
+                pitch_workers=self._engine.pitch_workers,
+            )
+            excerpt_seconds = ctx.settings.target_excerpt_seconds
+            if excerpt_seconds is None:
+                ctx.target_profile = target_engine.build(target_audio, "Target")
+            else:
+                lite = target_engine.build_lite(
+                    target_audio, "Target", max_seconds=excerpt_seconds
+                )
+                ctx.target_profile = lite.profile
+                logger.info(
+                    f"Target lite profile: {lite.analyzed_seconds:.1f}s of "
+                    f"{lite.source_seconds:.1f}s, confidence {lite.confidence:.2f}"
+                )
+                if ctx.diagnostic_logger:
+                    ctx.diagnostic_logger.log_quality_score(
+                        "target_profile_confidence", lite.confidence
+                    )
 
             target_quality = self._quality_scorer.score_profile(ctx.target_profile)
             if ctx.diagnostic_logger:
@@ -219,7 +283,9 @@ class ShiftingStage:
         t0 = time.perf_counter()
         _emit(ctx, "Shifting pitch", 0.4)
         logger.info(f"Applying: Pitch={ctx.pitch_shift:.2f}st, Formant={ctx.formant_shift:.2f}x")
-        processor = SpectralProcessor(ctx.sample_rate, ctx.n_fft)
+        processor = SpectralProcessor(
+            ctx.sample_rate, ctx.n_fft, ctx.settings.resample_quality
+        )
         pitch_shifted = processor.shift_pitch(ctx.audio, ctx.pitch_shift)
 
         if abs(ctx.formant_shift - 1.0) > 0.01:
@@ -234,6 +300,7 @@ class ShiftingStage:
             magnitude = np.abs(stft_matrix)
             phase_angles = np.angle(stft_matrix)
             shifted_magnitude = processor.shift_formants(magnitude, ctx.formant_shift)
+            ctx.target_magnitude = shifted_magnitude
 
             if ctx.settings.use_advanced_phase:
                 logger.info("Reconstructing phase...")
@@ -262,17 +329,40 @@ class ShiftingStage:
 
 
 class MetricsStage:
+    def __init__(self, profile_engine: VoiceAnalysisEngine):
+        self._engine = profile_engine
+
     def execute(self, ctx: PipelineContext) -> PipelineContext:
         t0 = time.perf_counter()
-        ctx.snr_db = _compute_snr(ctx.audio, ctx.output_audio)
-        in_centroid = _compute_spectral_centroid(ctx.audio, ctx.sample_rate, ctx.n_fft)
-        out_centroid = _compute_spectral_centroid(ctx.output_audio, ctx.sample_rate, ctx.n_fft)
-        if in_centroid > 1e-10:
-            ctx.spectral_centroid_deviation = abs(out_centroid - in_centroid) / in_centroid
+        metrics_engine = MetricsEngine(
+            ctx.sample_rate, ctx.n_fft, ctx.hop_length, ctx.settings.metrics
+        )
+        reference_magnitude = None
+        if metrics_engine.needs_spectrograms and (
+            self._engine.sample_rate == ctx.sample_rate
+            and self._engine.n_fft == ctx.n_fft
+            and self._engine.hop_length == ctx.hop_length
+        ):
+            reference_magnitude = self._engine.spectral_analyzer.stft_magnitude(
+                ctx.audio
+            )
+        result = metrics_engine.compute(
+            ctx.audio,
+            ctx.output_audio,
+            reference_magnitude=reference_magnitude,
+            target_magnitude=ctx.target_magnitude,
+            pitch_shift=ctx.pitch_shift,
+        )
+        ctx.metrics = result.as_dict()
+        ctx.target_magnitude = None
+        if result.snr_db is not None:
+            ctx.snr_db = result.snr_db
+        if result.spectral_centroid_deviation is not None:
+            ctx.spectral_centroid_deviation = result.spectral_centroid_deviation
 
         if ctx.diagnostic_logger:
-            ctx.diagnostic_logger.log_quality_score("snr_db", ctx.snr_db)
-            ctx.diagnostic_logger.log_quality_score("spectral_centroid_deviation", ctx.spectral_centroid_deviation)
+            for name, value in ctx.metrics.items():
+                ctx.diagnostic_logger.log_quality_score(name, value)
 
         ctx.stages_timing["metrics"] = time.perf_counter() - t0
         return ctx
@@ -315,15 +405,31 @@ class Pipeline:
 
     def run(self, ctx: PipelineContext) -> PipelineContext:
         for stage in self._stages:
-            ctx = stage.execute(ctx)
+            with span(type(stage).__name__, "pipeline"):
+                ctx = stage.execute(ctx)
         return ctx
 
 
+def _record_conversion(
+    ctx: PipelineContext, preset: str, outcome: str, elapsed: float
+) -> None:
+    _CONVERSIONS.inc(preset=preset, outcome=outcome)
+    for stage, seconds in ctx.stages_timing.items():
+        _STAGE_SECONDS.observe(seconds, preset=preset, stage=stage)
+    if outcome != "success":
+        return
+    _CONVERSION_SECONDS.observe(elapsed, preset=preset)
+    if ctx.input_duration > 0:
+        _REALTIME_FACTOR.observe(elapsed / ctx.input_duration, preset=preset)
+
+
 class VoiceConverter:
     def __init__(
         self,
         quality: ConversionQuality = ConversionQuality.BALANCED,
+        pitch_workers: int = 1,
     ) -> None:
+        self.quality = quality
         self.settings = QualitySettings.from_preset(quality)
         self.n_fft = AudioConstants.DEFAULT_N_FFT
         self.hop_length = self.n_fft // self.settings.hop_divisor
@@ -331,6 +437,9 @@ class VoiceConverter:
             sample_rate=44100,
             n_fft=self.n_fft,
             hop_length=self.hop_length,
+            resample_quality=self.settings.resample_quality,
+            formant_gating=self.settings.formant_gating,
+            pitch_workers=pitch_workers,
         )
         self.phase_processor = PhaseProcessor(self.n_fft, self.hop_length)
 
@@ -368,23 +477,33 @@ class VoiceConverter:
             diagnostic_logger=diagnostic_logger,
         )
 
+        preset = self.quality.value
+        outcome = "error"
+        t0 = time.perf_counter()
         try:
             pipeline = Pipeline([
                 LoadStage(),
+                ScreeningStage(),
                 AnalysisStage(self.profile_engine, self.n_fft, self.hop_length),
                 MatchingStage(self.profile_engine, self.n_fft, self.hop_length),
                 ShiftingStage(self.phase_processor),
-                MetricsStage(),
+                MetricsStage(self.profile_engine),
                 OutputStage(),
             ])
-            ctx = pipeline.run(ctx)
-        except (FileNotFoundError, AnalysisError, ProfileQualityError):
+            with span("VoiceConverter.process", "pipeline", input=input_path):
+                ctx = pipeline.run(ctx)
+            outcome = "success"
+        except (FileNotFoundError, AnalysisError):
+            raise
+        except ProfileQualityError:
+            outcome = "rejected"
             raise
         except Exception as e:
             diagnostic_logger.log_error(str(e), "pipeline")
             raise ConversionError(f"Conversion failed: {e}") from e
         finally:
             diagnostic_logger.finalize()
+            _record_conversion(ctx, preset, outcome, time.perf_counter() - t0)
 
         return ConversionReport(
             output_path=output_path,
@@ -396,6 +515,7 @@ class VoiceConverter:
             snr_db=ctx.snr_db,
             spectral_centroid_deviation=ctx.spectral_centroid_deviation,
             stages_timing=ctx.stages_timing,
+            metrics=ctx.metrics,
         )
 
     def process_batch(
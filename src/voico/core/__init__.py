@@ -1,4 +1,13 @@
-from .config import ConversionQuality, QualitySettings
+from .config import (
+    ConversionQuality,
+    FormantGating,
+    LatencyBudget,
+    PcmFormat,
+    QualityMetric,
+    QualitySettings,
+    ResampleQuality,
+    ScreeningThresholds,
+)
 from .constants import AudioConstants
 from .errors import (
     AnalysisError,
@@ -14,7 +23,14 @@ from .protocols import (
     ShifterProtocol,
     SpectralAnalyzerProtocol,
 )
-from .types import ConversionReport, FormantTrack, PitchContour, SpectralFeatures, VoiceProfile
+from .types import (
+    ConversionReport,
+    FormantTrack,
+    LiteProfile,
+    PitchContour,
+    SpectralFeatures,
+    VoiceProfile,
+)
 
 __all__ = [
     "AnalysisError",
@@ -25,11 +41,18 @@ __all__ = [
     "ConversionQuality",
     "ConversionReport",
     "FormantAnalyzerProtocol",
+    "FormantGating",
     "FormantTrack",
+    "LatencyBudget",
+    "LiteProfile",
+    "PcmFormat",
     "PhaseProcessorProtocol",
     "PitchAnalyzerProtocol",
     "PitchContour",
+    "QualityMetric",
     "QualitySettings",
+    "ResampleQuality",
+    "ScreeningThresholds",
     "ShifterProtocol",
     "SpectralAnalyzerProtocol",
     "SpectralFeatures",
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import FrozenSet, Optional
 
 from pydantic import BaseModel, field_validator
 
@@ -12,6 +13,92 @@ class ConversionQuality(Enum):
     MASTER = "master"
 
 
+class ResampleQuality(Enum):
+    FAST = "fast"
+    STANDARD = "standard"
+    HIGH = "high"
+
+
+class FormantGating(Enum):
+    NONE = "none"
+    INTERPOLATE = "interpolate"
+    MISSING = "missing"
+
+
+class PcmFormat(Enum):
+    FLOAT32 = "f32le"
+    INT16 = "s16le"
+
+
+class QualityMetric(Enum):
+    SNR = "snr"
+    CENTROID_DEVIATION = "centroid_deviation"
+    LOG_SPECTRAL_DISTANCE = "log_spectral_distance"
+    SPECTRAL_CONVERGENCE = "spectral_convergence"
+    PITCH_ACCURACY = "pitch_accuracy"
+
+
+CHEAP_METRICS = frozenset({QualityMetric.SNR, QualityMetric.CENTROID_DEVIATION})
+
+
+class ScreeningThresholds(BaseModel):
+    min_duration_seconds: float = 0.25
+    min_rms_db: float = -60.0
+    min_crest_factor_db: float = 2.0
+    max_crest_factor_db: float = 40.0
+    max_zero_crossing_rate: float = 0.35
+    max_clipping_ratio: float = 0.01
+    min_voiced_ratio: float = 0.1
+
+    model_config = {"frozen": True}
+
+    @field_validator(
+        "max_zero_crossing_rate", "max_clipping_ratio", "min_voiced_ratio"
+    )
+    @classmethod
+    def ratio_in_range(cls, v: float) -> float:
+        if not (0.0 <= v <= 1.0):
+            raise ValueError(f"ratio thresholds must be in [0, 1], got {v}")
+        return v
+
+    @field_validator("min_duration_seconds")
+    @classmethod
+    def min_duration_non_negative(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError(f"min_duration_seconds must be >= 0, got {v}")
+        return v
+
+
+class LatencyBudget(BaseModel):
+    target_ms: float = 40.0
+    max_pitch_shift: float = 12.0
+    min_n_fft: int = 256
+    max_n_fft: int = 4096
+
+    model_config = {"frozen": True}
+
+    @field_validator("target_ms")
+    @classmethod
+    def target_ms_positive(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError(f"target_ms must be > 0, got {v}")
+        return v
+
+    @field_validator("max_pitch_shift")
+    @classmethod
+    def max_pitch_shift_non_negative(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError(f"max_pitch_shift must be >= 0, got {v}")
+        return v
+
+    @field_validator("min_n_fft", "max_n_fft")
+    @classmethod
+    def n_fft_power_of_two(cls, v: int) -> int:
+        if v < 16 or v & (v - 1):
+            raise ValueError(f"n_fft bounds must be powers of two >= 16, got {v}")
+        return v
+
+
 class QualitySettings(BaseModel):
     hop_divisor: int
     griffin_lim_iters: int
@@ -20,6 +107,11 @@ class QualitySettings(BaseModel):
     spectral_detail_preservation: float
     use_advanced_phase: bool
     use_formant_correction: bool
+    resample_quality: ResampleQuality
+    formant_gating: FormantGating
+    target_excerpt_seconds: Optional[float] = None
+    screening: Optional[ScreeningThresholds] = ScreeningThresholds()
+    metrics: FrozenSet[QualityMetric] = frozenset(QualityMetric)
 
     model_config = {"frozen": True}
 
@@ -51,6 +143,17 @@ class QualitySettings(BaseModel):
             raise ValueError(f"spectral_detail_preservation must be in [0, 1], got {v}")
         return v
 
+    @field_validator("target_excerpt_seconds")
+    @classmethod
+    def target_excerpt_seconds_positive(
+        cls, v: Optional[float]
+    ) -> Optional[float]:
+        if v is not None and v <= 0:
+            raise ValueError(
+                f"target_excerpt_seconds must be > 0 or None, got {v}"
+            )
+        return v
+
     @classmethod
     def from_preset(cls, quality: ConversionQuality) -> "QualitySettings":
         presets = {
@@ -62,6 +165,10 @@ class QualitySettings(BaseModel):
                 spectral_detail_preservation=0.15,
                 use_advanced_phase=False,
                 use_formant_correction=False,
+                resample_quality=ResampleQuality.FAST,
+                formant_gating=FormantGating.INTERPOLATE,
+                target_excerpt_seconds=15.0,
+                metrics=CHEAP_METRICS,
             ),
             ConversionQuality.FAST: cls(
                 hop_divisor=4,
@@ -71,6 +178,10 @@ class QualitySettings(BaseModel):
                 spectral_detail_preservation=0.2,
                 use_advanced_phase=False,
                 use_formant_correction=True,
+                resample_quality=ResampleQuality.FAST,
+                formant_gating=FormantGating.INTERPOLATE,
+                target_excerpt_seconds=20.0,
+                metrics=CHEAP_METRICS,
             ),
             ConversionQuality.BALANCED: cls(
                 hop_divisor=4,
@@ -80,6 +191,9 @@ class QualitySettings(BaseModel):
                 spectral_detail_preservation=0.3,
                 use_advanced_phase=True,
                 use_formant_correction=True,
+                resample_quality=ResampleQuality.STANDARD,
+                formant_gating=FormantGating.INTERPOLATE,
+                target_excerpt_seconds=30.0,
             ),
             ConversionQuality.HIGH: cls(
                 hop_divisor=4,
@@ -89,6 +203,9 @@ class QualitySettings(BaseModel):
                 spectral_detail_preservation=0.4,
                 use_advanced_phase=True,
                 use_formant_correction=True,
+                resample_quality=ResampleQuality.STANDARD,
+                formant_gating=FormantGating.INTERPOLATE,
+                target_excerpt_seconds=45.0,
             ),
             ConversionQuality.ULTRA: cls(
                 hop_divisor=8,
@@ -98,6 +215,9 @@ class QualitySettings(BaseModel):
                 spectral_detail_preservation=0.5,
                 use_advanced_phase=True,
                 use_formant_correction=True,
+                resample_quality=ResampleQuality.HIGH,
+                formant_gating=FormantGating.NONE,
+                target_excerpt_seconds=None,
             ),
             ConversionQuality.MASTER: cls(
                 hop_divisor=8,
@@ -107,6 +227,9 @@ class QualitySettings(BaseModel):
                 spectral_detail_preservation=0.6,
                 use_advanced_phase=True,
                 use_formant_correction=True,
+                resample_quality=ResampleQuality.HIGH,
+                formant_gating=FormantGating.NONE,
+                target_excerpt_seconds=None,
             ),
         }
         return presets[quality]
@@ -9,6 +9,7 @@ class AudioConstants:
     FORMANT_ANALYSIS_SR = 10000
     LPC_ORDER_LOW_PITCH = 16
     PITCH_THRESHOLD_LOW = 120.0
+    FORMANT_GATE_THRESHOLD_DB = -40.0
 
     EPSILON = 1e-10
 
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
 import numpy as np
 
@@ -11,6 +11,7 @@ class PitchContour:
     f0_mean: float
     f0_std: float
     harmonic_to_noise_ratio: float
+    hnr_contour: Optional[np.ndarray] = None
 
 
 @dataclass
@@ -37,6 +38,15 @@ class VoiceProfile:
     sample_rate: int
 
 
+@dataclass
+class LiteProfile:
+    profile: VoiceProfile
+    confidence: float
+    analyzed_seconds: float
+    source_seconds: float
+    excerpt_count: int
+
+
 @dataclass
 class ConversionReport:
     output_path: str
@@ -48,3 +58,4 @@ class ConversionReport:
     snr_db: float
     spectral_centroid_deviation: float
     stages_timing: Dict[str, float]
+    metrics: Dict[str, float] = field(default_factory=dict)
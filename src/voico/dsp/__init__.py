@@ -1,7 +1,10 @@
 from .phase import PhaseProcessor
+from .resampler import Resampler, resample
 from .shifter import SpectralProcessor
 
 __all__ = [
     "PhaseProcessor",
+    "Resampler",
     "SpectralProcessor",
+    "resample",
 ]
@@ -5,6 +5,7 @@ import numpy as np
 import scipy.signal
 
 from ..backends import LIBROSA_AVAILABLE
+from ..utils.tracing import span, traced
 
 if LIBROSA_AVAILABLE:
     import librosa
@@ -19,6 +20,7 @@ class PhaseProcessor:
         self.n_fft = n_fft
         self.hop_length = hop_length
 
+    @traced("PhaseProcessor.reconstruct", "dsp")
     def reconstruct(
         self,
         magnitude: np.ndarray,
@@ -38,6 +40,7 @@ class PhaseProcessor:
             )
         return self._griffin_lim_native(magnitude, n_iter, initial_phase)
 
+    @traced("PhaseProcessor.reconstruct_rtpghi", "dsp")
     def reconstruct_rtpghi(self, magnitude: np.ndarray) -> np.ndarray:
         n_bins, n_frames = magnitude.shape
         gamma = _RTPGHI_GAMMA_SCALE * (self.hop_length ** 2) / self.n_fft
@@ -77,11 +80,12 @@ class PhaseProcessor:
             random_phase = 2 * np.pi * np.random.random(magnitude.shape)
             stft_matrix = magnitude * np.exp(1j * random_phase)
 
-        for _ in range(n_iter):
-            audio = self._inverse_stft(stft_matrix)
-            stft_matrix = self._forward_stft(audio)
-            phase = np.angle(stft_matrix)
-            stft_matrix = magnitude * np.exp(1j * phase)
+        for i in range(n_iter):
+            with span("griffin_lim_iteration", "dsp", iteration=i):
+                audio = self._inverse_stft(stft_matrix)
+                stft_matrix = self._forward_stft(audio)
+                phase = np.angle(stft_matrix)
+                stft_matrix = magnitude * np.exp(1j * phase)
 
         return self._inverse_stft(stft_matrix)
 
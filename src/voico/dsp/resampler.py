@@ -0,0 +1,153 @@
+import logging
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
+from scipy.signal import firwin, resample_poly
+
+from ..core.config import ResampleQuality
+
+logger = logging.getLogger(__name__)
+
+_MAX_RATIO_TERM = 1000
+
+_FILTER_SPECS: Dict[ResampleQuality, Tuple[int, float, float]] = {
+    ResampleQuality.FAST: (8, 5.0, 0.90),
+    ResampleQuality.STANDARD: (16, 8.0, 0.94),
+    ResampleQuality.HIGH: (32, 10.0, 0.97),
+}
+
+
+def rational_ratio(orig_sr: float, target_sr: float) -> Tuple[int, int]:
+    if orig_sr <= 0 or target_sr <= 0:
+        raise ValueError(
+            f"Sample rates must be > 0, got {orig_sr} -> {target_sr}"
+        )
+    ratio = (Fraction(target_sr) / Fraction(orig_sr)).limit_denominator(
+        _MAX_RATIO_TERM
+    )
+    return ratio.numerator, ratio.denominator
+
+
+@lru_cache(maxsize=64)
+def design_filter(
+    up: int, down: int, quality: ResampleQuality
+) -> np.ndarray:
+    zero_crossings, beta, rolloff = _FILTER_SPECS[quality]
+    max_rate = max(up, down)
+    half_length = zero_crossings * max_rate
+    logger.debug(
+        f"Designing {2 * half_length + 1}-tap resampling filter "
+        f"for {up}/{down} ({quality.value})"
+    )
+    taps = firwin(
+        2 * half_length + 1, rolloff / max_rate, window=("kaiser", beta)
+    )
+    taps.setflags(write=False)
+    return taps
+
+
+@lru_cache(maxsize=64)
+def _polyphase_bank(
+    up: int, down: int, quality: ResampleQuality
+) -> np.ndarray:
+    taps = design_filter(up, down, quality) * up
+    n_taps = -(-len(taps) // up)
+    padded = np.zeros(n_taps * up)
+    padded[: len(taps)] = taps
+    bank = padded.reshape(n_taps, up).T.copy()
+    bank.setflags(write=False)
+    return bank
+
+
+def resample(
+    audio: np.ndarray,
+    orig_sr: float,
+    target_sr: float,
+    quality: ResampleQuality = ResampleQuality.STANDARD,
+) -> np.ndarray:
+    up, down = rational_ratio(orig_sr, target_sr)
+    if up == down:
+        return audio
+    resampled = resample_poly(
+        audio, up, down, window=design_filter(up, down, quality)
+    )
+    if np.issubdtype(audio.dtype, np.floating):
+        return resampled.astype(audio.dtype, copy=False)
+    return resampled
+
+
+class Resampler:
+    def __init__(
+        self,
+        orig_sr: float,
+        target_sr: float,
+        quality: ResampleQuality = ResampleQuality.STANDARD,
+    ):
+        self.up, self.down = rational_ratio(orig_sr, target_sr)
+        self.quality = quality
+        self._bank = _polyphase_bank(self.up, self.down, quality)
+        self._n_taps = self._bank.shape[1]
+        self._delay = (len(design_filter(self.up, self.down, quality)) - 1) // 2
+        self._tap_offsets = np.arange(self._n_taps)
+        self.reset()
+
+    @property
+    def latency_samples(self) -> int:
+        return -(-self._delay // self.up)
+
+    def reset(self) -> None:
+        self._history = np.zeros(self._n_taps - 1)
+        self._history_start = -(self._n_taps - 1)
+        self._consumed = 0
+        self._produced = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        if self.up == self.down:
+            return np.asarray(chunk, dtype=np.float32)
+        chunk = np.asarray(chunk, dtype=np.float64)
+        self._history = np.concatenate([self._history, chunk])
+        self._consumed += len(chunk)
+        return self._drain(self._consumed)
+
+    def flush(self) -> np.ndarray:
+        if self.up == self.down:
+            return np.zeros(0, dtype=np.float32)
+        total = -(-self._consumed * self.up // self.down)
+        if total <= self._produced:
+            self.reset()
+            return np.zeros(0, dtype=np.float32)
+
+        last_input = ((total - 1) * self.down + self._delay) // self.up
+        padding = max(0, last_input + 1 - self._consumed)
+        self._history = np.concatenate([self._history, np.zeros(padding)])
+        output = self._drain(self._consumed + padding, limit=total)
+        self.reset()
+        return output
+
+    def _drain(self, available: int, limit: int = -1) -> np.ndarray:
+        end = (available * self.up - 1 - self._delay) // self.down + 1
+        if limit >= 0:
+            end = min(end, limit)
+        start = self._produced
+        if end <= start:
+            return np.zeros(0, dtype=np.float32)
+
+        positions = np.arange(start, end) * self.down + self._delay
+        newest = positions // self.up - self._history_start
+        indices = newest[:, np.newaxis] - self._tap_offsets
+        output = np.einsum(
+            "ij,ij->i", self._bank[positions % self.up], self._history[indices]
+        )
+        self._produced = end
+
+        next_oldest = (
+            (end * self.down + self._delay) // self.up
+            - (self._n_taps - 1)
+            - self._history_start
+        )
+        if next_oldest > 0:
+            self._history = self._history[next_oldest:]
+            self._history_start += next_oldest
+        return output.astype(np.float32)
@@ -4,7 +4,10 @@ import numpy as np
 from scipy.ndimage import map_coordinates
 
 from ..backends import LIBROSA_AVAILABLE
+from ..core.config import ResampleQuality
 from ..core.constants import AudioConstants
+from ..utils.tracing import traced
+from .resampler import resample
 
 if LIBROSA_AVAILABLE:
     import librosa
@@ -13,27 +16,42 @@ logger = logging.getLogger(__name__)
 
 
 class SpectralProcessor:
-    def __init__(self, sample_rate: int, n_fft: int):
+    def __init__(
+        self,
+        sample_rate: int,
+        n_fft: int,
+        resample_quality: ResampleQuality = ResampleQuality.STANDARD,
+    ):
         self.sample_rate = sample_rate
         self.n_fft = n_fft
+        self.resample_quality = resample_quality
         self.frequency_bins = np.fft.rfftfreq(n_fft, 1 / sample_rate)
 
+    @traced("SpectralProcessor.shift_pitch", "dsp")
     def shift_pitch(self, audio: np.ndarray, semitones: float) -> np.ndarray:
         if abs(semitones) < 0.01:
             return audio
 
+        factor = 2 ** (semitones / 12.0)
+
         if LIBROSA_AVAILABLE:
-            return librosa.effects.pitch_shift(
-                audio, sr=self.sample_rate, n_steps=semitones
+            stretched = librosa.effects.time_stretch(audio, rate=1.0 / factor)
+            shifted = resample(
+                stretched,
+                self.sample_rate * factor,
+                self.sample_rate,
+                self.resample_quality,
             )
+            return librosa.util.fix_length(shifted, size=len(audio))
 
-        factor = 2 ** (semitones / 12.0)
-        return np.interp(
-            np.arange(0, len(audio), factor),
-            np.arange(len(audio)),
+        return resample(
             audio,
-        ).astype(audio.dtype)
+            self.sample_rate * factor,
+            self.sample_rate,
+            self.resample_quality,
+        )
 
+    @traced("SpectralProcessor.shift_formants", "dsp")
     def shift_formants(
         self, magnitude: np.ndarray, shift_factor: float
     ) -> np.ndarray:
@@ -4,11 +4,15 @@ import os
 import sys
 from pathlib import Path
 
+from .analysis.enrollment import EnrollmentResult, enroll_files
 from .converter import VoiceConverter
-from .core.config import ConversionQuality
+from .core.config import ConversionQuality, QualitySettings
+from .core.constants import AudioConstants
 from .core.errors import ProfileQualityError, ValidationError, VoicoError
-from .quality.diagnostic import DiagnosticLogger
+from .quality.diagnostic import DiagnosticLogger, EventLevel, JsonlFileSink
+from .store.profile_store import ProfileStore
 from .utils.audio_io import get_audio_info
+from .utils.tracing import tracing
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,11 @@ def parse_args() -> argparse.Namespace:
         "input_file",
         help="Path to input audio file (Source Voice)",
     )
+    parser.add_argument(
+        "extra_files",
+        nargs="*",
+        help="Additional audio files (only used with --enroll)",
+    )
     parser.add_argument(
         "-t",
         "--target",
@@ -78,6 +87,39 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Display audio file info and exit",
     )
+    parser.add_argument(
+        "--enroll",
+        metavar="NAME",
+        default=None,
+        help="Build and store a voice profile NAME from all input files",
+    )
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="Profile database path used by --enroll",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Worker processes for --enroll (default: one per CPU) and for "
+            "pitch tracking of long inputs during conversion (default: 1)"
+        ),
+    )
+    parser.add_argument(
+        "--diagnostics",
+        metavar="PATH",
+        default=None,
+        help="Append diagnostic events to a JSON Lines file",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        default=None,
+        help="Write a Chrome/Perfetto trace of the run to a JSON file",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -108,10 +150,75 @@ def print_audio_info(path: str) -> None:
         print(f"Subtype:     {subtype}")
 
 
+def print_enrollment_report(result: EnrollmentResult) -> None:
+    for report in result.files:
+        if report.error is not None:
+            print(f"  ✗ {report.path}: {report.error}")
+            continue
+        mark = "✓" if report.is_viable else "✗"
+        print(
+            f"  {mark} {report.path}: {report.quality_score:.1f}/100, "
+            f"{report.voiced_seconds:.1f}s voiced"
+        )
+    print(
+        f"Enrolled '{result.name}' from {len(result.accepted)}/"
+        f"{len(result.files)} files ({result.voiced_seconds:.1f}s voiced), "
+        f"mean F0 {result.profile.pitch.f0_mean:.1f}Hz"
+    )
+
+
+def run_enrollment(args: argparse.Namespace) -> None:
+    paths = [args.input_file, *args.extra_files]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        logger.error(f"Input files not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    settings = QualitySettings.from_preset(ConversionQuality(args.quality))
+    n_fft = AudioConstants.DEFAULT_N_FFT
+    store = ProfileStore(args.db) if args.db else ProfileStore()
+    try:
+        result = enroll_files(
+            paths,
+            args.enroll,
+            n_fft=n_fft,
+            hop_length=n_fft // settings.hop_divisor,
+            resample_quality=settings.resample_quality,
+            formant_gating=settings.formant_gating,
+            screening=settings.screening,
+            n_workers=args.workers,
+            store=store,
+        )
+    except ProfileQualityError as e:
+        logger.error(f"Enrollment failed: {e.message}")
+        for suggestion in e.recovery_suggestions:
+            logger.error(f"  • {suggestion}")
+        sys.exit(1)
+    print_enrollment_report(result)
+
+
 def main() -> None:
     args = parse_args()
     setup_logging(args.verbose)
 
+    if args.trace:
+        try:
+            with tracing(args.trace):
+                run(args)
+        finally:
+            logger.info(f"Trace written to {args.trace}")
+        return
+    run(args)
+
+
+def run(args: argparse.Namespace) -> None:
+    if args.enroll:
+        run_enrollment(args)
+        return
+    if args.extra_files:
+        logger.error("Multiple input files are only supported with --enroll")
+        sys.exit(1)
+
     if not os.path.exists(args.input_file):
         logger.error(f"Input file '{args.input_file}' not found.")
         sys.exit(1)
@@ -138,11 +245,16 @@ def main() -> None:
         else:
             output_path = f"{base}_shifted_p{args.pitch}_f{args.formant}{ext}"
 
+    sink = JsonlFileSink(args.diagnostics) if args.diagnostics else None
     try:
         quality = ConversionQuality(args.quality)
-        converter = VoiceConverter(quality)
+        converter = VoiceConverter(quality, pitch_workers=args.workers or 1)
 
-        diagnostic = DiagnosticLogger(args.input_file)
+        diagnostic = DiagnosticLogger(
+            args.input_file,
+            sink=sink,
+            min_level=EventLevel.DEBUG if args.verbose else EventLevel.INFO,
+        )
 
         converter.process(
             input_path=args.input_file,
@@ -178,6 +290,9 @@ def main() -> None:
         if args.verbose:
             logger.exception("Full traceback:")
         sys.exit(1)
+    finally:
+        if sink is not None:
+            sink.close()
 
 
 if __name__ == "__main__":
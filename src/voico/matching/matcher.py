@@ -1,5 +1,5 @@
 import logging
-from typing import Tuple
+from typing import Sequence, Tuple
 
 import numpy as np
 
@@ -8,30 +8,89 @@ from ..core.types import VoiceProfile
 
 logger = logging.getLogger(__name__)
 
+MATCH_FORMANTS = 3
+_MIN_FORMANT_FACTOR = 0.5
+_MAX_FORMANT_FACTOR = 2.0
+
+
+def _stack_summaries(
+    profiles: Sequence[VoiceProfile],
+) -> Tuple[np.ndarray, np.ndarray]:
+    f0_means = np.array([p.pitch.f0_mean for p in profiles], dtype=np.float64)
+    formants = np.full((len(profiles), MATCH_FORMANTS), np.nan)
+    for i, profile in enumerate(profiles):
+        values = profile.formants.mean_frequencies[:MATCH_FORMANTS]
+        formants[i, : len(values)] = values
+    return f0_means, formants
+
 
 class VoiceMatcher:
+    @staticmethod
+    def match_summaries(
+        source_f0: np.ndarray,
+        source_formants: np.ndarray,
+        target_f0: np.ndarray,
+        target_formants: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        source_f0 = np.asarray(source_f0, dtype=np.float64)
+        target_f0 = np.asarray(target_f0, dtype=np.float64)
+        valid = (source_f0 > 0) & (target_f0 > 0)
+        pitch_ratio = np.where(
+            valid, target_f0 / np.where(valid, source_f0, 1.0), 1.0
+        )
+        semitones = 12.0 * np.log2(pitch_ratio)
+
+        ratios = np.asarray(target_formants, dtype=np.float64) / (
+            np.asarray(source_formants, dtype=np.float64)
+            + AudioConstants.EPSILON
+        )
+        missing = np.all(np.isnan(ratios), axis=-1)
+        ratios = np.where(missing[..., np.newaxis], 1.0, ratios)
+        raw_factor = np.nanmedian(ratios, axis=-1)
+        formant_factor = np.clip(
+            raw_factor, _MIN_FORMANT_FACTOR, _MAX_FORMANT_FACTOR
+        )
+
+        distance = np.hypot(
+            semitones,
+            12.0 * np.log2(np.maximum(raw_factor, AudioConstants.EPSILON)),
+        )
+        return np.stack([semitones, formant_factor], axis=-1), distance
+
+    @staticmethod
+    def match_many(
+        source: VoiceProfile, targets: Sequence[VoiceProfile]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        source_f0, source_formants = _stack_summaries([source])
+        target_f0, target_formants = _stack_summaries(targets)
+        return VoiceMatcher.match_summaries(
+            source_f0, source_formants, target_f0, target_formants
+        )
+
+    @staticmethod
+    def match_matrix(
+        sources: Sequence[VoiceProfile], targets: Sequence[VoiceProfile]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        source_f0, source_formants = _stack_summaries(sources)
+        target_f0, target_formants = _stack_summaries(targets)
+        return VoiceMatcher.match_summaries(
+            source_f0[:, np.newaxis],
+            source_formants[:, np.newaxis, :],
+            target_f0[np.newaxis, :],
+            target_formants[np.newaxis, :, :],
+        )
+
     @staticmethod
     def match(
         source: VoiceProfile, target: VoiceProfile
     ) -> Tuple[float, float]:
-        if source.pitch.f0_mean > 0 and target.pitch.f0_mean > 0:
-            pitch_ratio = target.pitch.f0_mean / source.pitch.f0_mean
-            semitones = 12.0 * np.log2(pitch_ratio)
-        else:
+        if not (source.pitch.f0_mean > 0 and target.pitch.f0_mean > 0):
             logger.warning(
                 "Invalid pitch means detected, defaulting to 0 semitones."
             )
-            semitones = 0.0
-
-        source_formants = source.formants.mean_frequencies[:3]
-        target_formants = target.formants.mean_frequencies[:3]
 
-        if len(source_formants) > 0 and len(target_formants) > 0:
-            ratios = target_formants / (source_formants + AudioConstants.EPSILON)
-            formant_factor = float(np.median(ratios))
-            formant_factor = np.clip(formant_factor, 0.5, 2.0)
-        else:
-            formant_factor = 1.0
+        shifts, _ = VoiceMatcher.match_many(source, [target])
+        semitones, formant_factor = float(shifts[0, 0]), float(shifts[0, 1])
 
         logger.info(
             f"Auto-Match Result: Shift {semitones:.2f} st, "
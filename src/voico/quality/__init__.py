@@ -1,15 +1,44 @@
-from .diagnostic import DiagnosticLogger
+from .diagnostic import (
+    DiagnosticLogger,
+    DiagnosticSink,
+    EventLevel,
+    JsonlFileSink,
+    MemorySink,
+    NullSink,
+    get_diagnostic_sink,
+    set_diagnostic_sink,
+)
 from .gates import (
     FormantValidationGate,
     PitchValidationGate,
     ProfileValidationGate,
+    validate_formant_batch,
+    validate_pitch_batch,
+    validate_profile_batch,
 )
-from .quality_score import ConversionQualityScore
+from .metrics import MetricsEngine, OutputMetrics
+from .quality_score import ConversionQualityScore, QualityScorer
+from .screening import ScreeningReport, screen_audio
 
 __all__ = [
     "PitchValidationGate",
     "FormantValidationGate",
     "ProfileValidationGate",
+    "validate_pitch_batch",
+    "validate_formant_batch",
+    "validate_profile_batch",
     "DiagnosticLogger",
+    "DiagnosticSink",
+    "EventLevel",
+    "JsonlFileSink",
+    "MemorySink",
+    "NullSink",
+    "get_diagnostic_sink",
+    "set_diagnostic_sink",
     "ConversionQualityScore",
+    "MetricsEngine",
+    "OutputMetrics",
+    "QualityScorer",
+    "ScreeningReport",
+    "screen_audio",
 ]
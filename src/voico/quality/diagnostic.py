@@ -1,11 +1,25 @@
 import json
 import logging
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from enum import IntEnum
+from typing import IO, Any, Deque, Dict, List, Optional, Tuple
 
 import numpy as np
 
+DEFAULT_MAX_EVENTS = 256
+
+
+class EventLevel(IntEnum):
+    DEBUG = logging.DEBUG
+    INFO = logging.INFO
+    WARNING = logging.WARNING
+    ERROR = logging.ERROR
+
 
 @dataclass
 class DiagnosticEvent:
@@ -13,6 +27,8 @@ class DiagnosticEvent:
     stage: str
     event_type: str
     data: Dict[str, Any]
+    level: str = EventLevel.INFO.name
+    elapsed_seconds: float = 0.0
 
 
 @dataclass
@@ -30,29 +46,133 @@ class PipelineDiagnostics:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     events: List[DiagnosticEvent] = field(default_factory=list)
+    dropped_events: int = 0
 
-    def to_json(self) -> str:
-        data = asdict(self)
-        return json.dumps(data, indent=2, default=str)
+    def to_json(self, indent: Optional[int] = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent, default=_json_default)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["events"] = [vars(event) for event in self.events]
+        return data
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+class DiagnosticSink(ABC):
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> None:
+        pass
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.flush()
+
+
+class NullSink(DiagnosticSink):
+    def write(self, record: Dict[str, Any]) -> None:
+        pass
+
+
+class MemorySink(DiagnosticSink):
+    def __init__(self, max_records: int = 1024):
+        self._records: Deque[Dict[str, Any]] = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+class JsonlFileSink(DiagnosticSink):
+    def __init__(self, path: str):
+        self.path = path
+        self._file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, default=_json_default, separators=(",", ":"))
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_default_sink: DiagnosticSink = NullSink()
+
+
+def get_diagnostic_sink() -> DiagnosticSink:
+    return _default_sink
+
+
+def set_diagnostic_sink(sink: Optional[DiagnosticSink]) -> DiagnosticSink:
+    global _default_sink
+    previous = _default_sink
+    _default_sink = sink if sink is not None else NullSink()
+    return previous
+
+
+_EventRecord = Tuple[float, EventLevel, str, str, Dict[str, Any]]
 
 
 class DiagnosticLogger:
-    def __init__(self, pipeline_id: str):
+    def __init__(
+        self,
+        pipeline_id: str,
+        sink: Optional[DiagnosticSink] = None,
+        max_events: int = DEFAULT_MAX_EVENTS,
+        min_level: EventLevel = EventLevel.INFO,
+        sample_rate: float = 1.0,
+    ):
+        if not (0.0 <= sample_rate <= 1.0):
+            raise ValueError(f"sample_rate must be in [0, 1], got {sample_rate}")
         self.pipeline_id = pipeline_id
         self.logger = logging.getLogger(__name__)
+        self.sink = sink if sink is not None else get_diagnostic_sink()
+        self.min_level = min_level
+        self.sample_rate = sample_rate
+        self.dropped_events = 0
+        self._events: Deque[_EventRecord] = deque(maxlen=max_events)
+        self._sample_credit = 0.0
+        self._start_wall = datetime.now()
+        self._start = time.monotonic()
         self.diagnostics = PipelineDiagnostics(
             pipeline_id=pipeline_id,
             input_file="",
             output_file="",
             quality_preset="",
-            start_time=datetime.now().isoformat(),
+            start_time=self._start_wall.isoformat(),
             end_time="",
             total_duration_seconds=0.0,
         )
-        self._start_time = datetime.now()
 
     def log_input(
         self, input_file: str, output_file: str, quality_preset: str
@@ -83,33 +203,80 @@ class DiagnosticLogger:
             "validation",
             f"validation_{status}",
             {"component": component_name, "issues_count": len(issues)},
+            EventLevel.INFO if passed else EventLevel.WARNING,
         )
 
     def log_error(self, error_message: str, stage: str = "unknown") -> None:
         self.diagnostics.errors.append(error_message)
-        self.log_event(stage, "error", {"message": error_message})
+        self.log_event(stage, "error", {"message": error_message}, EventLevel.ERROR)
         self.logger.error(f"[{self.pipeline_id}] {stage}: {error_message}")
 
     def log_warning(self, warning_message: str, stage: str = "unknown") -> None:
         self.diagnostics.warnings.append(warning_message)
-        self.log_event(stage, "warning", {"message": warning_message})
+        self.log_event(
+            stage, "warning", {"message": warning_message}, EventLevel.WARNING
+        )
         self.logger.warning(f"[{self.pipeline_id}] {stage}: {warning_message}")
 
+    def _sampled(self, level: EventLevel) -> bool:
+        if level >= EventLevel.WARNING or self.sample_rate >= 1.0:
+            return True
+        self._sample_credit += self.sample_rate
+        if self._sample_credit >= 1.0:
+            self._sample_credit -= 1.0
+            return True
+        return False
+
     def log_event(
-        self, stage: str, event_type: str, data: Dict[str, Any]
+        self,
+        stage: str,
+        event_type: str,
+        data: Dict[str, Any],
+        level: EventLevel = EventLevel.INFO,
     ) -> None:
-        event = DiagnosticEvent(
-            timestamp=datetime.now().isoformat(),
-            stage=stage,
-            event_type=event_type,
-            data=data,
+        if level < self.min_level or not self._sampled(level):
+            self.dropped_events += 1
+            return
+        elapsed = time.monotonic() - self._start
+        if len(self._events) == self._events.maxlen:
+            self.dropped_events += 1
+        self._events.append((elapsed, level, stage, event_type, data))
+        self.sink.write(
+            {
+                "pipeline_id": self.pipeline_id,
+                "t": elapsed,
+                "level": level.name,
+                "stage": stage,
+                "event": event_type,
+                "data": data,
+            }
         )
-        self.diagnostics.events.append(event)
+
+    @property
+    def events(self) -> List[DiagnosticEvent]:
+        return [
+            DiagnosticEvent(
+                timestamp=(
+                    self._start_wall + timedelta(seconds=elapsed)
+                ).isoformat(),
+                stage=stage,
+                event_type=event_type,
+                data=data,
+                level=level.name,
+                elapsed_seconds=elapsed,
+            )
+            for elapsed, level, stage, event_type, data in self._events
+        ]
 
     def finalize(self) -> PipelineDiagnostics:
-        self.diagnostics.end_time = datetime.now().isoformat()
-        elapsed = (datetime.now() - self._start_time).total_seconds()
+        elapsed = time.monotonic() - self._start
+        self.diagnostics.end_time = (
+            self._start_wall + timedelta(seconds=elapsed)
+        ).isoformat()
         self.diagnostics.total_duration_seconds = elapsed
+        self.diagnostics.events = self.events
+        self.diagnostics.dropped_events = self.dropped_events
+        self.sink.flush()
         return self.diagnostics
 
     def get_summary(self) -> str:
@@ -126,7 +293,7 @@ class DiagnosticLogger:
 
     def log_to_file(self, filepath: str) -> None:
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write(self.diagnostics.to_json())
+            f.write(self.diagnostics.to_json(indent=2))
 
     def print_summary(self) -> None:
         print(self.get_summary())
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -22,25 +22,62 @@ class ValidationGate(ABC):
         pass
 
 
-class PitchValidationGate(ValidationGate):
-    def __init__(self, pitch: PitchContour):
-        self.pitch = pitch
-        self.min_f0 = AudioConstants.MIN_F0_HZ
-        self.max_f0 = AudioConstants.MAX_F0_HZ
+def _segment_sums(values: Sequence[np.ndarray]) -> np.ndarray:
+    lengths = np.array([v.shape[-1] for v in values], dtype=np.int64)
+    sums = np.zeros((*values[0].shape[:-1], len(values)))
+    nonempty = lengths > 0
+    if not np.any(nonempty):
+        return sums
+    flat = np.concatenate(values, axis=-1).astype(np.float64)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    sums[..., nonempty] = np.add.reduceat(flat, starts[nonempty], axis=-1)
+    return sums
 
-    def validate(self) -> ValidationResult:
-        issues = []
-        suggestions = []
-        score = 100.0
 
-        f0_valid = ~np.isnan(self.pitch.f0)
-        voiced_count = np.sum(self.pitch.voiced_mask)
-        total_frames = len(self.pitch.f0)
-        voiced_ratio = voiced_count / max(total_frames, 1)
+def _result(
+    score: float, issues: List[str], suggestions: List[str]
+) -> ValidationResult:
+    return ValidationResult(
+        passed=len(issues) == 0,
+        score=max(0, score),
+        issues=issues,
+        recovery_suggestions=suggestions,
+    )
+
 
-        if voiced_ratio < 0.2:
+def validate_pitch_batch(
+    pitches: Sequence[PitchContour],
+    min_f0: float = AudioConstants.MIN_F0_HZ,
+    max_f0: float = AudioConstants.MAX_F0_HZ,
+) -> List[ValidationResult]:
+    if not pitches:
+        return []
+    f0 = [np.asarray(p.f0) for p in pitches]
+    valid = [~np.isnan(values) for values in f0]
+    total = np.array([len(values) for values in f0], dtype=np.float64)
+    voiced = _segment_sums([np.asarray(p.voiced_mask) for p in pitches])
+    valid_count = _segment_sums(valid)
+    out_of_range = _segment_sums(
+        [(values < min_f0) | (values > max_f0) for values in f0]
+    )
+
+    voiced_ratio = voiced / np.maximum(total, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nan_ratio = 1.0 - valid_count / total
+        out_ratio = out_of_range / valid_count
+
+    low_voiced = voiced_ratio < 0.2
+    many_nan = nan_ratio > 0.3
+    out_range = (valid_count > 0) & (out_of_range > 0) & (out_ratio > 0.1)
+    scores = 100.0 - 40 * low_voiced - 30 * many_nan - 20 * out_range
+
+    results = []
+    for i in range(len(pitches)):
+        issues = []
+        suggestions = []
+        if low_voiced[i]:
             issues.append(
-                f"Low voiced ratio: {voiced_ratio:.1%} (minimum: 20%)"
+                f"Low voiced ratio: {voiced_ratio[i]:.1%} (minimum: 20%)"
             )
             suggestions.append(
                 "Input may be noisy, whispered, or unvoiced speech"
@@ -48,164 +85,206 @@ class PitchValidationGate(ValidationGate):
             suggestions.append(
                 "Ensure clean audio without background noise"
             )
-            score -= 40
-
-        nan_ratio = 1.0 - (np.sum(f0_valid) / total_frames)
-        if nan_ratio > 0.3:
+        if many_nan[i]:
             issues.append(
-                f"High NaN count: {nan_ratio:.1%} (maximum: 30%)"
+                f"High NaN count: {nan_ratio[i]:.1%} (maximum: 30%)"
             )
             suggestions.append("Audio contains undetected pitch regions")
             suggestions.append(
                 "Try manual pitch shift instead of auto-matching"
             )
-            score -= 30
+        if out_range[i]:
+            issues.append(f"Out-of-range F0 values: {out_ratio[i]:.1%}")
+            suggestions.append("May be synthesized or modified audio")
+        results.append(_result(float(scores[i]), issues, suggestions))
+    return results
 
-        if np.sum(f0_valid) > 0:
-            valid_f0 = self.pitch.f0[f0_valid]
-            out_of_range = np.sum(
-                (valid_f0 < self.min_f0) | (valid_f0 > self.max_f0)
-            )
-            if out_of_range > 0:
-                out_ratio = out_of_range / len(valid_f0)
-                if out_ratio > 0.1:
-                    issues.append(
-                        f"Out-of-range F0 values: {out_ratio:.1%}"
-                    )
-                    suggestions.append(
-                        "May be synthesized or modified audio"
-                    )
-                    score -= 20
-
-        passed = len(issues) == 0
-        return ValidationResult(
-            passed=passed,
-            score=max(0, score),
-            issues=issues,
-            recovery_suggestions=suggestions,
+
+def validate_formant_batch(
+    formants: Sequence[FormantTrack],
+) -> List[ValidationResult]:
+    if not formants:
+        return []
+    counts = np.array([f.frequencies.shape[0] for f in formants])
+    frames = np.array([f.frequencies.shape[1] for f in formants])
+    max_formants = max(int(np.max(counts)), 1)
+
+    frequencies = []
+    bandwidth_invalid = []
+    bandwidth_sizes = np.array([np.size(f.bandwidths) for f in formants])
+    for track in formants:
+        padded = np.full((max_formants, track.frequencies.shape[1]), np.nan)
+        padded[: track.frequencies.shape[0]] = track.frequencies
+        frequencies.append(padded)
+        bandwidths = np.asarray(track.bandwidths)
+        bandwidth_invalid.append(
+            ~(
+                (bandwidths > 10)
+                & (bandwidths < AudioConstants.MAX_FORMANT_BANDWIDTH)
+            ).ravel()
         )
 
+    finite = [~np.isnan(values) for values in frequencies]
+    frequency_sums = _segment_sums(
+        [
+            np.where(mask, values, 0.0)
+            for values, mask in zip(frequencies, finite)
+        ]
+    )
+    frequency_counts = _segment_sums(finite)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_frequencies = (frequency_sums / frequency_counts).T
+        invalid_ratio = _segment_sums(bandwidth_invalid) / bandwidth_sizes
 
-class FormantValidationGate(ValidationGate):
-    def __init__(
-        self, formants: FormantTrack, sample_rate: int, pitch: PitchContour
-    ):
-        self.formants = formants
-        self.sample_rate = sample_rate
-        self.pitch = pitch
-        self.max_formant_freq = sample_rate / 2 - 500
+    rows = np.arange(max_formants - 1)
+    violations = (mean_frequencies[:, :-1] >= mean_frequencies[:, 1:]) & (
+        rows < (counts[:, np.newaxis] - 1)
+    )
+    has_frames = frames > 0
+    too_few = counts < 3
+    ordering = has_frames & np.any(violations, axis=1)
+    if violations.shape[1] == 0:
+        first_violation = np.zeros(len(formants), dtype=int)
+    else:
+        first_violation = np.argmax(violations, axis=1)
+    bad_bandwidths = has_frames & (invalid_ratio > 0.2)
+    scores = 100.0 - 50 * too_few - 25 * ordering - 20 * bad_bandwidths
 
-    def validate(self) -> ValidationResult:
+    results = []
+    for i in range(len(formants)):
         issues = []
         suggestions = []
-        score = 100.0
-
-        num_formants = self.formants.frequencies.shape[0]
-        if num_formants < 3:
-            issues.append(f"Only {num_formants} formants detected (need 4-5)")
+        if too_few[i]:
+            issues.append(f"Only {counts[i]} formants detected (need 4-5)")
             suggestions.append(
                 "Try increasing formant_tracking_order in quality settings"
             )
             suggestions.append("Ensure audio has sufficient spectral content")
-            score -= 50
-
-        if self.formants.frequencies.shape[1] > 0:
-            mean_freqs = np.nanmean(
-                self.formants.frequencies, axis=1
+        if ordering[i]:
+            j = int(first_violation[i])
+            issues.append(f"Formant ordering violation at F{j+1} >= F{j+2}")
+            suggestions.append(
+                "May indicate low SNR or algorithm instability"
             )
-            for i in range(len(mean_freqs) - 1):
-                if mean_freqs[i] >= mean_freqs[i + 1]:
-                    issues.append(
-                        f"Formant ordering violation at F{i+1} >= F{i+2}"
-                    )
-                    suggestions.append(
-                        "May indicate low SNR or algorithm instability"
-                    )
-                    score -= 25
-                    break
-
-            bandwidth_valid = (
-                self.formants.bandwidths > 10
-            ) & (
-                self.formants.bandwidths
-                < AudioConstants.MAX_FORMANT_BANDWIDTH
+        if bad_bandwidths[i]:
+            issues.append(
+                f"Invalid bandwidths: {invalid_ratio[i]:.1%} of values"
             )
-            invalid_ratio = np.sum(~bandwidth_valid) / bandwidth_valid.size
-            if invalid_ratio > 0.2:
-                issues.append(
-                    f"Invalid bandwidths: {invalid_ratio:.1%} of values"
-                )
-                suggestions.append("LPC model may be poorly fitted")
-                score -= 20
-
-        passed = len(issues) == 0
-        return ValidationResult(
-            passed=passed,
-            score=max(0, score),
-            issues=issues,
-            recovery_suggestions=suggestions,
-        )
+            suggestions.append("LPC model may be poorly fitted")
+        results.append(_result(float(scores[i]), issues, suggestions))
+    return results
 
 
-class ProfileValidationGate(ValidationGate):
-    def __init__(self, profile: VoiceProfile):
-        self.profile = profile
-        self.min_snr_db = 10.0
-        self.acceptable_tilt_range = (-2.0, 2.0)
+def validate_profile_batch(
+    profiles: Sequence[VoiceProfile],
+    pitch_results: Optional[Sequence[ValidationResult]] = None,
+    formant_results: Optional[Sequence[ValidationResult]] = None,
+    acceptable_tilt_range: Tuple[float, float] = (-2.0, 2.0),
+) -> List[ValidationResult]:
+    if not profiles:
+        return []
+    if pitch_results is None:
+        pitch_results = validate_pitch_batch([p.pitch for p in profiles])
+    if formant_results is None:
+        formant_results = validate_formant_batch(
+            [p.formants for p in profiles]
+        )
 
-    def validate(self) -> ValidationResult:
+    tilt = np.array([p.spectral.spectral_tilt for p in profiles])
+    energy = [np.asarray(p.harmonic_energy) for p in profiles]
+    energy_frames = np.array([len(values) for values in energy])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        harmonic_ratio = (
+            _segment_sums([values > 0 for values in energy]) / energy_frames
+        )
+    tilt_out = (tilt < acceptable_tilt_range[0]) | (
+        tilt > acceptable_tilt_range[1]
+    )
+    low_harmonic = harmonic_ratio < 0.5
+
+    results = []
+    for i, (pitch, formant) in enumerate(zip(pitch_results, formant_results)):
         issues = []
         suggestions = []
         score = 100.0
-
-        pitch_result = PitchValidationGate(self.profile.pitch).validate()
-        if not pitch_result.passed:
-            issues.extend(pitch_result.issues)
-            suggestions.extend(pitch_result.recovery_suggestions)
-            score -= (100 - pitch_result.score)
-
-        formant_result = FormantValidationGate(
-            self.profile.formants,
-            self.profile.sample_rate,
-            self.profile.pitch,
-        ).validate()
-        if not formant_result.passed:
-            issues.extend(formant_result.issues)
-            suggestions.extend(formant_result.recovery_suggestions)
-            score -= (100 - formant_result.score)
-
-        if self.profile.spectral.spectral_tilt < self.acceptable_tilt_range[
-            0
-        ] or self.profile.spectral.spectral_tilt > self.acceptable_tilt_range[
-            1
-        ]:
+        for gate in (pitch, formant):
+            if not gate.passed:
+                issues.extend(gate.issues)
+                suggestions.extend(gate.recovery_suggestions)
+                score -= 100 - gate.score
+        if tilt_out[i]:
             issues.append(
                 f"Spectral tilt out of range: "
-                f"{self.profile.spectral.spectral_tilt:.2f} "
-                f"(expected: {self.acceptable_tilt_range[0]:.1f} to "
-                f"{self.acceptable_tilt_range[1]:.1f})"
+                f"{tilt[i]:.2f} "
+                f"(expected: {acceptable_tilt_range[0]:.1f} to "
+                f"{acceptable_tilt_range[1]:.1f})"
             )
             suggestions.append(
                 "May indicate unnatural or heavily processed audio"
             )
             score -= 15
-
-        harmonic_ratio = np.sum(self.profile.harmonic_energy > 0) / len(
-            self.profile.harmonic_energy
-        )
-        if harmonic_ratio < 0.5:
+        if low_harmonic[i]:
             issues.append(
-                f"Low harmonic content: {harmonic_ratio:.1%} frames"
+                f"Low harmonic content: {harmonic_ratio[i]:.1%} frames"
             )
             suggestions.append(
                 "Audio may be noisy, whispered, or contain artifacts"
             )
             score -= 20
+        results.append(_result(score, issues, suggestions))
+    return results
 
-        passed = len(issues) == 0
-        return ValidationResult(
-            passed=passed,
-            score=max(0, score),
-            issues=issues,
-            recovery_suggestions=suggestions,
-        )
+
+class PitchValidationGate(ValidationGate):
+    def __init__(self, pitch: PitchContour):
+        self.pitch = pitch
+        self.min_f0 = AudioConstants.MIN_F0_HZ
+        self.max_f0 = AudioConstants.MAX_F0_HZ
+
+    def validate(self) -> ValidationResult:
+        return validate_pitch_batch([self.pitch], self.min_f0, self.max_f0)[0]
+
+
+class FormantValidationGate(ValidationGate):
+    def __init__(
+        self, formants: FormantTrack, sample_rate: int, pitch: PitchContour
+    ):
+        self.formants = formants
+        self.sample_rate = sample_rate
+        self.pitch = pitch
+        self.max_formant_freq = sample_rate / 2 - 500
+
+    def validate(self) -> ValidationResult:
+        return validate_formant_batch([self.formants])[0]
+
+
+class ProfileValidationGate(ValidationGate):
+    def __init__(
+        self,
+        profile: VoiceProfile,
+        pitch_result: Optional[ValidationResult] = None,
+        formant_result: Optional[ValidationResult] = None,
+    ):
+        self.profile = profile
+        self.pitch_result = pitch_result
+        self.formant_result = formant_result
+        self.min_snr_db = 10.0
+        self.acceptable_tilt_range = (-2.0, 2.0)
+
+    def validate(self) -> ValidationResult:
+        pitch_result = self.pitch_result
+        if pitch_result is None:
+            pitch_result = PitchValidationGate(self.profile.pitch).validate()
+        formant_result = self.formant_result
+        if formant_result is None:
+            formant_result = FormantValidationGate(
+                self.profile.formants,
+                self.profile.sample_rate,
+                self.profile.pitch,
+            ).validate()
+        return validate_profile_batch(
+            [self.profile],
+            [pitch_result],
+            [formant_result],
+            self.acceptable_tilt_range,
+        )[0]
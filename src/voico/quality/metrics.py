@@ -0,0 +1,231 @@
+import logging
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import scipy.signal
+
+from ..core.config import QualityMetric
+from ..core.constants import AudioConstants
+
+logger = logging.getLogger(__name__)
+
+_ACTIVE_RANGE_DB = 60.0
+_LSD_FLOOR_DB = -80.0
+_VOICING_MIN_PEAK = 0.5
+_PEAK_TOLERANCE = 0.9
+_MIN_VOICED_FRAMES = 3
+
+_SPECTRAL_METRICS = frozenset(
+    {
+        QualityMetric.CENTROID_DEVIATION,
+        QualityMetric.LOG_SPECTRAL_DISTANCE,
+        QualityMetric.SPECTRAL_CONVERGENCE,
+        QualityMetric.PITCH_ACCURACY,
+    }
+)
+
+
+@dataclass
+class OutputMetrics:
+    snr_db: Optional[float] = None
+    spectral_centroid_deviation: Optional[float] = None
+    log_spectral_distance_db: Optional[float] = None
+    spectral_convergence: Optional[float] = None
+    pitch_error_cents: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, float]:
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+def compute_snr(reference: np.ndarray, output: np.ndarray) -> float:
+    n = min(len(reference), len(output))
+    if n == 0:
+        return 0.0
+    ref = reference[:n].astype(np.float64)
+    out = output[:n].astype(np.float64)
+    signal_power = np.mean(ref ** 2)
+    noise_power = np.mean((ref - out) ** 2)
+    if noise_power < 1e-10:
+        return 60.0
+    return float(10.0 * np.log10(max(signal_power / noise_power, 1e-10)))
+
+
+def _align_frames(
+    reference: np.ndarray, n_frames: int
+) -> np.ndarray:
+    if reference.shape[1] == n_frames:
+        return reference
+    columns = np.round(
+        np.linspace(0, reference.shape[1] - 1, n_frames)
+    ).astype(np.int64)
+    return reference[:, columns]
+
+
+def _active_frames(*magnitudes: np.ndarray) -> np.ndarray:
+    active = None
+    for magnitude in magnitudes:
+        energy_db = 10.0 * np.log10(
+            np.sum(np.square(magnitude), axis=0) + AudioConstants.EPSILON
+        )
+        mask = energy_db > np.max(energy_db) - _ACTIVE_RANGE_DB
+        active = mask if active is None else active & mask
+    return active
+
+
+def _centroids(magnitude: np.ndarray, frequencies: np.ndarray) -> np.ndarray:
+    total = np.sum(magnitude, axis=0)
+    return (frequencies @ magnitude) / np.maximum(total, AudioConstants.EPSILON)
+
+
+def _log_power(magnitude: np.ndarray) -> np.ndarray:
+    power_db = 10.0 * np.log10(np.square(magnitude) + AudioConstants.EPSILON)
+    return np.maximum(power_db, np.max(power_db) + _LSD_FLOOR_DB)
+
+
+class MetricsEngine:
+    def __init__(
+        self,
+        sample_rate: int,
+        n_fft: int,
+        hop_length: int,
+        metrics: Iterable[QualityMetric] = tuple(QualityMetric),
+    ):
+        self.sample_rate = sample_rate
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.metrics = frozenset(metrics)
+        self._frequencies = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+
+        min_lag = max(2, int(sample_rate / AudioConstants.MAX_F0_HZ))
+        max_lag = min(
+            n_fft // 2 - 2, int(np.ceil(sample_rate / AudioConstants.MIN_F0_HZ))
+        )
+        self._lags = np.arange(min_lag, max_lag + 1)
+        window = scipy.signal.get_window("hann", n_fft)
+        window_ac = np.fft.irfft(np.abs(np.fft.rfft(window)) ** 2, n=n_fft)
+        self._window_ac = window_ac[self._lags] / window_ac[0]
+
+    @property
+    def needs_spectrograms(self) -> bool:
+        return not self.metrics.isdisjoint(_SPECTRAL_METRICS)
+
+    def magnitude(self, audio: np.ndarray) -> np.ndarray:
+        return np.abs(
+            scipy.signal.stft(
+                audio,
+                fs=self.sample_rate,
+                nperseg=self.n_fft,
+                noverlap=self.n_fft - self.hop_length,
+            )[2]
+        )
+
+    def frame_pitch(self, magnitude: np.ndarray) -> np.ndarray:
+        autocorr = np.fft.irfft(np.square(magnitude), n=self.n_fft, axis=0)
+        energy = autocorr[0]
+        normalized = autocorr[self._lags] / (
+            (energy + AudioConstants.EPSILON) * self._window_ac[:, np.newaxis]
+        )
+        local_max = np.zeros_like(normalized, dtype=bool)
+        local_max[1:-1] = (normalized[1:-1] >= normalized[:-2]) & (
+            normalized[1:-1] >= normalized[2:]
+        )
+        strongest = np.max(normalized, axis=0)
+        candidates = local_max & (normalized >= _PEAK_TOLERANCE * strongest)
+        best = np.where(
+            np.any(candidates, axis=0),
+            np.argmax(candidates, axis=0),
+            np.argmax(normalized, axis=0),
+        )
+        columns = np.arange(magnitude.shape[1])
+        peak = normalized[best, columns]
+
+        lag = self._lags[best]
+        before = autocorr[lag - 1, columns]
+        center = autocorr[lag, columns]
+        after = autocorr[lag + 1, columns]
+        curvature = before - 2.0 * center + after
+        with np.errstate(divide="ignore", invalid="ignore"):
+            offset = np.where(
+                curvature < 0, 0.5 * (before - after) / curvature, 0.0
+            )
+        f0 = self.sample_rate / (lag + np.clip(offset, -0.5, 0.5))
+
+        voiced = (peak > _VOICING_MIN_PEAK) & _active_frames(magnitude)
+        return np.where(voiced, f0, np.nan)
+
+    def compute(
+        self,
+        reference: np.ndarray,
+        output: np.ndarray,
+        reference_magnitude: Optional[np.ndarray] = None,
+        output_magnitude: Optional[np.ndarray] = None,
+        target_magnitude: Optional[np.ndarray] = None,
+        pitch_shift: float = 0.0,
+    ) -> OutputMetrics:
+        result = OutputMetrics()
+        if QualityMetric.SNR in self.metrics:
+            result.snr_db = compute_snr(reference, output)
+        if not self.needs_spectrograms:
+            return result
+
+        if output_magnitude is None:
+            output_magnitude = self.magnitude(output)
+        if output_magnitude.shape[1] == 0:
+            return result
+        if reference_magnitude is None:
+            reference_magnitude = self.magnitude(reference)
+
+        aligned = _align_frames(reference_magnitude, output_magnitude.shape[1])
+        active = _active_frames(aligned, output_magnitude)
+
+        if QualityMetric.CENTROID_DEVIATION in self.metrics and np.any(active):
+            ref_centroid = _centroids(aligned[:, active], self._frequencies)
+            out_centroid = _centroids(
+                output_magnitude[:, active], self._frequencies
+            )
+            deviation = np.abs(out_centroid - ref_centroid) / np.maximum(
+                ref_centroid, AudioConstants.EPSILON
+            )
+            result.spectral_centroid_deviation = float(np.mean(deviation))
+
+        if QualityMetric.LOG_SPECTRAL_DISTANCE in self.metrics and np.any(
+            active
+        ):
+            difference = _log_power(output_magnitude) - _log_power(aligned)
+            distance = np.sqrt(np.mean(np.square(difference[:, active]), axis=0))
+            result.log_spectral_distance_db = float(np.mean(distance))
+
+        if (
+            QualityMetric.SPECTRAL_CONVERGENCE in self.metrics
+            and target_magnitude is not None
+        ):
+            n = min(target_magnitude.shape[1], output_magnitude.shape[1])
+            target = target_magnitude[:, :n]
+            error = np.linalg.norm(output_magnitude[:, :n] - target)
+            result.spectral_convergence = float(
+                error / max(np.linalg.norm(target), AudioConstants.EPSILON)
+            )
+
+        if QualityMetric.PITCH_ACCURACY in self.metrics:
+            result.pitch_error_cents = self._pitch_error(
+                reference_magnitude, output_magnitude, pitch_shift
+            )
+
+        logger.debug(f"Output metrics: {result.as_dict()}")
+        return result
+
+    def _pitch_error(
+        self,
+        reference_magnitude: np.ndarray,
+        output_magnitude: np.ndarray,
+        pitch_shift: float,
+    ) -> Optional[float]:
+        ref_f0 = self.frame_pitch(reference_magnitude)
+        out_f0 = self.frame_pitch(output_magnitude)
+        ref_f0 = ref_f0[np.isfinite(ref_f0)]
+        out_f0 = out_f0[np.isfinite(out_f0)]
+        if min(len(ref_f0), len(out_f0)) < _MIN_VOICED_FRAMES:
+            return None
+        measured = 1200.0 * np.log2(np.median(out_f0) / np.median(ref_f0))
+        return float(abs(measured - 100.0 * pitch_shift))
@@ -1,14 +1,21 @@
+import dataclasses
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import List, Optional, Sequence
 
 import numpy as np
 
 from ..core.types import VoiceProfile
 from .gates import (
-    FormantValidationGate,
-    PitchValidationGate,
-    ProfileValidationGate,
+    ValidationResult,
+    validate_formant_batch,
+    validate_pitch_batch,
+    validate_profile_batch,
 )
 
+_MEMO_SIZE = 256
+
 
 @dataclass
 class ConversionQualityScore:
@@ -33,17 +40,89 @@ class ConversionQualityScore:
         )
 
 
+def _profile_key(profile: VoiceProfile) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    for values in (
+        profile.pitch.f0,
+        profile.pitch.voiced_mask,
+        profile.formants.frequencies,
+        profile.formants.bandwidths,
+        profile.harmonic_energy,
+    ):
+        buffer = np.ascontiguousarray(values)
+        hasher.update(f"{buffer.dtype.str}{buffer.shape}".encode())
+        hasher.update(buffer.tobytes())
+    hasher.update(
+        f"{profile.sample_rate}:{profile.spectral.spectral_tilt!r}".encode()
+    )
+    return hasher.hexdigest()
+
+
+def _copy_score(
+    score: ConversionQualityScore, min_viable_score: float
+) -> ConversionQualityScore:
+    return dataclasses.replace(
+        score,
+        is_viable=score.overall_score >= min_viable_score,
+        critical_issues=list(score.critical_issues),
+        warnings=list(score.warnings),
+        recommendations=list(score.recommendations),
+    )
+
+
 class QualityScorer:
-    def __init__(self):
+    def __init__(self, memo_size: int = _MEMO_SIZE):
         self.min_viable_score = 30.0
+        self.memo_size = memo_size
+        self._memo: OrderedDict[str, ConversionQualityScore] = OrderedDict()
 
     def score_profile(self, profile: VoiceProfile) -> ConversionQualityScore:
-        pitch_result = PitchValidationGate(profile.pitch).validate()
-        formant_result = FormantValidationGate(
-            profile.formants, profile.sample_rate, profile.pitch
-        ).validate()
-        profile_result = ProfileValidationGate(profile).validate()
-
+        return self.score_profiles([profile])[0]
+
+    def score_profiles(
+        self, profiles: Sequence[VoiceProfile]
+    ) -> List[ConversionQualityScore]:
+        keys = [_profile_key(profile) for profile in profiles]
+        scores: List[Optional[ConversionQualityScore]] = [
+            self._memo.get(key) for key in keys
+        ]
+        pending = [i for i, score in enumerate(scores) if score is None]
+
+        if pending:
+            batch = [profiles[i] for i in pending]
+            pitch_results = validate_pitch_batch([p.pitch for p in batch])
+            formant_results = validate_formant_batch(
+                [p.formants for p in batch]
+            )
+            profile_results = validate_profile_batch(
+                batch, pitch_results, formant_results
+            )
+            for i, pitch, formant, profile in zip(
+                pending, pitch_results, formant_results, profile_results
+            ):
+                scores[i] = self._combine(pitch, formant, profile)
+                self._remember(keys[i], scores[i])
+
+        for key in keys:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+        return [
+            _copy_score(score, self.min_viable_score) for score in scores
+        ]
+
+    def _remember(self, key: str, score: ConversionQualityScore) -> None:
+        if self.memo_size <= 0:
+            return
+        self._memo[key] = score
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    def _combine(
+        self,
+        pitch_result: ValidationResult,
+        formant_result: ValidationResult,
+        profile_result: ValidationResult,
+    ) -> ConversionQualityScore:
         overall = np.mean(
             [pitch_result.score, formant_result.score, profile_result.score]
         )
@@ -0,0 +1,167 @@
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+import scipy.signal
+
+from ..core.config import ScreeningThresholds
+from ..core.constants import AudioConstants
+
+logger = logging.getLogger(__name__)
+
+_VOICING_SR = 8000
+_VOICING_ACTIVE_RANGE_DB = 40.0
+_VOICING_MIN_PEAK = 0.45
+_CLIP_LEVEL = 0.99
+_CLIP_PLATEAU = 1e-6
+
+
+@dataclass
+class ScreeningReport:
+    duration_seconds: float
+    rms_db: float
+    crest_factor_db: float
+    zero_crossing_rate: float
+    clipping_ratio: float
+    voiced_ratio: float
+    issues: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return len(self.issues) == 0
+
+
+def _clipping_ratio(audio: np.ndarray, peak: float) -> float:
+    if len(audio) < 2 or peak <= AudioConstants.EPSILON:
+        return 0.0
+    at_peak = np.abs(audio) >= _CLIP_LEVEL * peak
+    flat = np.abs(np.diff(audio)) <= _CLIP_PLATEAU * peak
+    plateau = np.zeros(len(audio), dtype=bool)
+    plateau[1:] |= flat
+    plateau[:-1] |= flat
+    return float(np.mean(at_peak & plateau))
+
+
+def _voiced_ratio(audio: np.ndarray, sample_rate: int) -> float:
+    factor = max(1, sample_rate // _VOICING_SR)
+    if factor > 1 and len(audio) > 27 * factor:
+        audio = scipy.signal.decimate(audio, factor, ftype="fir")
+    rate = sample_rate / factor
+
+    min_lag = max(1, int(rate / AudioConstants.MAX_F0_HZ))
+    max_lag = int(np.ceil(rate / AudioConstants.MIN_F0_HZ))
+    frame_length = 3 * max_lag
+    n_frames = len(audio) // frame_length
+    if n_frames == 0:
+        return 0.0
+
+    frames = audio[: n_frames * frame_length].reshape(n_frames, frame_length)
+    frames = frames - np.mean(frames, axis=1, keepdims=True)
+    spectrum = np.fft.rfft(frames, n=2 * frame_length, axis=1)
+    autocorr = np.fft.irfft(np.abs(spectrum) ** 2, axis=1)
+    energy = autocorr[:, 0]
+    peaks = np.max(autocorr[:, min_lag : max_lag + 1], axis=1) / (
+        energy + AudioConstants.EPSILON
+    )
+
+    energy_db = 10.0 * np.log10(energy + AudioConstants.EPSILON)
+    active = energy_db > np.max(energy_db) - _VOICING_ACTIVE_RANGE_DB
+    return float(np.mean(active & (peaks > _VOICING_MIN_PEAK)))
+
+
+def screen_audio(
+    audio: np.ndarray,
+    sample_rate: int,
+    thresholds: Optional[ScreeningThresholds] = None,
+) -> ScreeningReport:
+    if thresholds is None:
+        thresholds = ScreeningThresholds()
+    audio = np.asarray(audio, dtype=np.float64)
+
+    duration = len(audio) / sample_rate
+    peak = float(np.max(np.abs(audio))) if len(audio) else 0.0
+    rms = float(np.sqrt(np.mean(np.square(audio)))) if len(audio) else 0.0
+    rms_db = 20.0 * np.log10(rms + AudioConstants.EPSILON)
+    crest_db = 20.0 * np.log10(
+        (peak + AudioConstants.EPSILON) / (rms + AudioConstants.EPSILON)
+    )
+    signs = np.signbit(audio)
+    zcr = float(np.mean(signs[1:] != signs[:-1])) if len(audio) > 1 else 0.0
+
+    report = ScreeningReport(
+        duration_seconds=duration,
+        rms_db=float(rms_db),
+        crest_factor_db=float(crest_db),
+        zero_crossing_rate=zcr,
+        clipping_ratio=_clipping_ratio(audio, peak),
+        voiced_ratio=_voiced_ratio(audio, sample_rate),
+    )
+
+    if duration < thresholds.min_duration_seconds:
+        report.issues.append(
+            f"Input too short: {duration:.2f}s "
+            f"(minimum: {thresholds.min_duration_seconds:.2f}s)"
+        )
+        report.recommendations.append("Provide a longer recording")
+    if report.rms_db < thresholds.min_rms_db:
+        report.issues.append(
+            f"Input is silent: {report.rms_db:.1f} dBFS RMS "
+            f"(minimum: {thresholds.min_rms_db:.1f} dBFS)"
+        )
+        report.recommendations.append(
+            "Check the recording level and input device"
+        )
+    if not report.passed:
+        return report
+
+    if report.clipping_ratio > thresholds.max_clipping_ratio:
+        report.issues.append(
+            f"Clipping detected: {report.clipping_ratio:.1%} of samples "
+            f"(maximum: {thresholds.max_clipping_ratio:.1%})"
+        )
+        report.recommendations.append(
+            "Re-record with lower input gain to avoid clipping"
+        )
+    if report.crest_factor_db < thresholds.min_crest_factor_db:
+        report.issues.append(
+            f"Crest factor too low: {report.crest_factor_db:.1f} dB "
+            f"(minimum: {thresholds.min_crest_factor_db:.1f} dB)"
+        )
+        report.recommendations.append(
+            "Audio appears heavily compressed or limited"
+        )
+    elif report.crest_factor_db > thresholds.max_crest_factor_db:
+        report.issues.append(
+            f"Crest factor too high: {report.crest_factor_db:.1f} dB "
+            f"(maximum: {thresholds.max_crest_factor_db:.1f} dB)"
+        )
+        report.recommendations.append(
+            "Audio is dominated by clicks or transients"
+        )
+    if report.zero_crossing_rate > thresholds.max_zero_crossing_rate:
+        report.issues.append(
+            f"High zero-crossing rate: {report.zero_crossing_rate:.2f} "
+            f"(maximum: {thresholds.max_zero_crossing_rate:.2f})"
+        )
+        report.recommendations.append(
+            "Input may be noise or whispered speech"
+        )
+    if report.voiced_ratio < thresholds.min_voiced_ratio:
+        report.issues.append(
+            f"Little voiced content: {report.voiced_ratio:.1%} of frames "
+            f"(minimum: {thresholds.min_voiced_ratio:.1%})"
+        )
+        report.recommendations.append(
+            "Ensure clean audio without background noise"
+        )
+
+    logger.debug(
+        f"Screening: rms {report.rms_db:.1f} dB, "
+        f"crest {report.crest_factor_db:.1f} dB, "
+        f"zcr {report.zero_crossing_rate:.2f}, "
+        f"clipping {report.clipping_ratio:.2%}, "
+        f"voiced {report.voiced_ratio:.1%}"
+    )
+    return report
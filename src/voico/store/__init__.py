@@ -1,3 +1,4 @@
+from .profile_index import ProfileFeatureIndex, VoiceMatch
 from .profile_store import ProfileStore
 
-__all__ = ["ProfileStore"]
+__all__ = ["ProfileFeatureIndex", "ProfileStore", "VoiceMatch"]
@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..core.constants import AudioConstants
+from ..core.types import VoiceProfile
+from ..matching.matcher import MATCH_FORMANTS, VoiceMatcher
+
+INDEX_FORMANTS = MATCH_FORMANTS
+
+_F0_MEAN = 0
+_F0_STD = 1
+_FORMANTS = slice(2, 2 + INDEX_FORMANTS)
+_BANDWIDTHS = slice(2 + INDEX_FORMANTS, 2 + 2 * INDEX_FORMANTS)
+_TILT = 2 + 2 * INDEX_FORMANTS
+_HNR = _TILT + 1
+FEATURE_SIZE = _HNR + 1
+
+_F0_STD_SCALE_HZ = 10.0
+_BANDWIDTH_WEIGHT = 0.25
+_TILT_SCALE = 0.5
+_HNR_SCALE_DB = 5.0
+
+
+@dataclass
+class VoiceMatch:
+    name: str
+    distance: float
+    pitch_shift: float
+    formant_shift: float
+
+
+def _padded(values: np.ndarray, default: Sequence[float]) -> np.ndarray:
+    padded = np.asarray(default[:INDEX_FORMANTS], dtype=np.float64).copy()
+    n = min(len(values), INDEX_FORMANTS)
+    padded[:n] = values[:n]
+    return padded
+
+
+def profile_features(profile: VoiceProfile) -> np.ndarray:
+    features = np.zeros(FEATURE_SIZE)
+    features[_F0_MEAN] = profile.pitch.f0_mean
+    features[_F0_STD] = profile.pitch.f0_std
+    features[_FORMANTS] = _padded(
+        profile.formants.mean_frequencies,
+        AudioConstants.DEFAULT_FORMANT_FREQS,
+    )
+    features[_BANDWIDTHS] = _padded(
+        profile.formants.mean_bandwidths,
+        AudioConstants.DEFAULT_FORMANT_BANDWIDTHS,
+    )
+    features[_TILT] = profile.spectral.spectral_tilt
+    features[_HNR] = profile.pitch.harmonic_to_noise_ratio
+    return features
+
+
+def _embed(features: np.ndarray) -> np.ndarray:
+    features = np.atleast_2d(features)
+    positive = np.maximum(features, AudioConstants.EPSILON)
+    return np.column_stack(
+        [
+            12.0 * np.log2(positive[:, _F0_MEAN]),
+            features[:, _F0_STD] / _F0_STD_SCALE_HZ,
+            12.0 * np.log2(positive[:, _FORMANTS]),
+            _BANDWIDTH_WEIGHT * 12.0 * np.log2(positive[:, _BANDWIDTHS]),
+            features[:, _TILT] / _TILT_SCALE,
+            features[:, _HNR] / _HNR_SCALE_DB,
+        ]
+    )
+
+
+class ProfileFeatureIndex:
+    def __init__(
+        self,
+        names: Sequence[str] = (),
+        features: Optional[np.ndarray] = None,
+    ) -> None:
+        self._names: List[str] = list(names)
+        self._positions: Dict[str, int] = {
+            name: i for i, name in enumerate(self._names)
+        }
+        if features is None:
+            features = np.zeros((len(self._names), FEATURE_SIZE))
+        self._features = np.array(features, dtype=np.float64).reshape(
+            len(self._names), FEATURE_SIZE
+        )
+        self._embedded = _embed(self._features)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def add(self, name: str, features: np.ndarray) -> None:
+        features = np.asarray(features, dtype=np.float64)
+        position = self._positions.get(name)
+        if position is not None:
+            self._features[position] = features
+            self._embedded[position] = _embed(features)[0]
+            return
+        self._positions[name] = len(self._names)
+        self._names.append(name)
+        self._features = np.vstack([self._features, features])
+        self._embedded = np.vstack([self._embedded, _embed(features)])
+
+    def remove(self, name: str) -> bool:
+        position = self._positions.pop(name, None)
+        if position is None:
+            return False
+        del self._names[position]
+        self._features = np.delete(self._features, position, axis=0)
+        self._embedded = np.delete(self._embedded, position, axis=0)
+        self._positions = {n: i for i, n in enumerate(self._names)}
+        return True
+
+    def query(
+        self, features: np.ndarray, k: int = 5, exclude: Sequence[str] = ()
+    ) -> List[VoiceMatch]:
+        if len(self._names) == 0 or k <= 0:
+            return []
+        features = np.asarray(features, dtype=np.float64)
+        distances = np.sqrt(
+            np.sum(np.square(self._embedded - _embed(features)), axis=1)
+        )
+        for name in exclude:
+            position = self._positions.get(name)
+            if position is not None:
+                distances[position] = np.inf
+
+        k = min(k, int(np.sum(np.isfinite(distances))))
+        if k == 0:
+            return []
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+        targets = self._features[nearest]
+        shifts, _ = VoiceMatcher.match_summaries(
+            features[_F0_MEAN],
+            features[_FORMANTS],
+            targets[:, _F0_MEAN],
+            targets[:, _FORMANTS],
+        )
+        return [
+            VoiceMatch(
+                name=self._names[i],
+                distance=float(distances[i]),
+                pitch_shift=float(shift[0]),
+                formant_shift=float(shift[1]),
+            )
+            for i, shift in zip(nearest, shifts)
+        ]
@@ -1,15 +1,40 @@
+import functools
 import json
 import os
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 import numpy as np
 
 from ..core.types import FormantTrack, PitchContour, SpectralFeatures, VoiceProfile
+from ..utils.telemetry import get_metrics_registry
+from .profile_index import ProfileFeatureIndex, VoiceMatch, profile_features
 
 DEFAULT_DB_PATH = str(Path.home() / ".voico" / "profiles.db")
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+_QUERY_SECONDS = get_metrics_registry().histogram(
+    "voico_profile_store_seconds",
+    "Profile store operation latency.",
+    ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+
+def _timed(operation: str) -> Callable[[F], F]:
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _QUERY_SECONDS.time(operation=operation):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
 
 def _serialize_profile(profile: VoiceProfile) -> str:
     data = {
@@ -19,6 +44,11 @@ def _serialize_profile(profile: VoiceProfile) -> str:
             "f0_mean": profile.pitch.f0_mean,
             "f0_std": profile.pitch.f0_std,
             "harmonic_to_noise_ratio": profile.pitch.harmonic_to_noise_ratio,
+            "hnr_contour": (
+                profile.pitch.hnr_contour.tolist()
+                if profile.pitch.hnr_contour is not None
+                else None
+            ),
         },
         "formants": {
             "frequencies": profile.formants.frequencies.tolist(),
@@ -39,12 +69,18 @@ def _serialize_profile(profile: VoiceProfile) -> str:
 
 def _deserialize_profile(data: str) -> VoiceProfile:
     d = json.loads(data)
+    hnr_contour = d["pitch"].get("hnr_contour")
     pitch = PitchContour(
         f0=np.array(d["pitch"]["f0"], dtype=np.float32),
         voiced_mask=np.array(d["pitch"]["voiced_mask"], dtype=bool),
         f0_mean=d["pitch"]["f0_mean"],
         f0_std=d["pitch"]["f0_std"],
         harmonic_to_noise_ratio=d["pitch"]["harmonic_to_noise_ratio"],
+        hnr_contour=(
+            np.array(hnr_contour, dtype=np.float32)
+            if hnr_contour is not None
+            else None
+        ),
     )
     formants = FormantTrack(
         frequencies=np.array(d["formants"]["frequencies"], dtype=np.float32),
@@ -70,6 +106,9 @@ class ProfileStore:
     def __init__(self, db_path: str = DEFAULT_DB_PATH):
         self.db_path = db_path
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._index = ProfileFeatureIndex()
+        self._index_revision: Optional[int] = None
+        self._index_lock = threading.Lock()
         self._init_db()
 
     def _connect(self) -> sqlite3.Connection:
@@ -88,10 +127,78 @@ class ProfileStore:
                 )
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS profile_features (
+                    name TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS profile_index_meta (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    revision INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO profile_index_meta (id, revision) VALUES (0, 0)"
+            )
+            missing = conn.execute(
+                """
+                SELECT name, data FROM profiles
+                WHERE name NOT IN (SELECT name FROM profile_features)
+                """
+            ).fetchall()
+            for name, data in missing:
+                self._write_features(
+                    conn, name, profile_features(_deserialize_profile(data))
+                )
             conn.commit()
 
+    def _write_features(
+        self, conn: sqlite3.Connection, name: str, features: np.ndarray
+    ) -> int:
+        conn.execute(
+            "INSERT OR REPLACE INTO profile_features (name, vector) VALUES (?, ?)",
+            (name, features.astype(np.float64).tobytes()),
+        )
+        return self._bump_revision(conn)
+
+    def _bump_revision(self, conn: sqlite3.Connection) -> int:
+        conn.execute(
+            "UPDATE profile_index_meta SET revision = revision + 1 WHERE id = 0"
+        )
+        return conn.execute(
+            "SELECT revision FROM profile_index_meta WHERE id = 0"
+        ).fetchone()[0]
+
+    def _current_index(self) -> ProfileFeatureIndex:
+        with self._connect() as conn:
+            revision = conn.execute(
+                "SELECT revision FROM profile_index_meta WHERE id = 0"
+            ).fetchone()[0]
+            if revision == self._index_revision:
+                return self._index
+            rows = conn.execute(
+                "SELECT name, vector FROM profile_features ORDER BY name"
+            ).fetchall()
+        index = ProfileFeatureIndex(
+            [row[0] for row in rows],
+            np.array(
+                [np.frombuffer(row[1], dtype=np.float64) for row in rows]
+            ),
+        )
+        self._index = index
+        self._index_revision = revision
+        return index
+
+    @_timed("save")
     def save(self, name: str, profile: VoiceProfile) -> None:
         serialized = _serialize_profile(profile)
+        features = profile_features(profile)
         with self._connect() as conn:
             conn.execute(
                 """
@@ -100,8 +207,14 @@ class ProfileStore:
                 """,
                 (name, serialized, profile.sample_rate, profile.pitch.f0_mean),
             )
+            revision = self._write_features(conn, name, features)
             conn.commit()
+        with self._index_lock:
+            if self._index_revision == revision - 1:
+                self._index.add(name, features)
+                self._index_revision = revision
 
+    @_timed("load")
     def load(self, name: str) -> Optional[VoiceProfile]:
         with self._connect() as conn:
             row = conn.execute(
@@ -111,14 +224,37 @@ class ProfileStore:
             return None
         return _deserialize_profile(row[0])
 
+    @_timed("delete")
     def delete(self, name: str) -> bool:
         with self._connect() as conn:
             cursor = conn.execute(
                 "DELETE FROM profiles WHERE name = ?", (name,)
             )
+            conn.execute(
+                "DELETE FROM profile_features WHERE name = ?", (name,)
+            )
+            revision = self._bump_revision(conn)
             conn.commit()
+        with self._index_lock:
+            if self._index_revision == revision - 1:
+                self._index.remove(name)
+                self._index_revision = revision
         return cursor.rowcount > 0
 
+    @_timed("nearest")
+    def nearest(
+        self,
+        source: VoiceProfile,
+        k: int = 5,
+        exclude: Optional[List[str]] = None,
+    ) -> List[VoiceMatch]:
+        features = profile_features(source)
+        with self._index_lock:
+            return self._current_index().query(
+                features, k=k, exclude=exclude or ()
+            )
+
+    @_timed("list_profiles")
     def list_profiles(self) -> List[Dict[str, object]]:
         with self._connect() as conn:
             rows = conn.execute(
@@ -134,6 +270,7 @@ class ProfileStore:
             for row in rows
         ]
 
+    @_timed("exists")
     def exists(self, name: str) -> bool:
         with self._connect() as conn:
             row = conn.execute(
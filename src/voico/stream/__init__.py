@@ -1,3 +1,27 @@
-from .streamer import VoiceStreamProcessor
+from .latency import StreamPlan, StreamStats, plan_latency
+from .ola import OverlapAdd
+from .pcm import decode_pcm, encode_pcm
+from .scheduler import (
+    StreamScheduler,
+    StreamSession,
+    get_stream_scheduler,
+    set_stream_scheduler,
+)
+from .streamer import VoiceStreamProcessor, process_batch
+from .vocoder import PhaseVocoder
 
-__all__ = ["VoiceStreamProcessor"]
+__all__ = [
+    "OverlapAdd",
+    "PhaseVocoder",
+    "StreamPlan",
+    "StreamScheduler",
+    "StreamSession",
+    "StreamStats",
+    "VoiceStreamProcessor",
+    "decode_pcm",
+    "encode_pcm",
+    "get_stream_scheduler",
+    "plan_latency",
+    "process_batch",
+    "set_stream_scheduler",
+]
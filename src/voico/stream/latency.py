@@ -0,0 +1,192 @@
+import logging
+import math
+from collections import deque
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Deque, Dict, Optional
+
+import numpy as np
+
+from ..core.config import LatencyBudget, ResampleQuality
+from ..dsp.resampler import Resampler
+
+logger = logging.getLogger(__name__)
+
+MAX_HOP_DIVISOR = 16
+_JITTER_GAIN = 1.0 / 16.0
+
+
+def analysis_hop_for(hop_length: int, n_fft: int, pitch_shift: float) -> int:
+    factor = 2.0 ** (pitch_shift / 12.0)
+    return int(np.clip(round(hop_length / factor), 1, n_fft))
+
+
+@lru_cache(maxsize=256)
+def _resampler_latency(
+    hop_length: int, analysis_hop: int, resample_quality: ResampleQuality
+) -> int:
+    return Resampler(hop_length, analysis_hop, resample_quality).latency_samples
+
+
+def algorithmic_latency(
+    n_fft: int,
+    hop_length: int,
+    analysis_hop: Optional[int] = None,
+    resample_quality: ResampleQuality = ResampleQuality.FAST,
+) -> int:
+    analysis_hop = analysis_hop or hop_length
+    ratio = hop_length / analysis_hop
+    latency = n_fft / 2 + (n_fft / 2 - hop_length) / ratio
+    if analysis_hop != hop_length:
+        latency += (
+            _resampler_latency(hop_length, analysis_hop, resample_quality) / ratio
+        )
+    return math.ceil(latency)
+
+
+@dataclass(frozen=True)
+class StreamPlan:
+    sample_rate: int
+    n_fft: int
+    hop_length: int
+    look_ahead_samples: int
+    latency_samples: int
+
+    @property
+    def latency_ms(self) -> float:
+        return 1000.0 * self.latency_samples / self.sample_rate
+
+
+def _worst_case_latency(
+    n_fft: int,
+    hop_length: int,
+    max_pitch_shift: float,
+    resample_quality: ResampleQuality,
+) -> int:
+    return max(
+        algorithmic_latency(
+            n_fft,
+            hop_length,
+            analysis_hop_for(hop_length, n_fft, shift),
+            resample_quality,
+        )
+        for shift in (-max_pitch_shift, 0.0)
+    )
+
+
+def plan_latency(
+    budget: LatencyBudget,
+    sample_rate: int,
+    hop_divisor: int,
+    resample_quality: ResampleQuality = ResampleQuality.FAST,
+) -> StreamPlan:
+    target = budget.target_ms * sample_rate / 1000.0
+    candidates = []
+    n_fft = budget.max_n_fft
+    while n_fft >= budget.min_n_fft:
+        divisor = hop_divisor
+        while divisor <= min(MAX_HOP_DIVISOR, n_fft):
+            candidates.append((n_fft, n_fft // divisor))
+            divisor *= 2
+        n_fft //= 2
+
+    best = None
+    for n_fft, hop_length in candidates:
+        latency = _worst_case_latency(
+            n_fft, hop_length, budget.max_pitch_shift, resample_quality
+        )
+        best = StreamPlan(
+            sample_rate, n_fft, hop_length, n_fft - hop_length, latency
+        )
+        if latency <= target:
+            return best
+
+    if best is None:
+        raise ValueError(
+            f"No valid frame size between {budget.min_n_fft} and "
+            f"{budget.max_n_fft} for hop divisor {hop_divisor}"
+        )
+    logger.warning(
+        f"Latency budget {budget.target_ms:.1f}ms is not reachable; "
+        f"using n_fft={best.n_fft}, hop={best.hop_length} "
+        f"({best.latency_ms:.1f}ms)"
+    )
+    return best
+
+
+@dataclass
+class StreamStats:
+    algorithmic_latency_samples: int
+    algorithmic_latency_ms: float
+    chunks: int
+    audio_seconds: float
+    processing_seconds: float
+    mean_processing_ms: float
+    p95_processing_ms: float
+    max_processing_ms: float
+    jitter_ms: float
+    deadline_misses: int
+
+    @property
+    def realtime_factor(self) -> float:
+        if self.audio_seconds <= 0:
+            return 0.0
+        return self.processing_seconds / self.audio_seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        data = asdict(self)
+        data["realtime_factor"] = self.realtime_factor
+        return data
+
+
+class LatencyMonitor:
+    def __init__(self, sample_rate: int, window: int = 256):
+        self.sample_rate = sample_rate
+        self._recent: Deque[float] = deque(maxlen=window)
+        self.reset()
+
+    def reset(self) -> None:
+        self._recent.clear()
+        self._chunks = 0
+        self._audio_seconds = 0.0
+        self._processing_seconds = 0.0
+        self._max_seconds = 0.0
+        self._jitter = 0.0
+        self._last: Optional[float] = None
+        self._misses = 0
+
+    def record(
+        self, n_samples: int, seconds: float, deadline: Optional[float] = None
+    ) -> None:
+        duration = n_samples / self.sample_rate
+        if deadline is None:
+            deadline = duration if n_samples else math.inf
+        self._chunks += 1
+        self._audio_seconds += duration
+        self._processing_seconds += seconds
+        self._max_seconds = max(self._max_seconds, seconds)
+        self._recent.append(seconds)
+        if self._last is not None:
+            self._jitter += (abs(seconds - self._last) - self._jitter) * _JITTER_GAIN
+        self._last = seconds
+        if seconds > deadline:
+            self._misses += 1
+
+    def snapshot(self, latency_samples: int) -> StreamStats:
+        recent = np.array(self._recent) if self._recent else np.zeros(1)
+        return StreamStats(
+            algorithmic_latency_samples=latency_samples,
+            algorithmic_latency_ms=1000.0 * latency_samples / self.sample_rate,
+            chunks=self._chunks,
+            audio_seconds=self._audio_seconds,
+            processing_seconds=self._processing_seconds,
+            mean_processing_ms=(
+                1000.0 * self._processing_seconds / self._chunks
+                if self._chunks
+                else 0.0
+            ),
+            p95_processing_ms=1000.0 * float(np.percentile(recent, 95)),
+            max_processing_ms=1000.0 * self._max_seconds,
+            jitter_ms=1000.0 * self._jitter,
+            deadline_misses=self._misses,
+        )
@@ -0,0 +1,142 @@
+from typing import Optional
+
+import numpy as np
+import scipy.signal
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..core.constants import AudioConstants
+
+DEFAULT_MAX_HOPS = 8
+
+
+def _overlap_norm(window: np.ndarray, hop_length: int) -> np.ndarray:
+    n_fft = len(window)
+    overlap = -(-n_fft // hop_length)
+    padded = np.zeros(overlap * hop_length)
+    padded[:n_fft] = np.square(window)
+    return padded.reshape(overlap, hop_length).sum(axis=0)
+
+
+class OverlapAdd:
+    def __init__(
+        self,
+        n_fft: int,
+        hop_length: int,
+        max_hops: int = DEFAULT_MAX_HOPS,
+        window: str = "hann",
+        analysis_hop: Optional[int] = None,
+    ):
+        if n_fft % hop_length != 0:
+            raise ValueError(
+                f"hop_length must divide n_fft, got {hop_length} and {n_fft}"
+            )
+        if max_hops < 1:
+            raise ValueError(f"max_hops must be >= 1, got {max_hops}")
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.max_hops = max_hops
+        self.overlap = n_fft // hop_length
+        self.n_bins = n_fft // 2 + 1
+        self.window = scipy.signal.get_window(window, n_fft).astype(np.float32)
+        norm = _overlap_norm(self.window, hop_length)
+        self._inv_norm = (
+            1.0 / np.maximum(norm, AudioConstants.EPSILON)
+        ).astype(np.float32)
+
+        self._analysis_hop = hop_length
+        self._input = np.zeros(n_fft + max_hops * hop_length, np.float32)
+        self._accumulator = np.zeros(
+            (max_hops + self.overlap - 1, hop_length), np.float32
+        )
+        self._ready = 0
+        self._filled = n_fft - hop_length
+        self._pristine = True
+        self.analysis_hop = analysis_hop or hop_length
+
+    @property
+    def analysis_hop(self) -> int:
+        return self._analysis_hop
+
+    @analysis_hop.setter
+    def analysis_hop(self, value: int) -> None:
+        if not 1 <= value <= self.n_fft:
+            raise ValueError(
+                f"analysis_hop must be in [1, {self.n_fft}], got {value}"
+            )
+        capacity = self.n_fft + self.max_hops * value
+        if capacity > len(self._input):
+            grown = np.zeros(capacity, np.float32)
+            grown[:len(self._input)] = self._input
+            self._input = grown
+        self._analysis_hop = value
+        if self._pristine:
+            self._filled = self.n_fft - value
+
+    @property
+    def latency_samples(self) -> int:
+        return self.n_fft - self.hop_length
+
+    @property
+    def ready_hops(self) -> int:
+        return self._frames_available(self._filled)
+
+    def _frames_available(self, filled: int) -> int:
+        if filled < self.n_fft:
+            return 0
+        return (filled - self.n_fft) // self._analysis_hop + 1
+
+    def output_size(self, n_samples: int) -> int:
+        return self._frames_available(self._filled + n_samples) * self.hop_length
+
+    def write(self, samples: np.ndarray) -> int:
+        free = self.n_fft + (self.max_hops - 1) * self._analysis_hop
+        take = max(0, min(len(samples), free - self._filled))
+        self._input[self._filled:self._filled + take] = samples[:take]
+        self._filled += take
+        self._pristine = self._pristine and take == 0
+        return take
+
+    def prepare(self) -> int:
+        self._ready = min(self.ready_hops, self.max_hops)
+        return self._ready
+
+    def window_frames(self, out: np.ndarray) -> np.ndarray:
+        n_hops = self._ready
+        end = self.n_fft + (n_hops - 1) * self._analysis_hop
+        windows = sliding_window_view(self._input[:end], self.n_fft)
+        return np.multiply(
+            windows[::self._analysis_hop], self.window, out=out[:n_hops]
+        )
+
+    def overlap_add(self, frames: np.ndarray, out: np.ndarray) -> int:
+        n_hops = self._ready
+        if n_hops == 0:
+            return 0
+        hop = self.hop_length
+        frames *= self.window
+        blocks = frames.reshape(n_hops, self.overlap, hop)
+        for r in range(self.overlap):
+            self._accumulator[r:r + n_hops] += blocks[:, r]
+
+        n_out = n_hops * hop
+        np.multiply(
+            self._accumulator[:n_hops], self._inv_norm,
+            out=out[:n_out].reshape(n_hops, hop),
+        )
+        tail = self.overlap - 1
+        self._accumulator[:tail] = self._accumulator[n_hops:n_hops + tail]
+        self._accumulator[tail:] = 0.0
+
+        consumed = n_hops * self._analysis_hop
+        remaining = self._filled - consumed
+        self._input[:remaining] = self._input[consumed:self._filled]
+        self._filled = remaining
+        self._ready = 0
+        return n_out
+
+    def reset(self) -> None:
+        self._input[:] = 0.0
+        self._accumulator[:] = 0.0
+        self._filled = self.n_fft - self._analysis_hop
+        self._pristine = True
+        self._ready = 0
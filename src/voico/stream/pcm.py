@@ -0,0 +1,30 @@
+import numpy as np
+
+from ..core.config import PcmFormat
+
+_DTYPES = {
+    PcmFormat.FLOAT32: np.dtype("<f4"),
+    PcmFormat.INT16: np.dtype("<i2"),
+}
+_INT16_SCALE = 32768.0
+
+
+def decode_pcm(data: bytes, pcm_format: PcmFormat) -> np.ndarray:
+    dtype = _DTYPES[pcm_format]
+    if len(data) % dtype.itemsize:
+        raise ValueError(
+            f"PCM frame of {len(data)} bytes is not a whole number of "
+            f"{pcm_format.value} samples"
+        )
+    samples = np.frombuffer(data, dtype=dtype)
+    if pcm_format == PcmFormat.INT16:
+        return samples.astype(np.float32) / _INT16_SCALE
+    return samples.astype(np.float32)
+
+
+def encode_pcm(audio: np.ndarray, pcm_format: PcmFormat) -> bytes:
+    dtype = _DTYPES[pcm_format]
+    if pcm_format == PcmFormat.INT16:
+        scaled = np.clip(np.round(audio * _INT16_SCALE), -32768, 32767)
+        return scaled.astype(dtype).tobytes()
+    return np.asarray(audio).astype(dtype).tobytes()
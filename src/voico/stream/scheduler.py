@@ -0,0 +1,286 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.telemetry import get_metrics_registry
+from .streamer import VoiceStreamProcessor, process_batch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 60.0
+DEFAULT_MAX_BATCH_SESSIONS = 64
+
+_ACTIVE_SESSIONS = get_metrics_registry().gauge(
+    "voico_stream_sessions",
+    "Streaming sessions hosted by the scheduler.",
+)
+_BATCH_SESSIONS = get_metrics_registry().histogram(
+    "voico_stream_batch_sessions",
+    "Sessions sharing one batched FFT call.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+_Pending = Tuple[float, np.ndarray, "asyncio.Future[np.ndarray]"]
+
+
+@dataclass
+class StreamSession:
+    session_id: str
+    processor: VoiceStreamProcessor
+    deadline: Optional[float] = None
+    last_active: float = field(default_factory=time.monotonic)
+    pending: Deque[_Pending] = field(default_factory=deque)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def budget(self, chunk: np.ndarray) -> float:
+        if self.deadline is not None:
+            return self.deadline
+        return len(chunk) / self.processor.sample_rate
+
+
+_WorkItem = Tuple[StreamSession, np.ndarray, float]
+
+
+def _process_group(items: List[_WorkItem]) -> List[np.ndarray]:
+    sessions = [session for session, _, _ in items]
+    for session in sorted(sessions, key=lambda s: s.session_id):
+        session.lock.acquire()
+    try:
+        started = time.monotonic()
+        outputs = process_batch(
+            [session.processor for session in sessions],
+            [chunk for _, chunk, _ in items],
+            [deadline_at - started for _, _, deadline_at in items],
+        )
+        finished = time.monotonic()
+        for session in sessions:
+            session.last_active = finished
+    finally:
+        for session in sessions:
+            session.lock.release()
+    _BATCH_SESSIONS.observe(len(items))
+    return outputs
+
+
+class StreamScheduler:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_batch_sessions: int = DEFAULT_MAX_BATCH_SESSIONS,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.idle_timeout = idle_timeout
+        self.max_batch_sessions = max_batch_sessions
+        self._executor = ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="voico-stream"
+        )
+        self._sessions: Dict[str, StreamSession] = {}
+        self._lock = threading.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task[None]] = None
+
+    @property
+    def session_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._sessions)
+
+    def open_session(
+        self,
+        processor: Optional[VoiceStreamProcessor] = None,
+        session_id: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **processor_kwargs: Any,
+    ) -> StreamSession:
+        session = StreamSession(
+            session_id=session_id or uuid.uuid4().hex[:12],
+            processor=processor or VoiceStreamProcessor(**processor_kwargs),
+            deadline=deadline,
+        )
+        with self._lock:
+            if session.session_id in self._sessions:
+                raise ValueError(f"Session already open: {session.session_id}")
+            self._sessions[session.session_id] = session
+            _ACTIVE_SESSIONS.set(len(self._sessions))
+        return session
+
+    def session(self, session_id: str) -> StreamSession:
+        with self._lock:
+            session = self._sessions.get(session_id)
+        if session is None:
+            raise KeyError(f"Unknown stream session: {session_id}")
+        return session
+
+    def close_session(self, session_id: str) -> np.ndarray:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            _ACTIVE_SESSIONS.set(len(self._sessions))
+        if session is None:
+            raise KeyError(f"Unknown stream session: {session_id}")
+        for _, _, future in session.pending:
+            if not future.done():
+                future.get_loop().call_soon_threadsafe(future.cancel)
+        session.pending.clear()
+        with session.lock:
+            return session.processor.flush()
+
+    async def aclose_session(self, session_id: str) -> np.ndarray:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.close_session, session_id
+        )
+
+    def cleanup_idle(self, now: Optional[float] = None) -> List[str]:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            idle = [
+                session_id
+                for session_id, session in self._sessions.items()
+                if not session.pending
+                and now - session.last_active > self.idle_timeout
+            ]
+        for session_id in idle:
+            logger.info(f"Closing idle stream session {session_id}")
+            try:
+                self.close_session(session_id)
+            except KeyError:
+                pass
+        return idle
+
+    def _batches(self, items: List[_WorkItem]) -> List[List[_WorkItem]]:
+        groups: Dict[Tuple[int, int], List[_WorkItem]] = {}
+        for item in sorted(items, key=lambda item: item[2]):
+            processor = item[0].processor
+            key = (processor.n_fft, processor.hop_length)
+            groups.setdefault(key, []).append(item)
+        batches = []
+        for group in groups.values():
+            for start in range(0, len(group), self.max_batch_sessions):
+                batches.append(group[start:start + self.max_batch_sessions])
+        batches.sort(key=lambda batch: batch[0][2])
+        return batches
+
+    def process(self, chunks: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        now = time.monotonic()
+        items = []
+        for session_id, chunk in chunks.items():
+            session = self.session(session_id)
+            session.last_active = now
+            items.append((session, chunk, now + session.budget(chunk)))
+        results: Dict[str, np.ndarray] = {}
+        batches = self._batches(items)
+        for batch, outputs in zip(
+            batches, self._executor.map(_process_group, batches)
+        ):
+            for (session, _, _), output in zip(batch, outputs):
+                results[session.session_id] = output
+        return results
+
+    async def submit(self, session_id: str, chunk: np.ndarray) -> np.ndarray:
+        session = self.session(session_id)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[np.ndarray] = loop.create_future()
+        now = time.monotonic()
+        session.last_active = now
+        session.pending.append((now + session.budget(chunk), chunk, future))
+        self._ensure_dispatcher(loop)
+        self._wakeup.set()
+        return await future
+
+    def _ensure_dispatcher(self, loop: asyncio.AbstractEventLoop) -> None:
+        if (
+            self._dispatcher is not None
+            and not self._dispatcher.done()
+            and self._dispatcher.get_loop() is loop
+        ):
+            return
+        self._wakeup = asyncio.Event()
+        self._dispatcher = loop.create_task(self._dispatch(self._wakeup))
+
+    def _take_pending(self) -> List[Tuple[_WorkItem, "asyncio.Future"]]:
+        with self._lock:
+            sessions = list(self._sessions.values())
+        taken = []
+        for session in sessions:
+            while session.pending:
+                deadline_at, chunk, future = session.pending.popleft()
+                if not future.done():
+                    taken.append(((session, chunk, deadline_at), future))
+                    break
+        return taken
+
+    async def _dispatch(self, wakeup: asyncio.Event) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await asyncio.wait_for(
+                    wakeup.wait(), timeout=max(self.idle_timeout / 2, 0.01)
+                )
+            except asyncio.TimeoutError:
+                await loop.run_in_executor(self._executor, self.cleanup_idle)
+                continue
+            wakeup.clear()
+            while True:
+                taken = self._take_pending()
+                if not taken:
+                    break
+                futures = {id(item[0]): future for item, future in taken}
+                batches = self._batches([item for item, _ in taken])
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            self._executor, _process_group, batch
+                        )
+                        for batch in batches
+                    ),
+                    return_exceptions=True,
+                )
+                for batch, result in zip(batches, results):
+                    for index, (session, _, _) in enumerate(batch):
+                        future = futures[id(session)]
+                        if future.done():
+                            continue
+                        if isinstance(result, BaseException):
+                            future.set_exception(result)
+                        else:
+                            future.set_result(result[index])
+            await loop.run_in_executor(self._executor, self.cleanup_idle)
+
+    def shutdown(self) -> None:
+        if self._dispatcher is not None and not self._dispatcher.done():
+            self._dispatcher.get_loop().call_soon_threadsafe(
+                self._dispatcher.cancel
+            )
+        for session_id in self.session_ids:
+            self.close_session(session_id)
+        self._executor.shutdown(wait=True)
+
+
+_default_scheduler: Optional[StreamScheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_stream_scheduler() -> StreamScheduler:
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = StreamScheduler()
+        return _default_scheduler
+
+
+def set_stream_scheduler(
+    scheduler: Optional[StreamScheduler],
+) -> Optional[StreamScheduler]:
+    global _default_scheduler
+    with _default_lock:
+        previous = _default_scheduler
+        _default_scheduler = scheduler
+        return previous
@@ -1,12 +1,36 @@
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import AsyncIterator, Iterator, Optional
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import numpy as np
-import scipy.signal
 
-from ..core.config import ConversionQuality, QualitySettings
+from ..core.config import ConversionQuality, LatencyBudget, QualitySettings
 from ..core.constants import AudioConstants
+from ..dsp.resampler import Resampler
+from .latency import (
+    LatencyMonitor,
+    StreamStats,
+    algorithmic_latency,
+    analysis_hop_for,
+    plan_latency,
+)
+from .ola import DEFAULT_MAX_HOPS, OverlapAdd
+from .vocoder import PhaseVocoder
+
+if TYPE_CHECKING:
+    from .scheduler import StreamScheduler
+
+_SHIFT_TOLERANCE = 0.01
+
+_workspace = threading.local()
 
 
 class VoiceStreamProcessor:
@@ -16,86 +40,186 @@ class VoiceStreamProcessor:
         pitch_shift: float = 0.0,
         formant_shift: float = 1.0,
         quality: ConversionQuality = ConversionQuality.FAST,
+        max_hops: int = DEFAULT_MAX_HOPS,
+        latency_budget: Optional[LatencyBudget] = None,
     ):
         self.sample_rate = sample_rate
-        self.pitch_shift = pitch_shift
-        self.formant_shift = formant_shift
         self._settings = QualitySettings.from_preset(quality)
-        self._n_fft = AudioConstants.DEFAULT_N_FFT
-        self._hop_length = self._n_fft // self._settings.hop_divisor
-        self._window = scipy.signal.get_window("hann", self._n_fft)
-        self._buffer = np.zeros(self._n_fft * 2, dtype=np.float32)
-        self._output_buffer = np.zeros(self._n_fft * 2, dtype=np.float32)
-        self._buffer_pos = 0
-
-    def process_chunk(self, chunk: np.ndarray) -> np.ndarray:
-        chunk = chunk.astype(np.float32)
-        n = len(chunk)
-        output_samples = np.zeros(n, dtype=np.float32)
-        pos = 0
-
-        while pos < n:
-            space = self._hop_length - self._buffer_pos % self._hop_length
-            take = min(space, n - pos)
-            write_start = self._buffer_pos % len(self._buffer)
-            write_end = min(write_start + take, len(self._buffer))
-            actual_take = write_end - write_start
-            self._buffer[write_start:write_end] = chunk[pos:pos + actual_take]
-            self._buffer_pos += actual_take
-            pos += actual_take
-
-            if self._buffer_pos > 0 and self._buffer_pos % self._hop_length == 0:
-                buf_start = max(0, self._buffer_pos - self._n_fft)
-                frame = self._buffer[buf_start % len(self._buffer):
-                                     buf_start % len(self._buffer) + min(self._n_fft, len(self._buffer))]
-                if len(frame) < self._n_fft:
-                    frame = np.pad(frame, (0, self._n_fft - len(frame)))
-                processed = self._process_frame(frame[:self._n_fft])
-                out_start = max(0, pos - len(processed))
-                out_len = min(len(processed), n - out_start)
-                output_samples[out_start:out_start + out_len] += processed[:out_len] * 0.5
-
-        return output_samples
-
-    def _process_frame(self, frame: np.ndarray) -> np.ndarray:
-        windowed = frame * self._window.astype(np.float32)
-
-        if abs(self.pitch_shift) < 0.01 and abs(self.formant_shift - 1.0) < 0.01:
-            return windowed
-
-        spectrum = np.fft.rfft(windowed)
-        magnitude = np.abs(spectrum)
-        phase = np.angle(spectrum)
-
-        if abs(self.formant_shift - 1.0) >= 0.01:
-            n_bins = len(magnitude)
-            target_bins = np.clip(
-                np.arange(n_bins) * self.formant_shift, 0, n_bins - 1
-            )
-            magnitude = np.interp(
-                np.arange(n_bins), target_bins, magnitude
+        if latency_budget is None:
+            self._n_fft = AudioConstants.DEFAULT_N_FFT
+            self._hop_length = self._n_fft // self._settings.hop_divisor
+        else:
+            plan = plan_latency(
+                latency_budget,
+                sample_rate,
+                self._settings.hop_divisor,
+                self._settings.resample_quality,
             )
+            self._n_fft = plan.n_fft
+            self._hop_length = plan.hop_length
+        self._monitor = LatencyMonitor(sample_rate)
+        self._ola = OverlapAdd(self._n_fft, self._hop_length, max_hops)
+        self._vocoder = PhaseVocoder(
+            self._n_fft, self._hop_length, self._hop_length
+        )
+        self._resampler: Optional[Resampler] = None
+        self._carry = np.zeros(0, dtype=np.float32)
+        self._samples_in = 0
+        self._samples_out = 0
+        self._warp: Optional[Tuple[np.ndarray, ...]] = None
+        self._pitch_shift = pitch_shift
+        self._formant_shift = formant_shift
+        self._update_stretch()
+        self._update_warp()
+
+    @property
+    def pitch_shift(self) -> float:
+        return self._pitch_shift
+
+    @pitch_shift.setter
+    def pitch_shift(self, value: float) -> None:
+        self._pitch_shift = value
+        self._update_stretch()
+
+    @property
+    def formant_shift(self) -> float:
+        return self._formant_shift
+
+    @formant_shift.setter
+    def formant_shift(self, value: float) -> None:
+        self._formant_shift = value
+        self._update_warp()
+
+    @property
+    def pitch_ratio(self) -> float:
+        return self._hop_length / self._ola.analysis_hop
 
-        if abs(self.pitch_shift) >= 0.01:
-            factor = 2.0 ** (self.pitch_shift / 12.0)
-            n_bins = len(magnitude)
-            src_bins = np.arange(n_bins) / factor
-            valid = src_bins < n_bins
-            new_mag = np.zeros(n_bins, dtype=np.float32)
-            new_mag[valid] = np.interp(
-                src_bins[valid], np.arange(n_bins), magnitude
+    @property
+    def n_fft(self) -> int:
+        return self._n_fft
+
+    @property
+    def hop_length(self) -> int:
+        return self._hop_length
+
+    @property
+    def latency_samples(self) -> int:
+        return algorithmic_latency(
+            self._n_fft,
+            self._hop_length,
+            self._ola.analysis_hop,
+            self._settings.resample_quality,
+        )
+
+    @property
+    def stats(self) -> StreamStats:
+        return self._monitor.snapshot(self.latency_samples)
+
+    def reset_stats(self) -> None:
+        self._monitor.reset()
+
+    def _alignment(self) -> int:
+        ratio = self.pitch_ratio
+        return round(
+            self._n_fft / 2 + (self._n_fft / 2 - self._hop_length) / ratio
+        )
+
+    def _update_stretch(self) -> None:
+        analysis_hop = self._hop_length
+        if abs(self._pitch_shift) >= _SHIFT_TOLERANCE:
+            analysis_hop = analysis_hop_for(
+                self._hop_length, self._n_fft, self._pitch_shift
             )
-            magnitude = new_mag
+        if analysis_hop == self._ola.analysis_hop and (
+            (self._resampler is None) == (analysis_hop == self._hop_length)
+        ):
+            return
+        if self._resampler is not None:
+            self._carry = np.concatenate([self._carry, self._resampler.flush()])
+        self._ola.analysis_hop = analysis_hop
+        self._vocoder.analysis_hop = analysis_hop
+        if analysis_hop == self._hop_length:
+            self._resampler = None
+            self._vocoder.reset()
+        else:
+            self._resampler = Resampler(
+                self._hop_length, analysis_hop, self._settings.resample_quality
+            )
+
+    def _update_warp(self) -> None:
+        scale = self._formant_shift
+        if abs(scale - 1.0) < _SHIFT_TOLERANCE:
+            self._warp = None
+            return
+        n_bins = self._ola.n_bins
+        source = np.arange(n_bins) / scale
+        valid = source <= n_bins - 1
+        lower = np.minimum(np.floor(source), n_bins - 1).astype(np.intp)
+        upper = np.minimum(lower + 1, n_bins - 1)
+        fraction = (source - lower).astype(np.float32)
+        self._warp = (
+            lower,
+            upper,
+            np.where(valid, 1.0 - fraction, 0.0).astype(np.float32),
+            np.where(valid, fraction, 0.0).astype(np.float32),
+        )
 
-        reconstructed = magnitude * np.exp(1j * phase)
-        return np.fft.irfft(reconstructed).astype(np.float32)[:len(frame)]
+    def _transform(self, spectra: np.ndarray) -> None:
+        if len(spectra) == 0:
+            return
+        if self._resampler is not None:
+            self._vocoder.process(spectra)
+        if self._warp is None:
+            return
+        lower, upper, lower_weight, upper_weight = self._warp
+        shape = spectra.shape
+        magnitude = np.abs(
+            spectra, out=_workspace_buffer("magnitude", shape, np.float32)
+        )
+        warped = np.take(
+            magnitude,
+            lower,
+            axis=1,
+            out=_workspace_buffer("warped", shape, np.float32),
+        )
+        warped *= lower_weight
+        scratch = np.take(
+            magnitude,
+            upper,
+            axis=1,
+            out=_workspace_buffer("scratch", shape, np.float32),
+        )
+        scratch *= upper_weight
+        warped += scratch
+        np.maximum(magnitude, AudioConstants.EPSILON, out=magnitude)
+        warped /= magnitude
+        spectra *= warped
+
+    def _finish(self, output: np.ndarray) -> np.ndarray:
+        if self._resampler is not None:
+            output = self._resampler.process(output)
+        if len(self._carry):
+            output = np.concatenate([self._carry, output])
+            self._carry = np.zeros(0, dtype=np.float32)
+        return output
+
+    def process_chunk(
+        self, chunk: np.ndarray, deadline: Optional[float] = None
+    ) -> np.ndarray:
+        return process_batch([self], [chunk], [deadline])[0]
 
     def flush(self) -> np.ndarray:
-        remaining = np.zeros(self._n_fft, dtype=np.float32)
-        result = self._process_frame(remaining)
-        self._buffer[:] = 0
-        self._output_buffer[:] = 0
-        self._buffer_pos = 0
+        tail = _render_batch(
+            [self], [np.zeros(self._n_fft + self._hop_length, dtype=np.float32)]
+        )[0]
+        if self._resampler is not None:
+            tail = np.concatenate([tail, self._resampler.flush()])
+        remaining = self._samples_in + self._alignment() - self._samples_out
+        result = tail[:max(0, remaining)]
+        self._ola.reset()
+        self._vocoder.reset()
+        self._samples_in = 0
+        self._samples_out = 0
         return result
 
     def stream(
@@ -104,24 +228,115 @@ class VoiceStreamProcessor:
     ) -> Iterator[np.ndarray]:
         for chunk in audio_iterator:
             output = self.process_chunk(chunk)
-            if np.any(output != 0):
+            if output.size:
                 yield output
         final = self.flush()
-        if np.any(final != 0):
+        if final.size:
             yield final
 
     async def astream(
         self,
         audio_iterator: AsyncIterator[np.ndarray],
+        scheduler: Optional["StreamScheduler"] = None,
     ) -> AsyncIterator[np.ndarray]:
-        loop = asyncio.get_event_loop()
-        executor = ThreadPoolExecutor(max_workers=1)
-        async for chunk in audio_iterator:
-            output = await loop.run_in_executor(
-                executor, self.process_chunk, chunk
-            )
-            if np.any(output != 0):
-                yield output
-        final = await loop.run_in_executor(executor, self.flush)
-        if np.any(final != 0):
+        from .scheduler import get_stream_scheduler
+
+        scheduler = scheduler or get_stream_scheduler()
+        session = scheduler.open_session(self)
+        try:
+            async for chunk in audio_iterator:
+                output = await scheduler.submit(session.session_id, chunk)
+                if output.size:
+                    yield output
+        finally:
+            final = await scheduler.aclose_session(session.session_id)
+        if final.size:
             yield final
+
+
+def _workspace_buffer(
+    name: str, shape: Tuple[int, int], dtype: type
+) -> np.ndarray:
+    buffers = getattr(_workspace, "buffers", None)
+    if buffers is None:
+        buffers = _workspace.buffers = {}
+    key = (name, shape[1], np.dtype(dtype))
+    buffer = buffers.get(key)
+    if buffer is None or len(buffer) < shape[0]:
+        buffer = buffers[key] = np.empty(shape, dtype=dtype)
+    return buffer[:shape[0]]
+
+
+def _render_batch(
+    processors: Sequence[VoiceStreamProcessor], chunks: Sequence[np.ndarray]
+) -> List[np.ndarray]:
+    n_fft = processors[0].n_fft
+    olas = [processor._ola for processor in processors]
+    outputs = [
+        np.empty(ola.output_size(len(chunk)), dtype=np.float32)
+        for ola, chunk in zip(olas, chunks)
+    ]
+    positions = [0] * len(processors)
+    written = [0] * len(processors)
+    capacity = sum(ola.max_hops for ola in olas)
+    frames = _workspace_buffer("frames", (capacity, n_fft), np.float32)
+    spectra_buffer = _workspace_buffer(
+        "spectra", (capacity, olas[0].n_bins), np.complex64
+    )
+
+    while True:
+        spans = []
+        total = 0
+        for i, (ola, chunk) in enumerate(zip(olas, chunks)):
+            if positions[i] < len(chunk):
+                positions[i] += ola.write(chunk[positions[i]:])
+            n_hops = ola.prepare()
+            if n_hops:
+                ola.window_frames(frames[total:])
+                spans.append((i, total, n_hops))
+                total += n_hops
+        if total == 0:
+            break
+        spectra = spectra_buffer[:total]
+        spectra[:] = np.fft.rfft(frames[:total], axis=1)
+        for i, start, n_hops in spans:
+            processors[i]._transform(spectra[start:start + n_hops])
+        frames[:total] = np.fft.irfft(spectra, n=n_fft, axis=1)
+        for i, start, n_hops in spans:
+            written[i] += olas[i].overlap_add(
+                frames[start:start + n_hops], outputs[i][written[i]:]
+            )
+
+    return [
+        processor._finish(output)
+        for processor, output in zip(processors, outputs)
+    ]
+
+
+def process_batch(
+    processors: Sequence[VoiceStreamProcessor],
+    chunks: Sequence[np.ndarray],
+    deadlines: Optional[Sequence[Optional[float]]] = None,
+) -> List[np.ndarray]:
+    if not processors:
+        return []
+    geometry = (processors[0].n_fft, processors[0].hop_length)
+    for processor in processors[1:]:
+        if (processor.n_fft, processor.hop_length) != geometry:
+            raise ValueError(
+                "Batched processors must share n_fft and hop_length, got "
+                f"{geometry} and {(processor.n_fft, processor.hop_length)}"
+            )
+    if deadlines is None:
+        deadlines = [None] * len(processors)
+    t0 = time.perf_counter()
+    chunks = [np.asarray(chunk, dtype=np.float32) for chunk in chunks]
+    outputs = _render_batch(processors, chunks)
+    elapsed = time.perf_counter() - t0
+    for processor, chunk, output, deadline in zip(
+        processors, chunks, outputs, deadlines
+    ):
+        processor._samples_in += len(chunk)
+        processor._samples_out += len(output)
+        processor._monitor.record(len(chunk), elapsed, deadline)
+    return outputs
@@ -0,0 +1,84 @@
+import numpy as np
+
+_TWO_PI = 2.0 * np.pi
+
+
+def _wrap(phase: np.ndarray) -> np.ndarray:
+    return np.mod(phase + np.pi, _TWO_PI) - np.pi
+
+
+def _nearest_peaks(magnitude: np.ndarray) -> np.ndarray:
+    n_bins = magnitude.shape[1]
+    is_peak = np.zeros(magnitude.shape, dtype=bool)
+    is_peak[:, 1:-1] = (magnitude[:, 1:-1] > magnitude[:, :-2]) & (
+        magnitude[:, 1:-1] >= magnitude[:, 2:]
+    )
+    bins = np.arange(n_bins)
+    previous = np.maximum.accumulate(np.where(is_peak, bins, -1), axis=1)
+    following = np.minimum.accumulate(
+        np.where(is_peak, bins, n_bins)[:, ::-1], axis=1
+    )[:, ::-1]
+    use_following = (following < n_bins) & (
+        (previous < 0) | (following - bins < bins - previous)
+    )
+    nearest = np.where(use_following, following, previous)
+    return np.where(nearest < 0, bins, nearest)
+
+
+class PhaseVocoder:
+    def __init__(self, n_fft: int, analysis_hop: int, synthesis_hop: int):
+        self.n_fft = n_fft
+        self.n_bins = n_fft // 2 + 1
+        self.synthesis_hop = synthesis_hop
+        self._bin_advance = np.zeros(self.n_bins)
+        self._previous_phase = np.zeros(self.n_bins)
+        self._synthesis_phase = np.zeros(self.n_bins)
+        self._primed = False
+        self.analysis_hop = analysis_hop
+
+    @property
+    def analysis_hop(self) -> int:
+        return self._analysis_hop
+
+    @analysis_hop.setter
+    def analysis_hop(self, value: int) -> None:
+        self._analysis_hop = value
+        self._bin_advance = (
+            _TWO_PI * value / self.n_fft * np.arange(self.n_bins)
+        )
+
+    @property
+    def stretch(self) -> float:
+        return self.synthesis_hop / self._analysis_hop
+
+    def reset(self) -> None:
+        self._previous_phase[:] = 0.0
+        self._synthesis_phase[:] = 0.0
+        self._primed = False
+
+    def process(self, spectra: np.ndarray) -> None:
+        n_frames = len(spectra)
+        if n_frames == 0:
+            return
+        magnitude = np.abs(spectra)
+        phase = np.angle(spectra).astype(np.float64)
+
+        previous = np.empty_like(phase)
+        previous[0] = self._previous_phase
+        previous[1:] = phase[:-1]
+        deviation = _wrap(phase - previous - self._bin_advance)
+        advance = (self._bin_advance + deviation) * self.stretch
+        if not self._primed:
+            advance[0] = phase[0] - self._synthesis_phase
+            self._primed = True
+
+        accumulated = _wrap(self._synthesis_phase + np.cumsum(advance, axis=0))
+        self._synthesis_phase = accumulated[-1].copy()
+        self._previous_phase = phase[-1].copy()
+
+        peaks = _nearest_peaks(magnitude)
+        rows = np.arange(n_frames)[:, np.newaxis]
+        locked = (
+            accumulated[rows, peaks] + phase - phase[rows, peaks]
+        )
+        spectra[:] = magnitude * np.exp(1j * locked)
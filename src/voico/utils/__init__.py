@@ -1,5 +1,6 @@
 from ._internals import safe_divide, timer
 from .audio_io import get_audio_info, load_audio, normalize_audio, save_audio
+from .tracing import span, traced, tracing
 
 __all__ = [
     "get_audio_info",
@@ -7,5 +8,8 @@ __all__ = [
     "normalize_audio",
     "safe_divide",
     "save_audio",
+    "span",
     "timer",
+    "traced",
+    "tracing",
 ]
@@ -1,15 +1,16 @@
 import logging
 import os
-from math import gcd
 from typing import Dict, Optional, Tuple
 
 import numpy as np
 import scipy.io.wavfile as wav
-from scipy.signal import resample_poly
 
 from ..backends import LIBROSA_AVAILABLE, SOUNDFILE_AVAILABLE
+from ..core.config import ResampleQuality
 from ..core.constants import AudioConstants
 from ..core.errors import AudioLoadError, AudioSaveError
+from ..dsp.resampler import resample
+from .tracing import traced
 
 if LIBROSA_AVAILABLE:
     import librosa
@@ -22,34 +23,20 @@ logger = logging.getLogger(__name__)
 SUPPORTED_EXTENSIONS = {".wav", ".flac", ".ogg", ".mp3", ".aiff", ".aif"}
 
 
+@traced("load_audio", "io")
 def load_audio(
-    path: str, target_sr: Optional[int] = None
+    path: str,
+    target_sr: Optional[int] = None,
+    resample_quality: ResampleQuality = ResampleQuality.STANDARD,
 ) -> Tuple[np.ndarray, int]:
     try:
         if LIBROSA_AVAILABLE:
-            audio, sample_rate = librosa.load(path, sr=target_sr, mono=True)
-            return audio, sample_rate
-
-        file_sample_rate, audio = wav.read(path)
-        sample_rate = file_sample_rate
-
-        if audio.dtype == np.int16:
-            audio = audio.astype(np.float32) / 32768.0
-        elif audio.dtype == np.int32:
-            audio = audio.astype(np.float32) / 2147483648.0
-        elif audio.dtype == np.uint8:
-            audio = (audio.astype(np.float32) - 128.0) / 128.0
-        elif audio.dtype not in [np.float32, np.float64]:
-            audio = audio.astype(np.float32)
-
-        if len(audio.shape) > 1:
-            audio = np.mean(audio, axis=1)
+            audio, sample_rate = librosa.load(path, sr=None, mono=True)
+        else:
+            audio, sample_rate = _read_wav(path)
 
         if target_sr is not None and target_sr != sample_rate:
-            divisor = gcd(target_sr, sample_rate)
-            up = target_sr // divisor
-            down = sample_rate // divisor
-            audio = resample_poly(audio, up, down).astype(np.float32)
+            audio = resample(audio, sample_rate, target_sr, resample_quality)
             sample_rate = target_sr
 
         return audio, sample_rate
@@ -59,6 +46,24 @@ def load_audio(
         raise AudioLoadError(f"Failed to load '{path}': {e}") from e
 
 
+def _read_wav(path: str) -> Tuple[np.ndarray, int]:
+    sample_rate, audio = wav.read(path)
+
+    if audio.dtype == np.int16:
+        audio = audio.astype(np.float32) / 32768.0
+    elif audio.dtype == np.int32:
+        audio = audio.astype(np.float32) / 2147483648.0
+    elif audio.dtype == np.uint8:
+        audio = (audio.astype(np.float32) - 128.0) / 128.0
+    elif audio.dtype not in [np.float32, np.float64]:
+        audio = audio.astype(np.float32)
+
+    if len(audio.shape) > 1:
+        audio = np.mean(audio, axis=1)
+
+    return audio, sample_rate
+
+
 def normalize_audio(
     audio: np.ndarray, target_peak: float = 0.95
 ) -> np.ndarray:
@@ -68,6 +73,7 @@ def normalize_audio(
     return audio
 
 
+@traced("save_audio", "io")
 def save_audio(
     path: str,
     audio: np.ndarray,
@@ -0,0 +1,189 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_MAX_SPANS = 1_000_000
+
+_SpanRecord = Tuple[str, str, int, int, int, Optional[Dict[str, Any]]]
+
+_NULL_SPAN = nullcontext()
+
+
+class Tracer:
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS):
+        self.pid = os.getpid()
+        self._spans: Deque[_SpanRecord] = deque(maxlen=max_spans)
+        self._merged: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._wall_origin_ns = time.time_ns()
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        self._spans.append((name, category, start_ns, end_ns - start_ns, tid, args))
+
+    def merge(self, events: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._merged.extend(events)
+
+    def _timestamp_us(self, perf_ns: int) -> float:
+        return (self._wall_origin_ns + perf_ns - self._origin_ns) / 1000.0
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self.pid,
+                "args": {"name": f"voico[{self.pid}]"},
+            }
+        ]
+        for tid, thread_name in list(self._thread_names.items()):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self.pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+            )
+        for name, category, start_ns, dur_ns, tid, args in list(self._spans):
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": self._timestamp_us(start_ns),
+                "dur": dur_ns / 1000.0,
+                "pid": self.pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        with self._lock:
+            events.extend(self._merged)
+        return events
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, default=str)
+
+
+class _Span:
+    __slots__ = ("_args", "_category", "_name", "_start", "_tracer")
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        category: str,
+        args: Optional[Dict[str, Any]],
+    ):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._tracer.record(
+            self._name,
+            self._category,
+            self._start,
+            time.perf_counter_ns(),
+            self._args,
+        )
+
+
+_active: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _active
+
+
+def is_tracing() -> bool:
+    return _active is not None
+
+
+def start_tracing(max_spans: int = DEFAULT_MAX_SPANS) -> Tracer:
+    global _active
+    _active = Tracer(max_spans)
+    return _active
+
+
+def stop_tracing() -> Optional[Tracer]:
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+
+def span(name: str, category: str = "voico", **args: Any):
+    tracer = _active
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, category, args or None)
+
+
+def traced(
+    name: Optional[str] = None, category: str = "voico"
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _active
+            if tracer is None:
+                return func(*args, **kwargs)
+            with _Span(tracer, span_name, category, None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def tracing(path: Optional[str] = None) -> Iterator[Tracer]:
+    tracer = start_tracing()
+    try:
+        yield tracer
+    finally:
+        stop_tracing()
+        if path is not None:
+            tracer.write(path)
+
+
+def run_traced(
+    func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Tuple[Any, List[Dict[str, Any]]]:
+    tracer = start_tracing()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        stop_tracing()
+    return result, tracer.events
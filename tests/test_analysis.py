@@ -1,11 +1,22 @@
+import os
+from typing import Tuple
+
 import numpy as np
 import pytest
 
+from voico.analysis.cache import AnalysisCache, audio_digest
+from voico.analysis.enrollment import enroll_files, merge_profiles
+from voico.analysis.excerpt import join_excerpts, select_voiced_excerpts
 from voico.analysis.formant import FormantAnalyzer
 from voico.analysis.matcher import VoiceMatcher
 from voico.analysis.pitch import PitchAnalyzer
 from voico.analysis.profile import VoiceAnalysisEngine
 from voico.analysis.spectral import SpectralAnalyzer
+from voico.analysis.streaming import (
+    QuantileSketch,
+    StreamingProfileBuilder,
+)
+from voico.core.config import ResampleQuality
 from voico.core.types import (
     FormantTrack,
     PitchContour,
@@ -59,6 +70,76 @@ class TestPitchAnalyzer:
 
         assert low_contour.f0_mean < high_contour.f0_mean
 
+    def test_hnr_contour_per_frame(
+        self, sine_wave_220hz: np.ndarray, sample_rate: int
+    ) -> None:
+        analyzer = PitchAnalyzer(sample_rate, hop_length=512, n_fft=2048)
+        contour = analyzer.detect(sine_wave_220hz)
+
+        assert contour.hnr_contour is not None
+        assert len(contour.hnr_contour) == len(contour.f0)
+        assert contour.harmonic_to_noise_ratio > 20.0
+
+    def test_hnr_lower_for_noisy_signal(
+        self, sine_wave_220hz: np.ndarray, sample_rate: int
+    ) -> None:
+        rng = np.random.default_rng(0)
+        noisy = sine_wave_220hz + 0.5 * rng.standard_normal(
+            len(sine_wave_220hz)
+        ).astype(np.float32)
+        analyzer = PitchAnalyzer(sample_rate, hop_length=512, n_fft=2048)
+        clean_hnr = analyzer.detect(sine_wave_220hz).harmonic_to_noise_ratio
+        noisy_hnr = analyzer.detect(noisy).harmonic_to_noise_ratio
+        assert noisy_hnr < clean_hnr
+
+    def test_hnr_contour_from_f0_matches_tracker(
+        self, sine_wave_220hz: np.ndarray, sample_rate: int
+    ) -> None:
+        analyzer = PitchAnalyzer(sample_rate, hop_length=512, n_fft=2048)
+        f0 = np.full(len(sine_wave_220hz) // 512 + 1, 220.0)
+        f0[:3] = np.nan
+        hnr = analyzer._compute_hnr_contour(sine_wave_220hz, f0)
+
+        assert len(hnr) == len(f0)
+        assert np.all(np.isnan(hnr[:3]))
+        assert np.nanmedian(hnr) > 20.0
+
+    def test_segmented_detect_matches_sequential(
+        self, sample_rate: int
+    ) -> None:
+        t = np.arange(sample_rate * 3) / sample_rate
+        audio = np.sin(
+            2 * np.pi * (150 + 50 * np.sin(t)) * t
+        ).astype(np.float32)
+        analyzer = PitchAnalyzer(
+            sample_rate,
+            hop_length=512,
+            n_fft=2048,
+            segment_seconds=0.5,
+            segment_overlap_seconds=0.2,
+        )
+        sequential = analyzer.detect(audio)
+        segmented = analyzer.detect(audio, n_workers=2)
+
+        assert segmented.f0.shape == sequential.f0.shape
+        np.testing.assert_array_equal(segmented.f0, sequential.f0)
+        np.testing.assert_array_equal(
+            segmented.voiced_mask, sequential.voiced_mask
+        )
+        assert segmented.f0_mean == sequential.f0_mean
+
+    def test_seam_disagreement_flags_octave_and_voicing(self) -> None:
+        from voico.analysis.pitch import _contour_disagreement
+
+        f0_a = np.array([200.0, 200.0, 200.0, np.nan])
+        f0_b = np.array([201.0, 400.0, np.nan, np.nan])
+        voiced_a = np.array([True, True, True, False])
+        voiced_b = np.array([True, True, False, False])
+        disagreement = _contour_disagreement(f0_a, voiced_a, f0_b, voiced_b)
+        np.testing.assert_array_equal(
+            disagreement, [False, True, True, False]
+        )
+
 
 class TestFormantAnalyzer:
     def test_analyze_returns_formant_track(
@@ -90,21 +171,122 @@ class TestFormantAnalyzer:
         track = analyzer.analyze(low_pitch, f0_contour)
         assert isinstance(track, FormantTrack)
 
-    def test_analyze_scipy_fallback(
+    @pytest.mark.parametrize("quality", list(ResampleQuality))
+    def test_analyze_resample_quality(
         self,
         sine_wave_440hz: np.ndarray,
         sample_rate: int,
-        monkeypatch: pytest.MonkeyPatch,
+        quality: ResampleQuality,
     ) -> None:
-        import voico.analysis.formant as formant_mod
-
-        monkeypatch.setattr(formant_mod, "LIBROSA_AVAILABLE", False)
-        analyzer = FormantAnalyzer(sample_rate, hop_length=512)
+        analyzer = FormantAnalyzer(
+            sample_rate, hop_length=512, resample_quality=quality
+        )
         f0_contour = np.full(86, 440.0)
         track = analyzer.analyze(sine_wave_440hz, f0_contour)
         assert isinstance(track, FormantTrack)
         assert track.frequencies.shape[0] == 5
 
+    def _voiced_with_silence(
+        self, sample_rate: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        from scipy.signal import lfilter
+
+        rng = np.random.default_rng(5)
+        audio = lfilter(
+            [1.0], [1.0, -1.3, 0.8], rng.standard_normal(sample_rate)
+        ).astype(np.float32)
+        audio[sample_rate // 3 : 2 * sample_rate // 3] = 0.0
+        f0_contour = np.full(86, 150.0)
+        f0_contour[29:57] = np.nan
+        return audio, f0_contour
+
+    def test_gating_interpolates_silent_frames(
+        self, sample_rate: int
+    ) -> None:
+        from voico.core.config import FormantGating
+
+        audio, f0_contour = self._voiced_with_silence(sample_rate)
+        full = FormantAnalyzer(sample_rate, hop_length=512).analyze(
+            audio, f0_contour
+        )
+        gated = FormantAnalyzer(
+            sample_rate, hop_length=512, gating=FormantGating.INTERPOLATE
+        ).analyze(audio, f0_contour)
+
+        silent = slice(32, 54)
+        assert np.all(gated.frequencies[0, silent] > 0)
+        np.testing.assert_allclose(
+            gated.mean_frequencies, full.mean_frequencies, rtol=1e-6
+        )
+
+    def test_gating_missing_leaves_silent_frames_empty(
+        self, sample_rate: int
+    ) -> None:
+        from voico.core.config import FormantGating
+
+        audio, f0_contour = self._voiced_with_silence(sample_rate)
+        track = FormantAnalyzer(
+            sample_rate, hop_length=512, gating=FormantGating.MISSING
+        ).analyze(audio, f0_contour)
+
+        assert np.all(track.frequencies[:, 32:54] == 0)
+        assert np.all(track.frequencies[0, :25] > 0)
+
+    def test_levinson_durbin_batch_matches_toeplitz_solve(self) -> None:
+        from scipy.linalg import solve_toeplitz
+
+        from voico.analysis.formant import (
+            _autocorrelation,
+            _levinson_durbin_batch,
+        )
+
+        rng = np.random.default_rng(3)
+        frames = rng.standard_normal((4, 250))
+        order = 12
+        autocorrelation = _autocorrelation(frames, order)
+        coefficients, converged = _levinson_durbin_batch(
+            autocorrelation, order
+        )
+
+        assert np.all(converged)
+        for row, r in zip(coefficients, autocorrelation):
+            expected = solve_toeplitz(r[:order], -r[1:])
+            np.testing.assert_allclose(row[1:], expected, rtol=1e-8)
+
+    def test_levinson_durbin_batch_flags_silent_frames(self) -> None:
+        from voico.analysis.formant import (
+            _autocorrelation,
+            _levinson_durbin_batch,
+        )
+
+        rng = np.random.default_rng(4)
+        frames = rng.standard_normal((3, 250))
+        frames[1] = 0.0
+        _, converged = _levinson_durbin_batch(
+            _autocorrelation(frames, 14), 14
+        )
+        np.testing.assert_array_equal(converged, [True, False, True])
+
+    def test_lpc_to_formants_batch_matches_np_roots(self) -> None:
+        from voico.analysis.formant import _lpc_to_formants_batch
+
+        sr = 10000
+        poles = []
+        for freq, bw in [(500, 60), (1500, 90), (2500, 120)]:
+            radius = np.exp(-2.0 * np.pi * bw / sr)
+            poles += [radius * np.exp(2j * np.pi * freq / sr)]
+            poles += [radius * np.exp(-2j * np.pi * freq / sr)]
+        coefficients = np.real(np.poly(poles))[np.newaxis, :]
+
+        frequencies, bandwidths = _lpc_to_formants_batch(
+            coefficients, sr, n_formants=5
+        )
+        np.testing.assert_allclose(
+            frequencies[0, :3], [500, 1500, 2500], atol=1e-6
+        )
+        np.testing.assert_allclose(bandwidths[0, :3], [60, 90, 120], atol=1e-6)
+        np.testing.assert_array_equal(frequencies[0, 3:], 0.0)
+
 
 class TestSpectralAnalyzer:
     def test_analyze_returns_features(
@@ -131,6 +313,34 @@ class TestSpectralAnalyzer:
         assert np.all(ratios >= 0)
         assert np.all(ratios <= 1.0 + 1e-6)
 
+    def test_harmonic_stats_entry_points_agree(
+        self, sine_wave_220hz: np.ndarray, sample_rate: int
+    ) -> None:
+        analyzer = SpectralAnalyzer(sample_rate, n_fft=2048, hop_length=512)
+        f0 = np.full(86, 220.0)
+        f0[:10] = np.nan
+        energy, ratios = analyzer.compute_harmonic_stats(sine_wave_220hz, f0)
+        magnitude = analyzer.stft_magnitude(sine_wave_220hz)
+        energy_m, ratios_m = analyzer.compute_harmonic_stats_with_magnitude(
+            magnitude, f0
+        )
+
+        np.testing.assert_allclose(energy, energy_m)
+        np.testing.assert_allclose(ratios, ratios_m)
+        assert np.all(energy[:10] == 0)
+        assert np.all(ratios[10:] > 0.9)
+
+    def test_harmonic_stats_overlapping_bands_not_double_counted(
+        self, sample_rate: int
+    ) -> None:
+        analyzer = SpectralAnalyzer(sample_rate, n_fft=2048, hop_length=512)
+        magnitude = np.ones((1025, 4))
+        _, ratios = analyzer.compute_harmonic_stats_with_magnitude(
+            magnitude, np.full(4, 55.0)
+        )
+        assert np.all(ratios <= 1.0 + 1e-9)
+        assert np.all(ratios > 0)
+
     def test_analyze_noise(
         self, white_noise: np.ndarray, sample_rate: int
     ) -> None:
@@ -141,12 +351,78 @@ class TestSpectralAnalyzer:
     def test_stft_cache_reuse(
         self, sine_wave_440hz: np.ndarray, sample_rate: int
     ) -> None:
-        analyzer = SpectralAnalyzer(sample_rate, n_fft=2048, hop_length=512)
+        cache = AnalysisCache()
+        analyzer = SpectralAnalyzer(
+            sample_rate, n_fft=2048, hop_length=512, cache=cache
+        )
         analyzer.analyze(sine_wave_440hz)
-        assert analyzer._cached_audio_id == id(sine_wave_440hz)
         f0 = np.full(86, 440.0)
-        analyzer.compute_harmonic_stats(sine_wave_440hz, f0)
-        assert analyzer._cached_audio_id == id(sine_wave_440hz)
+        analyzer.compute_harmonic_stats(sine_wave_440hz.copy(), f0)
+
+        stats = cache.stats()
+        assert stats.misses == 1
+        assert stats.hits == 1
+
+
+class TestAnalysisCache:
+    def test_content_addressed_lookup(self) -> None:
+        cache = AnalysisCache()
+        audio = np.arange(100, dtype=np.float32)
+        cache.put(("stft", audio_digest(audio), (1,)), audio * 2)
+
+        assert cache.get(("stft", audio_digest(audio.copy()), (1,))) is not None
+        assert cache.get(("stft", audio_digest(audio), (2,))) is None
+        assert cache.get(("stft", audio_digest(audio + 1), (1,))) is None
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 2
+        assert stats.by_kind["stft"] == {"hits": 1, "misses": 2}
+
+    def test_lru_eviction_under_budget(self) -> None:
+        cache = AnalysisCache(max_bytes=2500)
+        for i in range(3):
+            cache.put(("stft", str(i), ()), np.zeros(100))
+        cache.get(("stft", "0", ()))
+        cache.put(("stft", "3", ()), np.zeros(100))
+
+        assert cache.get(("stft", "0", ())) is not None
+        assert cache.get(("stft", "1", ())) is None
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.nbytes <= stats.max_bytes
+
+    def test_oversized_entry_not_stored(self) -> None:
+        cache = AnalysisCache(max_bytes=100)
+        cache.put(("stft", "big", ()), np.zeros(1000))
+        assert cache.stats().entries == 0
+
+    def test_cached_values_are_isolated(self) -> None:
+        cache = AnalysisCache()
+        contour = PitchContour(
+            np.array([100.0, 110.0]), np.array([True, True]), 105.0, 5.0, 20.0
+        )
+        cache.put(("pitch", "a", ()), contour)
+
+        first = cache.get(("pitch", "a", ()))
+        first.f0 = first.f0[:1]
+        second = cache.get(("pitch", "a", ()))
+        assert len(second.f0) == 2
+        with pytest.raises(ValueError):
+            second.f0[0] = 0.0
+
+    def test_engine_reuses_cached_profile(
+        self, sine_wave_440hz: np.ndarray, sample_rate: int
+    ) -> None:
+        cache = AnalysisCache()
+        engine = VoiceAnalysisEngine(
+            sample_rate, n_fft=2048, hop_length=512, cache=cache
+        )
+        first = engine.build(sine_wave_440hz)
+        second = engine.build(sine_wave_440hz.copy())
+
+        assert cache.stats().by_kind["profile"] == {"hits": 1, "misses": 1}
+        np.testing.assert_array_equal(first.pitch.f0, second.pitch.f0)
+        assert second.pitch.f0_mean == first.pitch.f0_mean
 
 
 class TestVoiceAnalysisEngine:
@@ -195,6 +471,316 @@ class TestVoiceAnalysisEngine:
         assert formant_len == spectral_len
         assert spectral_len == energy_len
 
+    def test_parallel_build_matches_sequential(
+        self, sine_wave_220hz: np.ndarray, sample_rate: int
+    ) -> None:
+        sequential = VoiceAnalysisEngine(
+            sample_rate, cache=AnalysisCache(), parallel=False
+        ).build(sine_wave_220hz)
+        parallel = VoiceAnalysisEngine(
+            sample_rate, cache=AnalysisCache(), parallel=True
+        ).build(sine_wave_220hz)
+
+        np.testing.assert_array_equal(parallel.pitch.f0, sequential.pitch.f0)
+        np.testing.assert_array_equal(
+            parallel.formants.frequencies, sequential.formants.frequencies
+        )
+        np.testing.assert_array_equal(
+            parallel.harmonic_energy, sequential.harmonic_energy
+        )
+        assert (
+            parallel.spectral.spectral_tilt
+            == sequential.spectral.spectral_tilt
+        )
+
+    def test_pitch_workers_use_segmented_tracking(self, monkeypatch) -> None:
+        t = np.arange(16000 * 3) / 16000
+        audio = np.sin(2 * np.pi * 180.0 * t).astype(np.float32)
+        engine = VoiceAnalysisEngine(
+            16000, cache=AnalysisCache(), parallel=False, pitch_workers=2
+        )
+        engine.pitch_analyzer.segment_seconds = 1.0
+        engine.pitch_analyzer.segment_overlap_seconds = 0.25
+        calls = []
+        original = PitchAnalyzer._track_segmented
+
+        def recording(self, audio, n_workers):
+            calls.append(n_workers)
+            return original(self, audio, n_workers)
+
+        monkeypatch.setattr(PitchAnalyzer, "_track_segmented", recording)
+        profile = engine.build(audio)
+
+        assert calls == [2]
+        assert profile.pitch.f0_mean == pytest.approx(180.0, rel=0.03)
+
+    def test_task_graph_respects_dependencies(self) -> None:
+        from voico.analysis.profile import (
+            _run_task_graph,
+            get_analysis_executor,
+        )
+
+        order = []
+
+        def task(name: str, value: int, deps: tuple):
+            def run(results: dict) -> int:
+                order.append(name)
+                return value + sum(results[dep] for dep in deps)
+
+            return (deps, run)
+
+        tasks = {
+            "a": task("a", 1, ()),
+            "b": task("b", 10, ("a",)),
+            "c": task("c", 100, ()),
+            "d": task("d", 1000, ("b", "c")),
+        }
+        results = _run_task_graph(tasks, get_analysis_executor())
+
+        assert results["b"] == 11
+        assert results["d"] == 1000 + 11 + 100
+        assert order.index("a") < order.index("b") < order.index("d")
+
+
+class TestLiteProfile:
+    def _speech_like(self, sample_rate: int, seconds: float) -> np.ndarray:
+        rng = np.random.default_rng(1)
+        t = np.arange(int(sample_rate * seconds)) / sample_rate
+        tone = sum(
+            np.sin(2 * np.pi * 160.0 * k * t) / k for k in range(1, 6)
+        )
+        gate = (np.floor(t) % 3) == 0
+        audio = np.where(gate, 0.3 * tone, 0.0)
+        audio += 0.001 * rng.standard_normal(len(t))
+        return audio.astype(np.float32)
+
+    def test_excerpts_pick_voiced_windows(self) -> None:
+        sample_rate = 16000
+        audio = self._speech_like(sample_rate, 30.0)
+        excerpts = select_voiced_excerpts(audio, sample_rate, max_seconds=5.0)
+
+        total = sum(end - start for start, end in excerpts)
+        assert total <= 5.0 * sample_rate
+        selected = np.concatenate([np.arange(s, e) for s, e in excerpts])
+        assert np.mean((selected // sample_rate) % 3 == 0) > 0.75
+        joined = join_excerpts(audio, excerpts, sample_rate)
+        assert len(joined) == total
+
+    def test_short_audio_is_analyzed_whole(self) -> None:
+        audio = np.zeros(16000, dtype=np.float32)
+        assert select_voiced_excerpts(audio, 16000, max_seconds=5.0) == [
+            (0, 16000)
+        ]
+
+    def test_build_lite_bounds_analysis(self) -> None:
+        sample_rate = 16000
+        audio = self._speech_like(sample_rate, 60.0)
+        engine = VoiceAnalysisEngine(sample_rate, cache=AnalysisCache())
+        lite = engine.build_lite(audio, max_seconds=8.0)
+
+        assert lite.analyzed_seconds <= 8.0
+        assert lite.source_seconds == pytest.approx(60.0)
+        assert lite.profile.pitch.f0_mean == pytest.approx(160.0, rel=0.03)
+        assert 0.0 < lite.confidence <= 1.0
+
+        silent = engine.build_lite(
+            np.zeros(60 * sample_rate, dtype=np.float32), max_seconds=8.0
+        )
+        assert silent.confidence < lite.confidence
+
+
+    def test_lite_confidence_full_analysis_not_penalized(self) -> None:
+        sample_rate = 16000
+        t = np.arange(sample_rate * 45) / sample_rate
+        tone = sum(np.sin(2 * np.pi * 160.0 * k * t) / k for k in range(1, 6))
+        audio = (0.3 * tone).astype(np.float32)
+        engine = VoiceAnalysisEngine(sample_rate, cache=AnalysisCache())
+
+        whole = engine.build_lite(audio[: 12 * sample_rate], max_seconds=30.0)
+        excerpted = engine.build_lite(audio, max_seconds=30.0)
+
+        assert whole.excerpt_count == 1
+        assert whole.confidence == pytest.approx(1.0, abs=0.02)
+        assert excerpted.analyzed_seconds < excerpted.source_seconds
+        assert excerpted.confidence > 0.5
+        assert whole.confidence >= excerpted.confidence
+
+
+class TestEnrollment:
+    def _write_tone(self, path: str, frequency: float, seconds: float) -> None:
+        from voico.utils.audio_io import save_audio
+
+        sample_rate = 16000
+        t = np.arange(int(sample_rate * seconds)) / sample_rate
+        tone = sum(
+            np.sin(2 * np.pi * frequency * k * t) / k for k in range(1, 6)
+        )
+        save_audio(path, (0.3 * tone).astype(np.float32), sample_rate)
+
+    def test_merge_weights_by_voiced_duration(self) -> None:
+        engine = VoiceAnalysisEngine(16000, cache=AnalysisCache())
+        t = np.arange(16000 * 3) / 16000
+        low = engine.build(np.sin(2 * np.pi * 150.0 * t).astype(np.float32))
+        high = engine.build(
+            np.sin(2 * np.pi * 250.0 * t[:16000]).astype(np.float32)
+        )
+        merged = merge_profiles([low, high])
+
+        assert len(merged.pitch.f0) == len(low.pitch.f0) + len(high.pitch.f0)
+        assert merged.pitch.f0_mean == pytest.approx(150.0, rel=0.03)
+        assert merged.spectral.envelope.shape[1] == len(merged.pitch.f0)
+
+        with pytest.raises(ValueError):
+            merge_profiles([low, VoiceAnalysisEngine(8000).build(t[:8000])])
+
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_enroll_files_reports_and_stores(
+        self, tmp_path, n_workers: int
+    ) -> None:
+        from voico.store.profile_store import ProfileStore
+
+        paths = []
+        for i, seconds in enumerate([1.0, 2.0]):
+            path = str(tmp_path / f"clip{i}.wav")
+            self._write_tone(path, 200.0, seconds)
+            paths.append(path)
+        paths.append(str(tmp_path / "missing.wav"))
+
+        store = ProfileStore(str(tmp_path / "profiles.db"))
+        seen = []
+        result = enroll_files(
+            paths,
+            "alice",
+            sample_rate=16000,
+            n_workers=n_workers,
+            store=store,
+            on_file=seen.append,
+        )
+
+        assert [r.path for r in result.files] == paths
+        assert len(seen) == 3
+        assert result.files[2].error is not None
+        assert len(result.accepted) == 2
+        assert result.files[1].voiced_seconds > result.files[0].voiced_seconds
+        assert result.profile.pitch.f0_mean == pytest.approx(200.0, rel=0.03)
+        assert store.exists("alice")
+
+    def test_enroll_files_screens_unnormalized_level(self, tmp_path) -> None:
+        from voico.core.config import ScreeningThresholds
+        from voico.utils.audio_io import save_audio
+
+        loud = str(tmp_path / "loud.wav")
+        quiet = str(tmp_path / "quiet.wav")
+        self._write_tone(loud, 200.0, 1.0)
+        t = np.arange(16000) / 16000
+        tone = (0.001 * np.sin(2 * np.pi * 200.0 * t)).astype(np.float32)
+        save_audio(quiet, tone, 16000, bit_depth=32)
+
+        result = enroll_files([loud, quiet], "carol", sample_rate=16000, n_workers=1)
+        assert not result.files[1].is_viable
+        assert "silent" in result.files[1].issues[0]
+
+        lenient = enroll_files(
+            [loud, quiet],
+            "carol",
+            sample_rate=16000,
+            screening=ScreeningThresholds(min_rms_db=-90.0),
+            n_workers=1,
+        )
+        assert lenient.files[1].quality_score > 0
+
+    def test_enroll_files_traces_worker_processes(self, tmp_path) -> None:
+        from voico.utils.tracing import tracing
+
+        paths = []
+        for i in range(2):
+            path = str(tmp_path / f"clip{i}.wav")
+            self._write_tone(path, 200.0, 1.0)
+            paths.append(path)
+
+        with tracing() as tracer:
+            enroll_files(paths, "bob", sample_rate=16000, n_workers=2)
+
+        spans = [e for e in tracer.events if e["ph"] == "X"]
+        workers = {e["pid"] for e in spans if e["name"] == "enroll_file"}
+        assert len(workers) >= 1
+        assert os.getpid() not in workers
+        assert any(e["cat"] == "analysis" for e in spans)
+
+
+class TestStreamingProfileBuilder:
+    def _glide(self, sample_rate: int, seconds: float) -> np.ndarray:
+        t = np.arange(int(sample_rate * seconds)) / sample_rate
+        f0 = 180.0 + 20.0 * np.sin(2 * np.pi * 0.3 * t)
+        phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+        harmonics = sum(np.sin(k * phase) / k for k in range(1, 8))
+        noise = np.random.default_rng(0).standard_normal(len(t))
+        return (0.3 * harmonics + 0.01 * noise).astype(np.float32)
+
+    def test_quantile_sketch_median(self) -> None:
+        values = np.random.default_rng(0).uniform(100.0, 300.0, 10000)
+        sketch = QuantileSketch(50.0, 1200.0, 2400, log_scale=True)
+        sketch.add(values)
+
+        assert sketch.count == len(values)
+        assert sketch.quantile(0.5) == pytest.approx(
+            np.median(values), rel=0.005
+        )
+
+    def test_quantile_sketch_merge_weights(self) -> None:
+        low = QuantileSketch(0.0, 1000.0, 1000)
+        high = QuantileSketch(0.0, 1000.0, 1000)
+        low.add(np.full(100, 200.0))
+        high.add(np.full(100, 800.0))
+        low.merge(high, weight=3.0)
+
+        assert low.count == 400
+        assert 800.0 <= low.quantile(0.5) <= 801.0
+        with pytest.raises(ValueError):
+            low.merge(QuantileSketch(0.0, 500.0, 1000))
+
+    def test_chunked_matches_full_analysis(self) -> None:
+        sample_rate = 22050
+        audio = self._glide(sample_rate, 12.0)
+        full = VoiceAnalysisEngine(sample_rate, cache=AnalysisCache()).build(
+            audio
+        )
+
+        builder = StreamingProfileBuilder(sample_rate)
+        for start in range(0, len(audio), 4096):
+            builder.push(audio[start : start + 4096])
+        profile = builder.snapshot()
+
+        assert profile.pitch.f0_mean == pytest.approx(
+            full.pitch.f0_mean, rel=0.01
+        )
+        np.testing.assert_allclose(
+            profile.formants.mean_frequencies[:3],
+            full.formants.mean_frequencies[:3],
+            rtol=0.05,
+        )
+        assert profile.spectral.spectral_tilt == pytest.approx(
+            full.spectral.spectral_tilt, abs=0.05
+        )
+
+    def test_memory_bounded_and_snapshot_non_destructive(self) -> None:
+        sample_rate = 16000
+        audio = self._glide(sample_rate, 20.0)
+        builder = StreamingProfileBuilder(
+            sample_rate, block_seconds=1.0, max_history_frames=64
+        )
+        builder.push(audio[: len(audio) // 2])
+        first = builder.snapshot()
+        again = builder.snapshot()
+        builder.push(audio[len(audio) // 2 :])
+        final = builder.snapshot()
+
+        assert first.pitch.f0_mean == again.pitch.f0_mean
+        assert len(final.pitch.f0) <= 64
+        assert final.formants.frequencies.shape == (5, len(final.pitch.f0))
+        assert len(builder._buffer) < 3 * sample_rate
+        assert builder.duration_seconds == pytest.approx(20.0)
+
 
 class TestVoiceMatcher:
     def _make_profile(
@@ -265,3 +851,35 @@ class TestVoiceMatcher:
 
         semitones, _ = VoiceMatcher.match(source, target)
         assert semitones == 0.0
+
+    def test_match_many_agrees_with_match(self) -> None:
+        base = np.array([500.0, 1500.0, 2500.0, 3500.0, 4500.0])
+        source = self._make_profile(150.0, base)
+        targets = [
+            self._make_profile(f0, base * scale)
+            for f0, scale in [(150.0, 1.0), (300.0, 1.2), (0.0, 3.0)]
+        ]
+
+        shifts, distances = VoiceMatcher.match_many(source, targets)
+
+        assert shifts.shape == (3, 2)
+        for target, (semitones, factor) in zip(targets, shifts):
+            expected = VoiceMatcher.match(source, target)
+            assert semitones == pytest.approx(expected[0])
+            assert factor == pytest.approx(expected[1])
+        assert distances[0] == pytest.approx(0.0, abs=1e-6)
+        assert distances[0] < distances[1] < distances[2]
+
+    def test_match_matrix_shape(self) -> None:
+        base = np.array([500.0, 1500.0, 2500.0, 3500.0, 4500.0])
+        sources = [self._make_profile(f0, base) for f0 in (100.0, 200.0)]
+        targets = [self._make_profile(f0, base) for f0 in (100.0, 200.0, 400.0)]
+
+        shifts, distances = VoiceMatcher.match_matrix(sources, targets)
+
+        assert shifts.shape == (2, 3, 2)
+        assert distances.shape == (2, 3)
+        np.testing.assert_allclose(
+            shifts[:, :, 0], [[0.0, 12.0, 24.0], [-12.0, 0.0, 12.0]]
+        )
+        np.testing.assert_allclose(shifts[:, :, 1], 1.0)
@@ -5,10 +5,11 @@ import numpy as np
 import pytest
 
 from voico.converter import VoiceConverter
-from voico.core.config import ConversionQuality
-from voico.core.errors import ConversionError
+from voico.core.config import ConversionQuality, QualityMetric
+from voico.core.errors import ConversionError, ProfileQualityError
 from voico.core.types import ConversionReport
 from voico.utils.audio_io import save_audio
+from voico.utils.telemetry import get_metrics_registry
 
 
 def _create_test_wav(path: str, frequency: float = 440.0) -> None:
@@ -95,6 +96,40 @@ class TestVoiceConverter:
                     target_path="/nonexistent_target.wav",
                 )
 
+    def test_process_rejects_noise_before_analysis(self, monkeypatch) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "noise.wav")
+            rng = np.random.default_rng(0)
+            noise = (rng.standard_normal(22050) * 0.3).astype(np.float32)
+            save_audio(input_path, noise, 44100)
+
+            converter = VoiceConverter(ConversionQuality.TURBO)
+
+            def fail(*args, **kwargs):
+                raise AssertionError("full analysis should not run")
+
+            monkeypatch.setattr(converter.profile_engine, "build", fail)
+            with pytest.raises(ProfileQualityError) as excinfo:
+                converter.process(
+                    input_path=input_path,
+                    output_path=os.path.join(tmpdir, "out.wav"),
+                )
+            assert excinfo.value.recovery_suggestions
+
+    def test_process_rejects_quiet_input(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "quiet.wav")
+            t = np.arange(22050) / 44100
+            quiet = (np.sin(2 * np.pi * 220.0 * t) * 0.001).astype(np.float32)
+            save_audio(input_path, quiet, 44100)
+
+            converter = VoiceConverter(ConversionQuality.TURBO)
+            with pytest.raises(ProfileQualityError, match="silent"):
+                converter.process(
+                    input_path=input_path,
+                    output_path=os.path.join(tmpdir, "out.wav"),
+                )
+
     def test_process_no_shift(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             input_path = os.path.join(tmpdir, "input.wav")
@@ -189,6 +224,62 @@ class TestConversionReport:
             assert report.input_duration_seconds > 0
             assert isinstance(report.stages_timing, dict)
             assert "load" in report.stages_timing
+            assert set(report.metrics) == {
+                "snr_db",
+                "spectral_centroid_deviation",
+            }
+
+    def test_report_full_metrics(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "input.wav")
+            output_path = os.path.join(tmpdir, "output.wav")
+            _create_test_wav(input_path, frequency=220.0)
+            converter = VoiceConverter(ConversionQuality.TURBO)
+            converter.settings = converter.settings.model_copy(
+                update={"metrics": frozenset(QualityMetric)}
+            )
+
+            report = converter.process(
+                input_path=input_path,
+                output_path=output_path,
+                pitch_shift=2.0,
+            )
+            assert report.metrics["pitch_error_cents"] < 20.0
+            assert report.metrics["log_spectral_distance_db"] > 0.0
+            assert "spectral_convergence" not in report.metrics
+
+            report = converter.process(
+                input_path=input_path,
+                output_path=output_path,
+                pitch_shift=2.0,
+                formant_shift=1.1,
+            )
+            assert report.metrics["spectral_convergence"] > 0.0
+
+    def test_process_records_telemetry(self) -> None:
+        registry = get_metrics_registry()
+        latency = registry.histogram(
+            "voico_conversion_seconds", "", ("preset",)
+        )
+        stages = registry.histogram(
+            "voico_stage_seconds", "", ("preset", "stage")
+        )
+        before = latency.count(preset="turbo")
+        shifting_before = stages.count(preset="turbo", stage="shifting")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "input.wav")
+            _create_test_wav(input_path)
+            VoiceConverter(ConversionQuality.TURBO).process(
+                input_path=input_path,
+                output_path=os.path.join(tmpdir, "output.wav"),
+            )
+
+        assert latency.count(preset="turbo") == before + 1
+        assert stages.count(preset="turbo", stage="shifting") == shifting_before + 1
+        text = registry.render()
+        assert 'voico_conversions_total{preset="turbo",outcome="success"}' in text
+        assert 'voico_realtime_factor_count{preset="turbo"}' in text
+        assert "voico_analysis_cache_hit_ratio" in text
 
 
 class TestAsyncAPI:
@@ -254,3 +345,382 @@ class TestStreaming:
         chunk = np.random.randn(512).astype(np.float32)
         result = processor.process_chunk(chunk)
         assert len(result) > 0
+
+    @pytest.mark.parametrize("quality", list(ConversionQuality))
+    def test_stream_reconstructs_without_shift(
+        self, quality: ConversionQuality
+    ) -> None:
+        from voico.stream.streamer import VoiceStreamProcessor
+        rng = np.random.default_rng(0)
+        audio = (rng.standard_normal(20000) * 0.3).astype(np.float32)
+        processor = VoiceStreamProcessor(quality=quality)
+
+        outputs = []
+        pos = 0
+        for size in rng.integers(1, 3000, 100):
+            outputs.append(processor.process_chunk(audio[pos:pos + size]))
+            pos += size
+        outputs.append(processor.flush())
+        result = np.concatenate(outputs)
+
+        latency = processor.latency_samples
+        assert len(result) == len(audio) + latency
+        np.testing.assert_allclose(result[latency:], audio, atol=1e-5)
+
+    def test_stream_output_independent_of_chunking(self) -> None:
+        from voico.stream.streamer import VoiceStreamProcessor
+        audio = np.random.default_rng(1).standard_normal(12000)
+        whole = VoiceStreamProcessor(pitch_shift=3.0, max_hops=64)
+        chunked = VoiceStreamProcessor(pitch_shift=3.0, max_hops=2)
+
+        expected = np.concatenate([whole.process_chunk(audio), whole.flush()])
+        pieces = [chunked.process_chunk(audio[i:i + 700]) for i in range(0, 12000, 700)]
+        actual = np.concatenate([*pieces, chunked.flush()])
+
+        np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+    @pytest.mark.parametrize("semitones", [-7.0, 4.0])
+    def test_stream_pitch_shift_accuracy(self, semitones: float) -> None:
+        from voico.quality.metrics import MetricsEngine
+        from voico.stream.streamer import VoiceStreamProcessor
+        sample_rate = 44100
+        t = np.arange(sample_rate) / sample_rate
+        audio = sum(np.sin(2 * np.pi * 150.0 * k * t) / k for k in range(1, 6))
+        processor = VoiceStreamProcessor(pitch_shift=semitones)
+
+        chunks = [
+            processor.process_chunk(audio[i:i + 441] * 0.3)
+            for i in range(0, sample_rate, 441)
+        ]
+        latency = processor.latency_samples
+        result = np.concatenate([*chunks, processor.flush()])
+
+        assert latency <= processor._n_fft + processor._hop_length
+        engine = MetricsEngine(sample_rate, 2048, 512)
+        f0 = np.nanmedian(engine.frame_pitch(engine.magnitude(result[latency:])))
+        assert 1200 * np.log2(f0 / 150.0) == pytest.approx(
+            100 * semitones, abs=10.0
+        )
+
+    def test_stream_pitch_change_mid_stream(self) -> None:
+        from voico.stream.streamer import VoiceStreamProcessor
+        audio = np.sin(2 * np.pi * 220.0 * np.arange(22050) / 44100) * 0.3
+        processor = VoiceStreamProcessor()
+        outputs = []
+        for i, start in enumerate(range(0, len(audio), 1024)):
+            if i == 5:
+                processor.pitch_shift = 5.0
+            if i == 15:
+                processor.pitch_shift = 0.0
+            outputs.append(processor.process_chunk(audio[start:start + 1024]))
+        result = np.concatenate([*outputs, processor.flush()])
+
+        assert np.all(np.isfinite(result))
+        assert abs(len(result) - len(audio) - processor.latency_samples) < 512
+
+    @pytest.mark.parametrize("semitones", [-12.0, -5.0, 7.0])
+    def test_stream_onset_matches_latency_after_reuse(
+        self, semitones: float
+    ) -> None:
+        from voico.stream.streamer import VoiceStreamProcessor
+        audio = np.zeros(20000, dtype=np.float32)
+        audio[6000:9000] = np.sin(2 * np.pi * 300.0 * np.arange(3000) / 44100)
+        processor = VoiceStreamProcessor(pitch_shift=semitones)
+
+        def run() -> np.ndarray:
+            outputs = [
+                processor.process_chunk(audio[i:i + 441])
+                for i in range(0, len(audio), 441)
+            ]
+            return np.concatenate([*outputs, processor.flush()])
+
+        def centroid(signal: np.ndarray) -> float:
+            energy = np.square(signal, dtype=np.float64)
+            return float(np.sum(np.arange(len(signal)) * energy) / np.sum(energy))
+
+        first = run()
+        np.testing.assert_array_equal(run(), first)
+        assert centroid(first) - centroid(audio) == pytest.approx(
+            processor.latency_samples, abs=128
+        )
+
+    @pytest.mark.parametrize("target_ms", [10.0, 25.0, 60.0])
+    def test_latency_budget_selects_frame_size(self, target_ms: float) -> None:
+        from voico.core.config import LatencyBudget
+        from voico.stream.streamer import VoiceStreamProcessor
+        budget = LatencyBudget(target_ms=target_ms)
+        processor = VoiceStreamProcessor(pitch_shift=-12.0, latency_budget=budget)
+
+        assert processor.stats.algorithmic_latency_ms <= target_ms
+        larger = VoiceStreamProcessor(
+            pitch_shift=-12.0,
+            latency_budget=LatencyBudget(
+                target_ms=target_ms, min_n_fft=processor.n_fft * 2
+            ),
+        )
+        assert larger.stats.algorithmic_latency_ms > target_ms
+
+    def test_stream_stats(self) -> None:
+        from voico.stream.streamer import VoiceStreamProcessor
+        processor = VoiceStreamProcessor(pitch_shift=2.0)
+        chunk = np.zeros(441, dtype=np.float32)
+        for _ in range(20):
+            processor.process_chunk(chunk)
+        processor.process_chunk(chunk, deadline=0.0)
+        processor.process_chunk(chunk, deadline=1e-12)
+
+        stats = processor.stats
+        assert stats.chunks == 22
+        assert stats.audio_seconds == pytest.approx(22 * 0.01)
+        assert stats.deadline_misses >= 1
+        assert 0 < stats.mean_processing_ms <= stats.max_processing_ms
+        assert stats.jitter_ms >= 0
+        assert stats.as_dict()["realtime_factor"] == stats.realtime_factor
+        processor.reset_stats()
+        assert processor.stats.chunks == 0
+
+    def test_phase_vocoder_identity_without_stretch(self) -> None:
+        from voico.stream.vocoder import PhaseVocoder
+        rng = np.random.default_rng(2)
+        spectra = rng.standard_normal((6, 1025)) + 1j * rng.standard_normal(
+            (6, 1025)
+        )
+        vocoder = PhaseVocoder(2048, 512, 512)
+        processed = spectra.copy()
+        vocoder.process(processed[:3])
+        vocoder.process(processed[3:])
+
+        np.testing.assert_allclose(processed, spectra, atol=1e-9)
+
+    def test_process_batch_matches_individual_processing(self) -> None:
+        from voico.stream.streamer import VoiceStreamProcessor, process_batch
+        rng = np.random.default_rng(3)
+        shifts = [0.0, 3.0, -5.0]
+        batched = [VoiceStreamProcessor(pitch_shift=s) for s in shifts]
+        single = [VoiceStreamProcessor(pitch_shift=s) for s in shifts]
+
+        for size in rng.integers(100, 3000, 10):
+            chunks = [rng.standard_normal(size) * 0.3 for _ in shifts]
+            outputs = process_batch(batched, chunks)
+            for processor, chunk, output in zip(single, chunks, outputs):
+                np.testing.assert_allclose(
+                    output, processor.process_chunk(chunk), atol=1e-5
+                )
+        assert batched[1].stats.chunks == 10
+
+    def test_process_batch_rejects_mixed_geometry(self) -> None:
+        from voico.stream.streamer import VoiceStreamProcessor, process_batch
+        processors = [
+            VoiceStreamProcessor(quality=ConversionQuality.FAST),
+            VoiceStreamProcessor(quality=ConversionQuality.ULTRA),
+        ]
+        chunk = np.zeros(512, dtype=np.float32)
+        with pytest.raises(ValueError, match="share n_fft"):
+            process_batch(processors, [chunk, chunk])
+
+    def test_scheduler_process_round(self) -> None:
+        from voico.stream.scheduler import StreamScheduler
+        from voico.stream.streamer import VoiceStreamProcessor
+        audio = np.random.default_rng(4).standard_normal(8192) * 0.3
+        scheduler = StreamScheduler(max_workers=2)
+        try:
+            fast = scheduler.open_session(pitch_shift=2.0)
+            ultra = scheduler.open_session(quality=ConversionQuality.ULTRA)
+            reference = VoiceStreamProcessor(pitch_shift=2.0)
+            expected = []
+            actual = []
+            for start in range(0, len(audio), 1024):
+                chunk = audio[start:start + 1024]
+                results = scheduler.process(
+                    {fast.session_id: chunk, ultra.session_id: chunk}
+                )
+                actual.append(results[fast.session_id])
+                expected.append(reference.process_chunk(chunk))
+            actual.append(scheduler.close_session(fast.session_id))
+            expected.append(reference.flush())
+
+            np.testing.assert_allclose(
+                np.concatenate(actual), np.concatenate(expected), atol=1e-5
+            )
+            assert scheduler.session_ids == [ultra.session_id]
+            with pytest.raises(KeyError):
+                scheduler.session(fast.session_id)
+        finally:
+            scheduler.shutdown()
+
+    def test_scheduler_submit_concurrent_sessions(self) -> None:
+        import asyncio
+
+        from voico.stream.scheduler import StreamScheduler
+        from voico.stream.streamer import VoiceStreamProcessor
+        latency = VoiceStreamProcessor().latency_samples
+        audio = np.random.default_rng(5).standard_normal(6000) * 0.3
+        scheduler = StreamScheduler(max_workers=2)
+
+        async def feed(session_id: str) -> np.ndarray:
+            outputs = [
+                await scheduler.submit(session_id, audio[i:i + 500])
+                for i in range(0, len(audio), 500)
+            ]
+            outputs.append(await scheduler.aclose_session(session_id))
+            return np.concatenate(outputs)
+
+        async def run():
+            sessions = [scheduler.open_session() for _ in range(3)]
+            return await asyncio.gather(*(feed(s.session_id) for s in sessions))
+
+        try:
+            results = asyncio.run(run())
+        finally:
+            scheduler.shutdown()
+        for result in results:
+            assert len(result) == len(audio) + latency
+            np.testing.assert_allclose(result[latency:], audio, atol=1e-5)
+        assert scheduler.session_ids == []
+
+    def test_scheduler_closes_idle_sessions(self) -> None:
+        import time
+
+        from voico.stream.scheduler import StreamScheduler
+        scheduler = StreamScheduler(max_workers=1, idle_timeout=5.0)
+        try:
+            idle = scheduler.open_session()
+            active = scheduler.open_session()
+            now = time.monotonic()
+            active.last_active = now + 10.0
+            assert scheduler.cleanup_idle(now + 6.0) == [idle.session_id]
+            assert scheduler.session_ids == [active.session_id]
+        finally:
+            scheduler.shutdown()
+
+    def test_scheduler_reaps_idle_sessions_off_the_event_loop(self) -> None:
+        import asyncio
+        import threading
+
+        from voico.stream.scheduler import StreamScheduler
+        scheduler = StreamScheduler(max_workers=1, idle_timeout=0.05)
+        closed_on = []
+        close_session = scheduler.close_session
+
+        def recording(session_id: str) -> np.ndarray:
+            closed_on.append(threading.current_thread().name)
+            return close_session(session_id)
+
+        scheduler.close_session = recording
+
+        async def run():
+            session = scheduler.open_session()
+            await scheduler.submit(session.session_id, np.zeros(512))
+            for _ in range(100):
+                if not scheduler.session_ids:
+                    break
+                await asyncio.sleep(0.02)
+
+        try:
+            asyncio.run(run())
+        finally:
+            scheduler.shutdown()
+        assert len(closed_on) == 1
+        assert closed_on[0].startswith("voico-stream")
+
+    def test_astream_uses_scheduler(self) -> None:
+        import asyncio
+
+        from voico.stream.scheduler import StreamScheduler
+        from voico.stream.streamer import VoiceStreamProcessor
+        audio = np.random.default_rng(6).standard_normal(4096) * 0.3
+        processor = VoiceStreamProcessor()
+        scheduler = StreamScheduler(max_workers=1)
+
+        async def chunks():
+            for start in range(0, len(audio), 1024):
+                yield audio[start:start + 1024]
+
+        async def run():
+            return [out async for out in processor.astream(chunks(), scheduler)]
+
+        try:
+            result = np.concatenate(asyncio.run(run()))
+        finally:
+            scheduler.shutdown()
+        latency = processor.latency_samples
+        np.testing.assert_allclose(result[latency:], audio, atol=1e-5)
+        assert scheduler.session_ids == []
+
+    @pytest.mark.parametrize("pcm_format", ["f32le", "s16le"])
+    def test_pcm_round_trip(self, pcm_format: str) -> None:
+        from voico.core.config import PcmFormat
+        from voico.stream.pcm import decode_pcm, encode_pcm
+        fmt = PcmFormat(pcm_format)
+        audio = np.linspace(-0.9, 0.9, 1000).astype(np.float32)
+
+        data = encode_pcm(audio, fmt)
+        np.testing.assert_allclose(decode_pcm(data, fmt), audio, atol=1 / 32768)
+        with pytest.raises(ValueError, match="whole number"):
+            decode_pcm(data[:-1], fmt)
+
+    def test_live_stream_session_negotiation(self) -> None:
+        from voico.api.app import _apply_stream_update, _open_stream
+        from voico.core.config import PcmFormat
+        from voico.stream.scheduler import StreamScheduler
+        scheduler = StreamScheduler(max_workers=1)
+        try:
+            session, pcm_format = _open_stream(
+                scheduler,
+                {"sample_rate": 16000, "format": "s16le", "latency_ms": 30},
+            )
+            assert pcm_format == PcmFormat.INT16
+            assert session.processor.sample_rate == 16000
+            assert session.processor.stats.algorithmic_latency_ms <= 30
+            _apply_stream_update(
+                session.processor, {"pitch_shift": 3.0, "formant_shift": 1.2}
+            )
+            assert session.processor.pitch_shift == 3.0
+            assert session.processor.formant_shift == 1.2
+            for config in (
+                {"sample_rate": 100},
+                {"format": "mp3"},
+                {"formant_shift": 0},
+            ):
+                with pytest.raises(ValueError):
+                    _open_stream(scheduler, config)
+            assert scheduler.session_ids == [session.session_id]
+        finally:
+            scheduler.shutdown()
+
+    def test_live_stream_reader_keeps_session_alive(self) -> None:
+        import asyncio
+
+        from voico.api.app import _read_stream
+        from voico.stream.scheduler import StreamScheduler
+
+        class FakeWebSocket:
+            def __init__(self, messages):
+                self._messages = list(messages)
+
+            async def receive(self):
+                return self._messages.pop(0)
+
+        scheduler = StreamScheduler(max_workers=1, idle_timeout=5.0)
+        try:
+            session = scheduler.open_session()
+            session.last_active -= 10.0
+            websocket = FakeWebSocket([
+                {"type": "websocket.receive", "text": '{"type": "stats"}'},
+                {"type": "websocket.receive", "bytes": b"\x00" * 8},
+                {"type": "websocket.disconnect"},
+            ])
+
+            async def run():
+                backlog = asyncio.Queue()
+                await _read_stream(websocket, backlog, session)
+                return [backlog.get_nowait() for _ in range(3)]
+
+            assert asyncio.run(run()) == [
+                '{"type": "stats"}',
+                b"\x00" * 8,
+                None,
+            ]
+            assert scheduler.cleanup_idle() == []
+        finally:
+            scheduler.shutdown()
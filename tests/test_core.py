@@ -1,7 +1,14 @@
 import numpy as np
 import pytest
 
-from voico.core.config import ConversionQuality, QualitySettings
+from voico.core.config import (
+    ConversionQuality,
+    LatencyBudget,
+    QualityMetric,
+    QualitySettings,
+    ResampleQuality,
+    ScreeningThresholds,
+)
 from voico.core.constants import AudioConstants
 from voico.core.errors import (
     AnalysisError,
@@ -50,6 +57,41 @@ class TestQualitySettings:
         settings = QualitySettings.from_preset(ConversionQuality.TURBO)
         assert settings.use_advanced_phase is False
 
+    def test_presets_set_resample_quality(self) -> None:
+        turbo = QualitySettings.from_preset(ConversionQuality.TURBO)
+        master = QualitySettings.from_preset(ConversionQuality.MASTER)
+        assert turbo.resample_quality is ResampleQuality.FAST
+        assert master.resample_quality is ResampleQuality.HIGH
+
+    def test_target_excerpt_seconds(self) -> None:
+        turbo = QualitySettings.from_preset(ConversionQuality.TURBO)
+        master = QualitySettings.from_preset(ConversionQuality.MASTER)
+        assert turbo.target_excerpt_seconds == 15.0
+        assert master.target_excerpt_seconds is None
+        with pytest.raises(ValueError):
+            QualitySettings(
+                **{**turbo.model_dump(), "target_excerpt_seconds": 0.0}
+            )
+
+    def test_metric_selection(self) -> None:
+        turbo = QualitySettings.from_preset(ConversionQuality.TURBO)
+        master = QualitySettings.from_preset(ConversionQuality.MASTER)
+        assert QualityMetric.PITCH_ACCURACY not in turbo.metrics
+        assert master.metrics == frozenset(QualityMetric)
+
+    def test_screening_thresholds(self) -> None:
+        settings = QualitySettings.from_preset(ConversionQuality.BALANCED)
+        assert isinstance(settings.screening, ScreeningThresholds)
+        with pytest.raises(ValueError):
+            ScreeningThresholds(max_clipping_ratio=1.5)
+
+    def test_latency_budget_validation(self) -> None:
+        assert LatencyBudget().target_ms > 0
+        with pytest.raises(ValueError):
+            LatencyBudget(target_ms=0.0)
+        with pytest.raises(ValueError):
+            LatencyBudget(max_n_fft=3000)
+
 
 class TestAudioConstants:
     def test_frequency_range(self) -> None:
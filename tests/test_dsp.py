@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
 
+from voico.core.config import ResampleQuality
 from voico.dsp.phase import PhaseProcessor
+from voico.dsp.resampler import Resampler, design_filter, resample
 from voico.dsp.shifter import SpectralProcessor
 
 
@@ -108,3 +110,38 @@ class TestSpectralProcessor:
         processor = SpectralProcessor(44100, n_fft=2048)
         assert len(processor.frequency_bins) == 1025
         assert processor.frequency_bins[0] == 0.0
+
+
+class TestResampler:
+    def test_resample_length(self, sine_wave_440hz: np.ndarray) -> None:
+        result = resample(sine_wave_440hz, 44100, 10000)
+        assert len(result) == 10000
+        assert result.dtype == sine_wave_440hz.dtype
+
+    def test_resample_identity(self, sine_wave_440hz: np.ndarray) -> None:
+        assert resample(sine_wave_440hz, 44100, 44100) is sine_wave_440hz
+
+    def test_filter_design_is_cached(self) -> None:
+        first = design_filter(100, 441, ResampleQuality.FAST)
+        second = design_filter(100, 441, ResampleQuality.FAST)
+        assert first is second
+        assert len(design_filter(100, 441, ResampleQuality.HIGH)) > len(first)
+
+    @pytest.mark.parametrize(
+        "rates", [(44100, 10000), (16000, 44100), (44100, 48000)]
+    )
+    def test_streaming_matches_offline(
+        self, white_noise: np.ndarray, rates: tuple
+    ) -> None:
+        offline = resample(white_noise, *rates)
+        resampler = Resampler(*rates)
+        chunks = [
+            resampler.process(white_noise[i : i + 1000])
+            for i in range(0, len(white_noise), 1000)
+        ]
+        chunks.append(resampler.flush())
+        streamed = np.concatenate(chunks)
+
+        assert len(streamed) == len(offline)
+        np.testing.assert_allclose(streamed, offline, atol=1e-5)
+
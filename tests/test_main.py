@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 
@@ -69,6 +70,17 @@ class TestParseArgs:
         args = parse_args()
         assert args.info is True
 
+    def test_enroll_args(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "sys.argv",
+            ["voico", "a.wav", "b.wav", "c.wav", "--enroll", "alice", "-j", "2"],
+        )
+        args = parse_args()
+        assert args.input_file == "a.wav"
+        assert args.extra_files == ["b.wav", "c.wav"]
+        assert args.enroll == "alice"
+        assert args.workers == 2
+
 
 class TestMain:
     def test_missing_input_exits(
@@ -114,6 +126,48 @@ class TestMain:
             main()
             assert os.path.exists(output_path)
 
+    def test_diagnostics_jsonl(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "input.wav")
+            events_path = os.path.join(tmpdir, "events.jsonl")
+            _create_wav(input_path)
+            monkeypatch.setattr(
+                "sys.argv",
+                [
+                    "voico", input_path,
+                    "-o", os.path.join(tmpdir, "output.wav"),
+                    "-q", "turbo",
+                    "--diagnostics", events_path,
+                ],
+            )
+            main()
+            with open(events_path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+            assert records
+            assert {r["pipeline_id"] for r in records} == {input_path}
+
+    def test_trace_output(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "input.wav")
+            trace_path = os.path.join(tmpdir, "trace.json")
+            _create_wav(input_path)
+            monkeypatch.setattr(
+                "sys.argv",
+                [
+                    "voico", input_path,
+                    "-o", os.path.join(tmpdir, "output.wav"),
+                    "-p", "1.0",
+                    "-q", "turbo",
+                    "--trace", trace_path,
+                ],
+            )
+            main()
+            with open(trace_path, encoding="utf-8") as f:
+                names = {e["name"] for e in json.load(f)["traceEvents"]}
+            assert {"LoadStage", "AnalysisStage", "load_audio"} <= names
+
     def test_auto_output_path_shift(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -148,6 +202,38 @@ class TestMain:
             expected = os.path.join(tmpdir, "source_to_target.wav")
             assert os.path.exists(expected)
 
+    def test_enroll_stores_profile(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        from voico.store.profile_store import ProfileStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, f"clip{i}.wav") for i in range(2)]
+            for path in paths:
+                _create_wav(path)
+            db_path = os.path.join(tmpdir, "profiles.db")
+            monkeypatch.setattr(
+                "sys.argv",
+                [
+                    "voico", *paths,
+                    "--enroll", "alice",
+                    "--db", db_path,
+                    "-j", "1",
+                ],
+            )
+            main()
+            captured = capsys.readouterr()
+            assert "Enrolled 'alice' from 2/2 files" in captured.out
+            assert ProfileStore(db_path).exists("alice")
+
+    def test_extra_files_without_enroll_exits(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("sys.argv", ["voico", "a.wav", "b.wav"])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 1
+
     def test_info_flag(
         self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
     ) -> None:
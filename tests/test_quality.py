@@ -0,0 +1,299 @@
+import json
+
+import numpy as np
+import pytest
+
+from voico.core.config import QualityMetric, ScreeningThresholds
+from voico.core.types import (
+    FormantTrack,
+    PitchContour,
+    SpectralFeatures,
+    VoiceProfile,
+)
+from voico.quality import gates
+from voico.quality.diagnostic import (
+    DiagnosticLogger,
+    EventLevel,
+    JsonlFileSink,
+    MemorySink,
+    NullSink,
+    get_diagnostic_sink,
+    set_diagnostic_sink,
+)
+from voico.quality.gates import (
+    FormantValidationGate,
+    PitchValidationGate,
+    ProfileValidationGate,
+    validate_profile_batch,
+)
+from voico.quality.metrics import MetricsEngine
+from voico.quality.quality_score import QualityScorer
+from voico.quality.screening import screen_audio
+
+
+def _make_profile(seed: int, n_frames: int = 60) -> VoiceProfile:
+    rng = np.random.default_rng(seed)
+    f0 = rng.uniform(40.0, 400.0, n_frames)
+    f0[rng.random(n_frames) < rng.uniform(0.0, 0.6)] = np.nan
+    n_formants = int(rng.integers(2, 6))
+    frequencies = np.sort(rng.uniform(200.0, 5000.0, (n_formants, n_frames)), 0)
+    return VoiceProfile(
+        pitch=PitchContour(
+            f0=f0,
+            voiced_mask=~np.isnan(f0),
+            f0_mean=float(np.nanmedian(f0)),
+            f0_std=float(np.nanstd(f0)),
+            harmonic_to_noise_ratio=15.0,
+        ),
+        formants=FormantTrack(
+            frequencies=frequencies,
+            bandwidths=rng.uniform(0.0, 600.0, (n_formants, n_frames)),
+            mean_frequencies=np.mean(frequencies, axis=1),
+            mean_bandwidths=np.full(n_formants, 100.0),
+        ),
+        spectral=SpectralFeatures(
+            np.ones((64, n_frames)), float(rng.uniform(-3.0, 3.0))
+        ),
+        harmonic_ratios=np.full(n_frames, 0.5),
+        harmonic_energy=rng.uniform(-1.0, 1.0, n_frames),
+        sample_rate=44100,
+    )
+
+
+class TestValidationGates:
+    def test_batch_matches_single_gates(self) -> None:
+        profiles = [_make_profile(seed) for seed in range(20)]
+
+        batch = validate_profile_batch(profiles)
+
+        for profile, result in zip(profiles, batch):
+            single = ProfileValidationGate(profile).validate()
+            assert result == single
+            pitch = PitchValidationGate(profile.pitch).validate()
+            formant = FormantValidationGate(
+                profile.formants, profile.sample_rate, profile.pitch
+            ).validate()
+            reused = ProfileValidationGate(profile, pitch, formant).validate()
+            assert reused == single
+
+    def test_empty_batch(self) -> None:
+        assert gates.validate_pitch_batch([]) == []
+        assert gates.validate_formant_batch([]) == []
+        assert validate_profile_batch([]) == []
+
+    @pytest.mark.parametrize("n_formants", [0, 1])
+    def test_too_few_formants(self, n_formants: int) -> None:
+        track = FormantTrack(
+            np.full((n_formants, 10), 500.0),
+            np.full((n_formants, 10), 100.0),
+            np.full(n_formants, 500.0),
+            np.full(n_formants, 100.0),
+        )
+
+        [result] = gates.validate_formant_batch([track])
+
+        assert result.score == 50.0
+        assert result.issues == [
+            f"Only {n_formants} formants detected (need 4-5)"
+        ]
+
+
+class TestQualityScorer:
+    def test_validates_each_gate_once(self, monkeypatch) -> None:
+        calls = []
+        original = gates.validate_pitch_batch
+
+        def counting(pitches, *args, **kwargs):
+            calls.append(len(pitches))
+            return original(pitches, *args, **kwargs)
+
+        monkeypatch.setattr(gates, "validate_pitch_batch", counting)
+        monkeypatch.setattr(
+            "voico.quality.quality_score.validate_pitch_batch", counting
+        )
+
+        QualityScorer().score_profile(_make_profile(1))
+        assert calls == [1]
+
+    def test_score_profiles_matches_score_profile(self) -> None:
+        profiles = [_make_profile(seed) for seed in range(10)]
+
+        batch = QualityScorer().score_profiles(profiles)
+
+        for profile, score in zip(profiles, batch):
+            assert score == QualityScorer().score_profile(profile)
+
+    def test_memoizes_by_content(self, monkeypatch) -> None:
+        scorer = QualityScorer()
+        profile = _make_profile(3)
+        first = scorer.score_profile(profile)
+        first.warnings.append("mutated")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("profile validated twice")
+
+        monkeypatch.setattr(
+            "voico.quality.quality_score.validate_pitch_batch", fail
+        )
+        copy = _make_profile(3)
+        second = scorer.score_profile(copy)
+
+        assert "mutated" not in second.warnings
+        assert second.overall_score == pytest.approx(first.overall_score)
+
+    def test_memo_is_bounded(self) -> None:
+        scorer = QualityScorer(memo_size=2)
+        scorer.score_profiles([_make_profile(seed) for seed in range(5)])
+        assert len(scorer._memo) == 2
+
+
+class TestScreening:
+    def test_accepts_voiced_signal(self, sine_wave_220hz, sample_rate) -> None:
+        report = screen_audio(sine_wave_220hz * 0.5, sample_rate)
+
+        assert report.passed
+        assert report.voiced_ratio > 0.9
+        assert report.clipping_ratio == 0.0
+
+    def test_rejects_silence(self, silence, sample_rate) -> None:
+        report = screen_audio(silence, sample_rate)
+
+        assert not report.passed
+        assert report.recommendations
+
+    def test_rejects_noise(self, white_noise, sample_rate) -> None:
+        report = screen_audio(white_noise, sample_rate)
+
+        assert not report.passed
+        assert report.voiced_ratio < 0.1
+        assert report.zero_crossing_rate > 0.35
+
+    def test_rejects_clipping(self, sine_wave_220hz, sample_rate) -> None:
+        clipped = np.clip(sine_wave_220hz * 4.0, -1.0, 1.0)
+
+        report = screen_audio(clipped, sample_rate)
+
+        assert report.clipping_ratio > 0.5
+        assert any("Clipping" in issue for issue in report.issues)
+
+    def test_thresholds_are_configurable(
+        self, white_noise, sample_rate
+    ) -> None:
+        lenient = ScreeningThresholds(
+            max_zero_crossing_rate=1.0, min_voiced_ratio=0.0
+        )
+
+        assert screen_audio(white_noise, sample_rate, lenient).passed
+        strict = ScreeningThresholds(min_duration_seconds=5.0)
+        assert not screen_audio(white_noise, sample_rate, strict).passed
+
+
+def _harmonic(f0: float, sample_rate: int, seconds: float = 1.0) -> np.ndarray:
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    return sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 6)) * 0.3
+
+
+class TestMetricsEngine:
+    def test_identical_signals(self, sample_rate) -> None:
+        engine = MetricsEngine(sample_rate, 2048, 512)
+        audio = _harmonic(150.0, sample_rate)
+        magnitude = engine.magnitude(audio)
+
+        result = engine.compute(
+            audio, audio, magnitude, magnitude, target_magnitude=magnitude
+        )
+
+        assert result.snr_db == 60.0
+        assert result.spectral_centroid_deviation == pytest.approx(0.0)
+        assert result.log_spectral_distance_db == pytest.approx(0.0)
+        assert result.spectral_convergence == pytest.approx(0.0)
+        assert result.pitch_error_cents == pytest.approx(0.0)
+
+    @pytest.mark.parametrize("f0", [80.0, 220.0, 500.0])
+    def test_frame_pitch(self, f0, sample_rate) -> None:
+        engine = MetricsEngine(sample_rate, 2048, 512)
+        pitch = engine.frame_pitch(engine.magnitude(_harmonic(f0, sample_rate)))
+
+        assert np.nanmedian(pitch) == pytest.approx(f0, rel=0.01)
+
+    def test_pitch_error_against_expected_shift(self, sample_rate) -> None:
+        engine = MetricsEngine(
+            sample_rate, 2048, 512, [QualityMetric.PITCH_ACCURACY]
+        )
+        source = _harmonic(200.0, sample_rate)
+        shifted = _harmonic(200.0 * 2 ** (3 / 12), sample_rate)
+
+        assert engine.compute(
+            source, shifted, pitch_shift=3.0
+        ).pitch_error_cents < 5.0
+        assert engine.compute(
+            source, shifted, pitch_shift=0.0
+        ).pitch_error_cents == pytest.approx(300.0, abs=5.0)
+
+    def test_selected_metrics_only(self, sample_rate, monkeypatch) -> None:
+        engine = MetricsEngine(sample_rate, 2048, 512, [QualityMetric.SNR])
+
+        def fail(audio):
+            raise AssertionError("spectrogram computed for time-domain metric")
+
+        monkeypatch.setattr(engine, "magnitude", fail)
+        audio = _harmonic(150.0, sample_rate)
+        result = engine.compute(audio, audio * 0.5)
+
+        assert not engine.needs_spectrograms
+        assert result.as_dict() == {"snr_db": pytest.approx(6.02, abs=0.01)}
+
+
+class TestDiagnosticLogger:
+    def test_ring_buffer_is_bounded(self) -> None:
+        diagnostic = DiagnosticLogger("run", sink=NullSink(), max_events=4)
+        for i in range(10):
+            diagnostic.log_event("stage", "tick", {"i": i})
+
+        result = diagnostic.finalize()
+
+        assert [e.data["i"] for e in result.events] == [6, 7, 8, 9]
+        assert result.dropped_events == 6
+        elapsed = [e.elapsed_seconds for e in result.events]
+        assert elapsed == sorted(elapsed)
+
+    def test_level_filter_and_sampling(self) -> None:
+        sink = MemorySink()
+        diagnostic = DiagnosticLogger(
+            "run", sink=sink, min_level=EventLevel.INFO, sample_rate=0.25
+        )
+        diagnostic.log_event("stage", "noise", {}, EventLevel.DEBUG)
+        for _ in range(8):
+            diagnostic.log_event("stage", "tick", {})
+        diagnostic.log_error("boom", "stage")
+
+        events = [r["event"] for r in sink.records]
+        assert events.count("tick") == 2
+        assert "noise" not in events
+        assert events[-1] == "error"
+        assert diagnostic.diagnostics.errors == ["boom"]
+
+    def test_jsonl_sink_streams_records(self, tmp_path) -> None:
+        path = tmp_path / "events.jsonl"
+        sink = JsonlFileSink(str(path))
+        diagnostic = DiagnosticLogger("run", sink=sink)
+        diagnostic.log_quality_score("snr_db", np.float64(12.5))
+        diagnostic.log_validation("source", False, ["bad"])
+        diagnostic.finalize()
+        sink.close()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert records[0]["data"] == {"metric": "snr_db", "value": 12.5}
+        assert records[1]["level"] == "WARNING"
+        assert json.loads(diagnostic.diagnostics.to_json())["events"]
+
+    def test_default_sink(self) -> None:
+        sink = MemorySink()
+        previous = set_diagnostic_sink(sink)
+        try:
+            DiagnosticLogger("run").log_event("stage", "tick", {})
+        finally:
+            set_diagnostic_sink(previous)
+
+        assert len(sink.records) == 1
+        assert isinstance(get_diagnostic_sink(), type(previous))
@@ -0,0 +1,140 @@
+import sqlite3
+import threading
+
+import numpy as np
+import pytest
+
+from voico.core.types import (
+    FormantTrack,
+    PitchContour,
+    SpectralFeatures,
+    VoiceProfile,
+)
+from voico.matching.matcher import VoiceMatcher
+from voico.store.profile_index import ProfileFeatureIndex, profile_features
+from voico.store.profile_store import ProfileStore
+from voico.utils.telemetry import get_metrics_registry
+
+
+def _make_profile(f0_mean: float, formant_scale: float = 1.0) -> VoiceProfile:
+    pitch = PitchContour(
+        f0=np.array([f0_mean]),
+        voiced_mask=np.array([True]),
+        f0_mean=f0_mean,
+        f0_std=5.0,
+        harmonic_to_noise_ratio=20.0,
+    )
+    formants = FormantTrack(
+        frequencies=np.zeros((5, 1)),
+        bandwidths=np.zeros((5, 1)),
+        mean_frequencies=formant_scale
+        * np.array([500.0, 1500.0, 2500.0, 3500.0, 4500.0]),
+        mean_bandwidths=np.array([80.0, 100.0, 120.0, 150.0, 200.0]),
+    )
+    return VoiceProfile(
+        pitch=pitch,
+        formants=formants,
+        spectral=SpectralFeatures(np.ones((100, 1)), -1.0),
+        harmonic_ratios=np.array([0.5]),
+        harmonic_energy=np.array([1.0]),
+        sample_rate=44100,
+    )
+
+
+@pytest.fixture
+def store(tmp_path) -> ProfileStore:
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    store.save("low", _make_profile(110.0, 0.9))
+    store.save("mid", _make_profile(160.0, 1.0))
+    store.save("high", _make_profile(240.0, 1.15))
+    return store
+
+
+class TestProfileIndex:
+    def test_nearest_orders_by_distance(self, store: ProfileStore) -> None:
+        matches = store.nearest(_make_profile(150.0, 1.0), k=2)
+
+        assert [m.name for m in matches] == ["mid", "low"]
+        assert matches[0].distance <= matches[1].distance
+
+    def test_shifts_match_voice_matcher(self, store: ProfileStore) -> None:
+        source = _make_profile(150.0, 1.05)
+        for match in store.nearest(source, k=3):
+            pitch, formant = VoiceMatcher.match(source, store.load(match.name))
+            assert match.pitch_shift == pytest.approx(pitch)
+            assert match.formant_shift == pytest.approx(formant)
+
+    def test_index_follows_save_and_delete(self, store: ProfileStore) -> None:
+        other = ProfileStore(store.db_path)
+        assert len(other.nearest(_make_profile(150.0), k=10)) == 3
+
+        store.delete("mid")
+        store.save("alto", _make_profile(200.0, 1.1))
+
+        names = {m.name for m in other.nearest(_make_profile(150.0), k=10)}
+        assert names == {"low", "high", "alto"}
+        excluded = store.nearest(_make_profile(150.0), k=10, exclude=["low"])
+        assert [m.name for m in excluded] == ["alto", "high"]
+
+    def test_backfills_features_for_existing_profiles(
+        self, store: ProfileStore
+    ) -> None:
+        with sqlite3.connect(store.db_path) as conn:
+            conn.execute("DELETE FROM profile_features")
+            conn.commit()
+
+        reopened = ProfileStore(store.db_path)
+        assert len(reopened.nearest(_make_profile(150.0), k=10)) == 3
+
+    def test_feature_index_update_in_place(self) -> None:
+        index = ProfileFeatureIndex()
+        index.add("a", profile_features(_make_profile(100.0)))
+        index.add("b", profile_features(_make_profile(200.0)))
+        index.add("a", profile_features(_make_profile(300.0)))
+
+        assert index.names == ["a", "b"]
+        nearest = index.query(profile_features(_make_profile(290.0)), k=1)
+        assert nearest[0].name == "a"
+        assert index.remove("a")
+        assert "a" not in index
+        assert len(index) == 1
+
+    def test_nearest_during_concurrent_writes(
+        self, store: ProfileStore
+    ) -> None:
+        errors = []
+        done = threading.Event()
+
+        def read() -> None:
+            try:
+                while not done.is_set():
+                    store.nearest(_make_profile(150.0), k=3, exclude=["low"])
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(3)]
+        for reader in readers:
+            reader.start()
+        try:
+            for i in range(30):
+                store.save(f"extra{i % 3}", _make_profile(120.0 + i, 1.0))
+                store.delete(f"extra{(i + 1) % 3}")
+        finally:
+            done.set()
+            for reader in readers:
+                reader.join()
+
+        assert errors == []
+
+    def test_operations_record_latency(self, store: ProfileStore) -> None:
+        histogram = get_metrics_registry().histogram(
+            "voico_profile_store_seconds", "", ("operation",)
+        )
+        before = histogram.count(operation="nearest")
+
+        store.nearest(_make_profile(150.0), k=1)
+        store.load("mid")
+
+        assert histogram.count(operation="nearest") == before + 1
+        text = get_metrics_registry().render()
+        assert 'voico_profile_store_seconds_count{operation="load"}' in text
@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 
@@ -13,6 +14,14 @@ from voico.utils.audio_io import (
 )
 from voico.utils.decorators import timer
 from voico.utils.math_utils import safe_divide
+from voico.utils.telemetry import MetricFamily, MetricsRegistry, Sample
+from voico.utils.tracing import (
+    get_tracer,
+    run_traced,
+    span,
+    traced,
+    tracing,
+)
 
 
 class TestSafeDivide:
@@ -62,6 +71,111 @@ class TestTimer:
             pass
 
 
+class TestTracing:
+    def test_disabled_spans_are_noops(self) -> None:
+        assert get_tracer() is None
+        with span("idle"):
+            pass
+
+        @traced()
+        def double(x: int) -> int:
+            return 2 * x
+
+        assert double(3) == 6
+
+    def test_nested_spans_export_chrome_events(self, tmp_path) -> None:
+        path = str(tmp_path / "trace.json")
+
+        @traced("inner", "test")
+        def inner() -> None:
+            pass
+
+        with tracing(path):
+            with span("outer", "test", item=1):
+                inner()
+        assert get_tracer() is None
+
+        with open(path, encoding="utf-8") as f:
+            trace = json.load(f)
+        spans = {
+            e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"
+        }
+        outer, nested = spans["outer"], spans["inner"]
+        assert outer["args"] == {"item": 1}
+        assert outer["pid"] == os.getpid()
+        assert nested["tid"] == outer["tid"]
+        assert outer["ts"] <= nested["ts"]
+        assert nested["ts"] + nested["dur"] <= outer["ts"] + outer["dur"]
+        assert any(e["name"] == "thread_name" for e in trace["traceEvents"])
+
+    def test_run_traced_returns_worker_events(self) -> None:
+        @traced("work")
+        def work(x: int) -> int:
+            return x + 1
+
+        result, events = run_traced(work, 1)
+
+        assert result == 2
+        assert [e["name"] for e in events if e["ph"] == "X"] == ["work"]
+        assert get_tracer() is None
+
+
+class TestMetricsRegistry:
+    def test_counter_and_gauge_exposition(self) -> None:
+        registry = MetricsRegistry()
+        requests = registry.counter("app_requests", "Requests.", ("path",))
+        requests.inc(path="/a")
+        requests.inc(2, path='/b"c')
+        depth = registry.gauge("app_depth", "Queue depth.")
+        with depth.track():
+            assert depth.value() == 1
+        depth.set(3)
+
+        text = registry.render()
+
+        assert "# TYPE app_requests counter" in text
+        assert 'app_requests_total{path="/a"} 1.0' in text
+        assert 'app_requests_total{path="/b\\"c"} 2.0' in text
+        assert "app_depth 3" in text
+        assert registry.counter("app_requests", "Requests.", ("path",)) is requests
+        with pytest.raises(ValueError):
+            registry.gauge("app_requests", "Requests.")
+        with pytest.raises(ValueError):
+            requests.inc(status="200")
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        registry = MetricsRegistry()
+        latency = registry.histogram(
+            "app_seconds", "Latency.", ("op",), buckets=(0.1, 1.0)
+        )
+        for value in (0.05, 0.1, 0.5, 5.0):
+            latency.observe(value, op="read")
+
+        text = registry.render()
+
+        assert 'app_seconds_bucket{op="read",le="0.1"} 2' in text
+        assert 'app_seconds_bucket{op="read",le="1.0"} 3' in text
+        assert 'app_seconds_bucket{op="read",le="+Inf"} 4' in text
+        assert 'app_seconds_sum{op="read"} 5.65' in text
+        assert 'app_seconds_count{op="read"} 4' in text
+        assert latency.count(op="read") == 4
+
+    def test_collectors_render_on_scrape(self) -> None:
+        registry = MetricsRegistry()
+        calls = []
+
+        def collect():
+            calls.append(1)
+            return [
+                MetricFamily("app_ratio", "gauge", "Ratio.", [Sample("", {}, 0.5)])
+            ]
+
+        registry.register_collector(collect)
+        registry.register_collector(collect)
+        assert "app_ratio 0.5" in registry.render()
+        assert calls == [1]
+
+
 class TestAudioIO:
     def test_normalize_audio_peak(self) -> None:
         audio = np.array([0.5, -0.5, 0.25], dtype=np.float32)